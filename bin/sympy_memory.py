@@ -0,0 +1,96 @@
+#! /usr/bin/env python
+
+"""
+Program to measure memory used by SymPy objects, in bytes per node.
+
+Many distinct atoms (Integers, Rationals, Symbols) and expression trees built
+out of them are created, and the memory reachable from them is summed up. Data
+shared between objects (e.g. class default assumptions) is counted only once,
+so it gets amortized over all the nodes.
+
+Requires Python 2.6 or newer (sys.getsizeof).
+"""
+
+import os
+import sys
+
+bin_dir    = os.path.abspath(os.path.dirname(__file__))
+sympy_top  = os.path.split(bin_dir)[0]
+sympy_dir  = os.path.join(sympy_top, 'sympy')
+if os.path.isdir(sympy_dir):
+    sys.path.insert(0, sympy_top)
+
+from sympy import Integer, Rational, Symbol, Add, Mul
+from sympy.core.basic import Basic
+
+N = 20000
+
+def slot_values(obj):
+    """Yields values of all slots of obj (which are set). """
+    for cls in type(obj).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            if name == '__weakref__':
+                continue
+            try:
+                yield getattr(obj, name)
+            except AttributeError:
+                pass
+
+def total_size(objects):
+    """Returns number of bytes reachable from objects (without classes). """
+    seen = set()
+    stack = list(objects)
+    size = 0
+
+    while stack:
+        obj = stack.pop()
+
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, Basic):
+            stack.extend(slot_values(obj))
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+
+    return size
+
+def nodes(objects):
+    """Returns number of distinct SymPy objects in trees of objects. """
+    seen = set()
+    stack = list(objects)
+
+    while stack:
+        obj = stack.pop()
+
+        if id(obj) not in seen:
+            seen.add(id(obj))
+            stack.extend(obj.args)
+
+    return len(seen)
+
+def report(title, objects):
+    # make sure hashes are cached, as they are in real-world use
+    for obj in objects:
+        hash(obj)
+
+    n = nodes(objects)
+    print "%-30s %8i nodes  %6.1f bytes/node" % (title, n, float(total_size(objects))/n)
+
+def main():
+    report("Integer", [ Integer(10**6 + i) for i in xrange(N) ])
+    report("Rational", [ Rational(1, 10**6 + i) for i in xrange(N) ])
+    report("Symbol", [ Symbol('x%i' % i) for i in xrange(N) ])
+    report("Symbol(positive=True)", [ Symbol('y%i' % i, positive=True) for i in xrange(N) ])
+
+    x = Symbol('x')
+    report("Add(Mul, Integer)", [ Add(Mul(Integer(10**6 + i), x), Integer(i)) for i in xrange(N) ])
+
+if __name__ == '__main__':
+    main()
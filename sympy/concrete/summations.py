@@ -53,6 +53,9 @@ def __new__(cls, f, *symbols, **assumptions):
 
         return obj
 
+    def __getnewargs__(self):
+        return (self.function,) + self.limits
+
     @property
     def function(self):
         return self._args[0]
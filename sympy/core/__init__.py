@@ -20,3 +20,6 @@
 # expose singletons like exp, log, oo, I, etc.
 for _n, _cls in Basic.singleton.items():
     exec '%s = _cls()' % (_n)
+
+# enable interning if requested by SYMPY_USE_INTERNING
+import interning as _interning
@@ -1,5 +1,6 @@
 from basic import Basic, S, C
 from operations import AssocOp
+from sympify import _sympify
 from cache import cacheit
 from symbol import Symbol
 
@@ -17,145 +18,28 @@ def flatten(cls, seq):
         Returns: (commutative_part, noncommutative_part, order_symbols)
 
         Applies associativity, all terms are commutable with respect to
-        addition.
+        addition. See AddAccumulator.
         """
-        terms = {}      # term -> coeff
-                        # e.g. x**2 -> 5   for ... + 5*x**2 + ...
+        terms = AddAccumulator()
+        terms._extend(seq)
+        return terms.as_args()
 
-        coeff = S.Zero  # standalone term
-                        # e.g. 3 + ...
-        order_factors = []
-
-        for o in seq:
-
-            # O(x)
-            if o.is_Order:
-                for o1 in order_factors:
-                    if o1.contains(o):
-                        o = None
-                        break
-                if o is None:
-                    continue
-                order_factors = [o]+[o1 for o1 in order_factors if not o.contains(o1)]
-                continue
-
-            # 3
-            elif o.is_Number:
-                coeff += o
-                continue
-
-            # Add([...])
-            elif o.is_Add:
-                # NB: here we assume Add is always commutative
-                seq.extend(o.args)  # TODO zerocopy?
-                continue
-
-            # Mul([...])
-            elif o.is_Mul:
-                c = o.args[0]
-
-                # 3*...
-                if c.is_Number:
-                    if c is S.One:
-                        s = o
-                    else:
-                        s = o.as_two_terms()[1]
-
-                else:
-                    c = S.One
-                    s = o
-
-            # everything else
-            else:
-                c = S.One
-                s = o
-
-
-            # now we have:
-            # o = c*s, where
-            #
-            # c is a Number
-            # s is an expression with number factor extracted
-
-            # let's collect terms with the same s, so e.g.
-            # 2*x**2 + 3*x**2  ->  5*x**2
-            if s in terms:
-                terms[s] += c
-            else:
-                terms[s] = c
-
-
-        # now let's construct new args:
-        # [2*x**2, x**3, 7*x**4, pi, ...]
-        newseq = []
-        noncommutative = False
-        for s,c in terms.items():
-            # 0*s
-            if c is S.Zero:
-                continue
-            # 1*s
-            elif c is S.One:
-                newseq.append(s)
-            # c*s
-            else:
-                if s.is_Mul:
-                    # Mul, already keeps it's arguments in perfect order.
-                    # so we can simply put c in slot0 and go the fast way.
-                    cs = s._new_rawargs(*((c,) + s.args))
-                    newseq.append(cs)
-
-                else:
-                    # alternatively we have to call all Mul's machinery (slow)
-                    newseq.append(Mul(c,s))
-
-            noncommutative = noncommutative or not s.is_commutative
-
-        # nan
-        if coeff is S.NaN:
-            # we know for sure the result will be nan
-            return [S.NaN], [], None
-
-        # oo, -oo
-        elif (coeff is S.Infinity) or (coeff is S.NegativeInfinity):
-            newseq = [f for f in newseq if not f.is_real]
-
-
-        # process O(x)
-        if order_factors:
-            newseq2 = []
-            for t in newseq:
-                for o in order_factors:
-                    # x + O(x) -> O(x)
-                    if o.contains(t):
-                        t = None
-                        break
-                # x + O(x**2) -> x + O(x**2)
-                if t is not None:
-                    newseq2.append(t)
-            newseq = newseq2 + order_factors
-            # 1 + O(1) -> O(1)
-            for o in order_factors:
-                if o.contains(coeff):
-                    coeff = S.Zero
-                    break
-
-
-        # order args canonically
-        # Currently we sort things using hashes, as it is quite fast. A better
-        # solution is not to sort things at all - but this needs some more
-        # fixing.
-        newseq.sort(key=hash)
+    @classmethod
+    def fromiter(cls, args):
+        """Create Add from an iterable of terms (e.g. a generator)
 
-        # current code expects coeff to be always in slot-0
-        if coeff is not S.Zero:
-            newseq.insert(0, coeff)
+           The terms are collected one by one, in linear time, and the result
+           is not cached.
 
-        # we are done
-        if noncommutative:
-            return [], newseq, None
-        else:
-            return newseq, [], None
+           >>> from sympy import Add, Symbol
+           >>> x = Symbol('x')
+           >>> Add.fromiter(i*x**i for i in range(4))
+           x + 2*x**2 + 3*x**3
 
+        """
+        terms = AddAccumulator()
+        terms.extend(args)
+        return terms.as_expr()
 
     @cacheit
     def as_coeff_factors(self, x=None):
@@ -487,3 +371,206 @@ def _sage_(self):
 
 from mul import Mul
 from function import FunctionClass
+
+
+class AddAccumulator(object):
+    """Collects terms of a sum
+
+       Terms which differ only by a number factor are merged (2*x + 3*x ->
+       5*x), nested Adds are absorbed term by term. This is the engine of
+       Add.flatten, but it can also be used to build a large sum incrementally,
+       in linear time, which is not possible with repeated `+`:
+
+       >>> from sympy import Symbol
+       >>> from sympy.core.add import AddAccumulator
+       >>> x, y = Symbol('x'), Symbol('y')
+       >>> acc = AddAccumulator()
+       >>> acc.append(x)
+       >>> acc.extend([2*x, y, 3])
+       >>> acc.as_expr()
+       3 + y + 3*x
+
+    """
+
+    __slots__ = ['coeff', 'terms', 'orig', 'order_factors']
+
+    def __init__(self):
+        self.coeff = S.Zero     # standalone term
+                                # e.g. 3 + ...
+
+        self.terms = {}         # term -> coeff
+                                # e.g. x**2 -> 5   for ... + 5*x**2 + ...
+
+        self.orig = {}          # term -> original object, i.e. coeff*term,
+                                # (or None if coeff was changed since), so that
+                                # it doesn't have to be rebuilt
+
+        self.order_factors = []
+
+    def append(self, o):
+        """Add one term. """
+        self._extend((_sympify(o),))
+
+    def extend(self, seq):
+        """Add all terms from iterable seq. """
+        self._extend([ _sympify(o) for o in seq ])
+
+    def _extend(self, seq):
+        terms = self.terms
+        orig = self.orig
+        coeff = self.coeff
+
+        for o in seq:
+
+            # O(x)
+            if o.is_Order:
+                order_factors = self.order_factors
+                for o1 in order_factors:
+                    if o1.contains(o):
+                        o = None
+                        break
+                if o is None:
+                    continue
+                self.order_factors = [o]+[o1 for o1 in order_factors if not o.contains(o1)]
+                continue
+
+            # 3
+            elif o.is_Number:
+                coeff += o
+                continue
+
+            # Add([...])
+            elif o.is_Add:
+                # NB: here we assume Add is always commutative
+                # args of Add are never Adds, so we don't have to recurse
+                self.coeff = coeff
+                self._extend(o.args)
+                coeff = self.coeff
+                continue
+
+            # Mul([...])
+            elif o.is_Mul:
+                c = o.args[0]
+
+                # 3*...
+                if c.is_Number:
+                    if c is S.One:
+                        s = o
+                    else:
+                        s = o.as_two_terms()[1]
+
+                else:
+                    c = S.One
+                    s = o
+
+            # everything else
+            else:
+                c = S.One
+                s = o
+
+
+            # now we have:
+            # o = c*s, where
+            #
+            # c is a Number
+            # s is an expression with number factor extracted
+
+            # let's collect terms with the same s, so e.g.
+            # 2*x**2 + 3*x**2  ->  5*x**2
+            if s in terms:
+                terms[s] += c
+                orig[s] = None
+            else:
+                terms[s] = c
+                orig[s] = o
+
+        self.coeff = coeff
+
+    def as_args(self):
+        """Returns (commutative_part, noncommutative_part, order_symbols)
+           as Add.flatten does.
+        """
+        coeff = self.coeff
+        orig = self.orig
+        order_factors = self.order_factors
+
+        # now let's construct new args:
+        # [2*x**2, x**3, 7*x**4, pi, ...]
+        newseq = []
+        noncommutative = False
+        for s,c in self.terms.iteritems():
+            # 0*s
+            if c is S.Zero:
+                continue
+
+            o = orig[s]
+
+            # c*s is already at hand
+            if o is not None:
+                newseq.append(o)
+            # 1*s
+            elif c is S.One:
+                newseq.append(s)
+            # c*s
+            else:
+                if s.is_Mul:
+                    # Mul, already keeps it's arguments in perfect order.
+                    # so we can simply put c in slot0 and go the fast way.
+                    cs = s._new_rawargs(*((c,) + s.args))
+                    newseq.append(cs)
+
+                else:
+                    # alternatively we have to call all Mul's machinery (slow)
+                    newseq.append(Mul(c,s))
+
+            noncommutative = noncommutative or not s.is_commutative
+
+        # nan
+        if coeff is S.NaN:
+            # we know for sure the result will be nan
+            return [S.NaN], [], None
+
+        # oo, -oo
+        elif (coeff is S.Infinity) or (coeff is S.NegativeInfinity):
+            newseq = [f for f in newseq if not f.is_real]
+
+
+        # process O(x)
+        if order_factors:
+            newseq2 = []
+            for t in newseq:
+                for o in order_factors:
+                    # x + O(x) -> O(x)
+                    if o.contains(t):
+                        t = None
+                        break
+                # x + O(x**2) -> x + O(x**2)
+                if t is not None:
+                    newseq2.append(t)
+            newseq = newseq2 + order_factors
+            # 1 + O(1) -> O(1)
+            for o in order_factors:
+                if o.contains(coeff):
+                    coeff = S.Zero
+                    break
+
+
+        # order args canonically
+        # Currently we sort things using hashes, as it is quite fast. A better
+        # solution is not to sort things at all - but this needs some more
+        # fixing.
+        newseq.sort(key=hash)
+
+        # current code expects coeff to be always in slot-0
+        if coeff is not S.Zero:
+            newseq.insert(0, coeff)
+
+        # we are done
+        if noncommutative:
+            return [], newseq, None
+        else:
+            return newseq, [], None
+
+    def as_expr(self):
+        """Returns the sum of all collected terms. """
+        return Add._from_flattened(*self.as_args())
@@ -8,6 +8,23 @@ class CycleDetected(Exception):
     pass
 
 
+# already-seen requests as (id(obj), fact) (when deducing through prerequisites
+# -- see CycleDetected). They are kept here, so that objects don't have to carry
+# a list of their own.
+_a_inprogress = set()
+
+
+class SharedFacts(dict):
+    """(internal) fully deduced facts shared between objects
+
+       Class default assumptions and facts deduced from construction-time
+       assumptions are shared between all objects with the same premises.
+       Objects copy shared facts before learning anything new about
+       themselves (copy-on-write).
+    """
+    __slots__ = []
+
+
 class AssumeMeths(object):
     """ Define default assumption methods.
 
@@ -71,8 +88,6 @@ class AssumeMeths(object):
     """
 
     __slots__ = ['_assumptions',    # assumptions
-                 '_a_inprogress',   # already-seen requests (when deducing
-                                    # through prerequisites -- see CycleDetected)
                 ]
 
 
@@ -170,6 +185,8 @@ def __getstate__(self, cls=None):
 
         # Get all information that should be stored from cls and return the dic
         for name in cls.__slots__:
+            if name == '__weakref__':
+                continue
             if hasattr(self, name):
                 d[name] = getattr(self, name)
         return d
@@ -241,16 +258,19 @@ def _what_known_about(self, k):
 
         assumptions = self._assumptions
 
-        seen = self._a_inprogress
+        seen = _a_inprogress
+        oid = id(self)
         #print '%s=?\t%s %s' % (name, self,seen)
-        if k in seen:
+        if (oid, k) in seen:
             raise CycleDetected
 
-        seen.append(k)
+        seen.add((oid, k))
 
         try:
+            evaluable = self._assume_evaluable
+
             # First try the assumption evaluation function if it exists
-            if hasattr(self, '_eval_is_'+k):
+            if k in evaluable:
                 #print 'FWDREQ: %s\t%s' % (self, k)
                 try:
                     a = getattr(self,'_eval_is_'+k)()
@@ -270,9 +290,9 @@ def _what_known_about(self, k):
             # Try assumption's prerequisites
             for pk in self._assume_rules.prereq.get(k,()):
                 #print 'pk: %s' % pk
-                if hasattr(self, '_eval_is_'+pk):
+                if pk in evaluable:
                     # cycle
-                    if pk in seen:
+                    if (oid, pk) in seen:
                         continue
 
                     #print 'PREREQ: %s\t%s <- %s' % (self, k, pk)
@@ -287,7 +307,7 @@ def _what_known_about(self, k):
                         except KeyError:
                             pass
         finally:
-            seen.pop()
+            seen.remove((oid, k))
 
 
         # For positive/negative try to ask evalf
@@ -326,12 +346,11 @@ def _learn_new_facts(self, facts):
         if not facts:
             return
 
-        default_assumptions = type(self).default_assumptions
         base = self._assumptions
 
-        # ._assumptions were shared with the class
-        if base is default_assumptions:
-            base = base.copy()
+        # ._assumptions were shared with the class or other objects
+        if type(base) is SharedFacts:
+            base = dict(base)
             self._assumptions = base
             self._assume_rules.deduce_all_facts(facts, base)
 
@@ -340,6 +359,44 @@ def _learn_new_facts(self, facts):
             self._assume_rules.deduce_all_facts(facts, base)
 
 
+# (class, premises) -> (SharedFacts, type keys)
+_premises_cache = {}
+
+def deduce_premises(cls, premises):
+    """Deduce all facts following from construction-time assumptions
+
+       Returns fully deduced facts (to be shared between objects of class
+       `cls` created with the same `premises`) and the set of fact names
+       which are not known from class default assumptions (type keys, see
+       Basic.assumptions0).
+
+       The result is computed once per (cls, premises) and then cached, so
+       creating e.g. Symbol('x', positive=True) does not run the deduction
+       engine at all. Everything else is deduced lazily, on first .is_<fact>
+       access.
+    """
+    try:
+        key = (cls, frozenset(premises.iteritems()))
+        return _premises_cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        key = None  # unhashable values -- don't cache
+
+    default_assumptions = cls.default_assumptions
+
+    facts = AssumeMeths._assume_rules.deduce_all_facts(premises,
+            dict(default_assumptions))
+
+    type_keys = frozenset([ k for k in facts if k not in default_assumptions ])
+    result = (SharedFacts(facts), type_keys)
+
+    if key is not None:
+        _premises_cache[key] = result
+
+    return result
+
+
 def make__get_assumption(classname, name):
     """Cooks function which will get named assumption
 
@@ -3,7 +3,8 @@
 import sympy.mpmath as mpmath
 
 from decorators import _sympifyit
-from assumptions import AssumeMeths, make__get_assumption
+from assumptions import AssumeMeths, SharedFacts, deduce_premises, \
+        make__get_assumption
 from cache import cacheit
 
 # used for canonical ordering of symbolic sequences
@@ -130,7 +131,11 @@ def __init__(cls, *args, **kws):
         # and store completed set into cls -- this way we'll avoid rededucing
         # extensions of class default assumptions each time on instance
         # creation -- we keep it prededuced already.
-        cls.default_assumptions = xass
+        cls.default_assumptions = SharedFacts(xass)
+
+        # facts for which cls has _eval_is_<fact> methods
+        cls._assume_evaluable = frozenset([ k for k in
+            AssumeMeths._assume_defined if hasattr(cls, '_eval_is_'+k) ])
 
         #print '\t(%2i)  %s' % (len(default_assumptions), default_assumptions)
         #print '\t(%2i)  %s' % (len(xass), xass)
@@ -227,6 +232,165 @@ def __gt__(cls, other):
         return False
 
 
+def _walk(expr, rawargs=False):
+    """Iterates over all distinct subexpressions of expr, in preorder.
+
+       An explicit stack is used instead of recursion, so that arbitrarily
+       deep expressions can be walked. Shared subtrees (the same object
+       appearing in several places) are visited only once, so walking a
+       DAG takes time linear in the number of unique nodes. Tuples and
+       lists found among arguments are walked through, but not yielded.
+
+       Arguments are obtained with iter_basic_args(), or taken from .args
+       directly if rawargs is True.
+
+       The walk stops as soon as the consumer stops iterating, so e.g.
+       searches can exit early.
+    """
+    seen = set()
+    stack = [expr]
+
+    while stack:
+        expr = stack.pop()
+
+        if id(expr) in seen:
+            continue
+        seen.add(id(expr))
+
+        if isinstance(expr, Basic):
+            yield expr
+
+            if rawargs:
+                args = list(expr.args)
+            else:
+                args = list(expr.iter_basic_args())
+        elif isinstance(expr, (tuple, list)):
+            args = list(expr)
+        else:
+            continue
+
+        args.reverse()
+        stack.extend(args)
+
+
+# Structural fingerprints.
+#
+# Unlike __hash__, a fingerprint is consistent with __eq__: if a == b, then
+# their fingerprints are equal, so different fingerprints allow to reject
+# equality without comparing the trees. To achieve this, assumptions are
+# not taken into account, all numbers share one fingerprint (because e.g.
+# Integer(2) == Real(2.0)) and classes which redefine __eq__ have no
+# fingerprint at all (this is denoted by -1, which is never a hash value).
+
+_NUMBER_FINGERPRINT = hash('Number')
+
+_structural_eq = {}     # class -> True if it uses Basic.__eq__ and __ne__
+
+def _fingerprint(expr, memo=None):
+    """Returns structural fingerprint of expr, computing it if needed.
+
+       Fingerprints of subexpressions are computed bottom-up, using an
+       explicit stack, so that deep expressions don't exhaust recursion.
+       They are stored only by classes with a _fprint slot (compound nodes
+       like Add, Mul and Pow), other objects, most notably atoms, are
+       fingerprinted on demand, which is cheap and keeps them small.
+
+       Fingerprints of nodes without a _fprint slot (e.g. functions) are
+       kept in memo, a dict keyed by id(), for the duration of the call,
+       so that chains of such nodes are fingerprinted in linear time.
+    """
+    fp = getattr(expr, '_fprint', None)
+
+    if fp is not None:
+        return fp
+
+    if memo is None:
+        memo = {}
+    elif id(expr) in memo:
+        return memo[id(expr)]
+
+    stack = [(expr, False)]
+
+    while stack:
+        node, ready = stack.pop()
+
+        if ready:
+            fp = _fingerprint_node(node, memo)
+
+            if node._stores_fprint:
+                node._fprint = fp
+            else:
+                memo[id(node)] = fp
+        elif getattr(node, '_fprint', None) is None and id(node) not in memo:
+            stack.append((node, True))
+
+            if _is_structural(node):
+                items = list(node._hashable_content())
+
+                while items:
+                    item = items.pop()
+
+                    if isinstance(item, Basic):
+                        if item._args and id(item) not in memo and \
+                                getattr(item, '_fprint', None) is None:
+                            stack.append((item, False))
+                    elif isinstance(item, tuple):
+                        items.extend(item)
+
+    return fp
+
+def _is_structural(expr):
+    """Returns True if expr is compared by its structure only. """
+    if expr.is_Number or expr.is_NumberSymbol:
+        return False
+
+    cls = type(expr)
+
+    try:
+        return _structural_eq[cls]
+    except KeyError:
+        structural = cls.__eq__.im_func is Basic.__eq__.im_func and \
+                     cls.__ne__.im_func is Basic.__ne__.im_func
+        _structural_eq[cls] = structural
+        return structural
+
+def _fingerprint_node(expr, memo):
+    """Computes fingerprint of expr, given fingerprints of its content. """
+    if expr.is_Number or expr.is_NumberSymbol:
+        return _NUMBER_FINGERPRINT
+    elif _is_structural(expr):
+        return _fingerprint_content((type(expr).__name__,) + expr._hashable_content(), memo)
+    else:
+        return -1
+
+def _fingerprint_content(item, memo):
+    """Returns fingerprint of an item of _hashable_content(). """
+    if isinstance(item, Basic):
+        return _fingerprint(item, memo)
+    elif isinstance(item, (int, long, float, complex)):
+        return _NUMBER_FINGERPRINT
+    elif isinstance(item, tuple):
+        fps = []
+
+        for i in item:
+            fp = _fingerprint_content(i, memo)
+
+            if fp == -1:
+                return -1
+
+            fps.append(fp)
+
+        fp = hash(tuple(fps))
+    else:
+        try:
+            fp = hash(item)
+        except TypeError:
+            return -1
+
+    if fp == -1:
+        fp = -2
+
+    return fp
 
 
 class Basic(AssumeMeths):
@@ -269,8 +433,12 @@ class Basic(AssumeMeths):
     __slots__ = ['_mhash',              # hash value
                  '_args',               # arguments
                  '_assume_type_keys',   # assumptions typeinfo keys
+                 '__weakref__',         # see sympy.core.interning
                 ]
 
+    # True in classes with a _fprint slot, see _fingerprint()
+    _stores_fprint = False
+
     # To be overridden with True in the appropriate subclasses
     is_Atom = False
     is_Symbol = False
@@ -297,28 +465,18 @@ def __new__(cls, *args, **assumptions):
 
         # initially assumptions are shared between instances and class
         obj._assumptions  = cls.default_assumptions
-        obj._a_inprogress = []
 
-        # NOTE this could be made lazy -- probably not all instances will need
-        # fully derived assumptions?
+        # objects with the same premises share deduced facts, so there is
+        # nothing to deduce here -- see deduce_premises
         if assumptions:
-            obj._learn_new_facts(assumptions)
-            #                      ^
-            # FIXME this is slow   |    another NOTE: speeding this up is *not*
-            #        |             |    important. say for %timeit x+y most of
-            # .------'             |    the time is spent elsewhere
-            # |                    |
-            # |  XXX _learn_new_facts  could be asked about what *new* facts have
-            # v  XXX been learned -- we'll need this to append to _hashable_content
-            basek = set(cls.default_assumptions.keys())
-            k2    = set(obj._assumptions.keys())
-            newk  = k2.difference(basek)
-
-            obj._assume_type_keys = frozenset(newk)
+            obj._assumptions, obj._assume_type_keys = \
+                    deduce_premises(cls, assumptions)
         else:
             obj._assume_type_keys = None
 
         obj._mhash = None # will be set by __hash__ method.
+        if cls._stores_fprint:
+            obj._fprint = None # will be set by _fingerprint function.
         obj._args = args  # all items in args must be Basic objects
         return obj
 
@@ -500,6 +658,8 @@ def compare(self, other):
         c = cmp(len(st),len(ot))
         if c: return c
         for l,r in zip(st,ot):
+            if l is r:
+                continue
             if isinstance(l, Basic):
                 c = l.compare(r)
             else:
@@ -589,6 +749,8 @@ def __eq__(self, other):
 
            but faster
         """
+        if self is other:
+            return True
 
         if type(self) is not type(other):
             try:
@@ -600,6 +762,15 @@ def __eq__(self, other):
                 return False
 
         # type(self) == type(other)
+
+        # fast rejection: different fingerprints mean different trees
+        # (atoms are compared directly, just as cheaply)
+        if self._args:
+            sf = getattr(self, '_fprint', None) or _fingerprint(self)
+            of = getattr(other, '_fprint', None) or _fingerprint(other)
+            if sf != of and sf != -1 and of != -1:
+                return False
+
         st = self._hashable_content()
         ot = other._hashable_content()
 
@@ -614,6 +785,8 @@ def __ne__(self, other):
 
            but faster
         """
+        if self is other:
+            return False
 
         if type(self) is not type(other):
             try:
@@ -625,6 +798,14 @@ def __ne__(self, other):
                 return True
 
         # type(self) == type(other)
+
+        # fast rejection, see __eq__
+        if self._args:
+            sf = getattr(self, '_fprint', None) or _fingerprint(self)
+            of = getattr(other, '_fprint', None) or _fingerprint(other)
+            if sf != of and sf != -1 and of != -1:
+                return True
+
         st = self._hashable_content()
         ot = other._hashable_content()
 
@@ -777,31 +958,37 @@ def atoms(self, *types):
         """
 
 
-        def _atoms(expr, typ):
-            """Helper function for recursively denesting atoms"""
+        if not types:
+            return set([ expr for expr in _walk(self) if expr.is_Atom ])
+
+        try:
+            types = tuple(types)
+            isinstance(self, types)
+        except TypeError:
+            #if type is in implicit form
+            types = tuple(map(type, types))
+
+        result = set()
+        stack = [self]
+        seen = set()
+
+        # like _walk(), but doesn't descend into matching objects
+        while stack:
+            expr = stack.pop()
+
+            if id(expr) in seen:
+                continue
+            seen.add(id(expr))
+
             if isinstance(expr, Basic):
-                if expr.is_Atom and len(typ) == 0: # if we haven't specified types
-                    return [expr]
+                if isinstance(expr, types):
+                    result.add(expr)
                 else:
-                    try:
-                        if isinstance(expr, typ): return [expr]
-                    except TypeError:
-                        #if type is in implicit form
-                        if isinstance(expr, tuple(map(type, typ))): return [expr]
-            result = []
-            #search for a suitable iterator
-            if isinstance(expr, Basic):
-                iter = expr.iter_basic_args()
+                    stack.extend(expr.iter_basic_args())
             elif isinstance(expr, (tuple, list)):
-                iter = expr.__iter__()
-            else:
-                iter = []
+                stack.extend(expr)
 
-            for obj in iter:
-                result.extend(_atoms(obj, typ))
-            return result
-
-        return set(_atoms(self, typ=types))
+        return result
 
     def is_hypergeometric(self, k):
         from sympy.simplify import hypersimp
@@ -998,7 +1185,7 @@ def as_basic(self):
         """
         return self
 
-    def subs(self, *args):
+    def subs(self, *args, **kwargs):
         """
         Substitutes an expression.
 
@@ -1016,11 +1203,17 @@ def subs(self, *args):
         >>> (1+x*y).subs([(x,pi), (y,2)])
         1 + 2*pi
 
+        With simultaneous=True all substitutions in a dictionary are done
+        at once (see _subs_simultaneous), so they don't affect each other:
+
+        >>> (x*y**2).subs({x:y, y:x}, simultaneous=True)
+        y*x**2
+
         """
         if len(args) == 1:
             sequence = args[0]
             if isinstance(sequence, dict):
-                return self._subs_dict(sequence)
+                return self._subs_dict(sequence, **kwargs)
             elif isinstance(sequence, (list, tuple)):
                 return self._subs_list(sequence)
             else:
@@ -1066,7 +1259,7 @@ def _subs_list(self, sequence):
                 result = result.subs(old, new)
         return result
 
-    def _subs_dict(self, sequence):
+    def _subs_dict(self, sequence, simultaneous=False):
         """Performs sequential substitution.
 
            Given a collection of key, value pairs, which correspond to
@@ -1100,6 +1293,9 @@ def _subs_dict(self, sequence):
         elif not isinstance(sequence, (list, tuple)):
             raise TypeError("Not an iterable container")
 
+        if simultaneous:
+            return self._subs_simultaneous(sequence)
+
         subst = []
 
         for pattern in sequence:
@@ -1112,6 +1308,117 @@ def _subs_dict(self, sequence):
         subst.reverse()
         return self._subs_list(subst)
 
+    def _subs_simultaneous(self, sequence):
+        """Performs simultaneous substitution in a single pass.
+
+           Given a collection of key, value pairs, which correspond to
+           old and new expressions respectively, replaces all subtrees
+           equal to keys at once, so values are not substituted into
+           again. The expression is traversed only once, only subtrees
+           which changed are rebuilt and repeated subtrees are handled
+           only once, so the cost doesn't depend on the number of pairs.
+
+           Symbols are substituted everywhere, like with subs(old, new),
+           but other keys have to match subtrees exactly, e.g. x + y
+           won't be replaced in x + y + z.
+
+           >>> from sympy import *
+           >>> x, y, z = symbols('xyz')
+
+           >>> (x + 2*y)._subs_simultaneous([(x, y), (y, z)])
+           y + 2*z
+           >>> (sin(x + y) + x + y)._subs_simultaneous([(x + y, z)])
+           x + y + sin(z)
+
+        """
+        if isinstance(sequence, dict):
+            sequence = sequence.items()
+
+        mapping = {}
+
+        for old, new in sequence:
+            mapping[sympify(old)] = sympify(new)
+
+        symbols = set([ old for old in mapping if old.is_Symbol ])
+
+        structural = (Add._eval_subs.im_func, Mul._eval_subs.im_func,
+            Pow._eval_subs.im_func, C.Function._eval_subs.im_func,
+            C.exp._eval_subs.im_func)
+
+        def delegate(expr):
+            # substitute using temporary dummies, so that subtrees
+            # which handle substitution on their own, e.g. integrals,
+            # see substitutions in the same way
+            atoms, pairs = expr.atoms(Symbol), []
+
+            for old, new in mapping.iteritems():
+                if old.is_Symbol:
+                    if old in atoms:
+                        pairs.append((old, new))
+                elif old in expr:
+                    pairs.append((old, new))
+
+            dummies = [ (C.Dummy('x'), new) for _, new in pairs ]
+
+            for (old, _), (dummy, _) in zip(pairs, dummies):
+                expr = expr._subs_old_new(old, dummy)
+
+            for dummy, new in dummies:
+                expr = expr._subs_old_new(dummy, new)
+
+            return expr
+
+        cache = {}
+
+        def rec(expr):
+            if expr in mapping:
+                return mapping[expr]
+
+            args = expr.args
+
+            if not args:
+                return expr
+
+            try:
+                return cache[expr]
+            except KeyError:
+                pass
+
+            method = type(expr)._eval_subs.im_func
+
+            if method is Basic._eval_subs.im_func:
+                result = expr
+            elif method in structural:
+                changed, new_args = False, []
+
+                for arg in args:
+                    if isinstance(arg, Basic):
+                        new_arg = rec(arg)
+
+                        if new_arg is not arg:
+                            changed = True
+                    else:
+                        new_arg = arg
+
+                    new_args.append(new_arg)
+
+                if not changed:
+                    result = expr
+                elif expr.is_Pow:
+                    result = new_args[0]**new_args[1]
+                else:
+                    result = expr.__class__(*new_args)
+            else:
+                result = delegate(expr)
+
+            cache[expr] = result
+            return result
+
+        if not mapping:
+            return self
+        else:
+            return rec(self)
+
     def _seq_subs(self, old, new):
         if self==old:
             return new
@@ -1123,9 +1430,8 @@ def _seq_subs(self, old, new):
         return self.__class__(*[s.subs(old, new) for s in args])
 
     def __contains__(self, what):
-        if self == what: return True
-        for x in self._args:
-            if what in x:
+        for expr in _walk(self, rawargs=True):
+            if expr == what:
                 return True
         return False
 
@@ -1151,20 +1457,11 @@ def has_any_symbols(self, *syms):
         if not syms:
             return True
         else:
-            def search(expr):
-                if expr.is_Atom:
-                    if expr.is_Symbol:
-                        return expr in syms
-                    else:
-                        return False
-                else:
-                    for term in expr.iter_basic_args():
-                        if search(term):
-                            return True
-                    else:
-                        return False
+            for expr in _walk(self):
+                if expr.is_Symbol and expr in syms:
+                    return True
 
-            return search(self)
+            return False
 
     @cacheit
     def has_all_symbols(self, *syms):
@@ -1185,20 +1482,14 @@ def has_all_symbols(self, *syms):
         if not syms:
             return True
         else:
-            def search(expr):
-                if expr.is_Atom:
-                    if expr.is_Symbol and expr in syms:
-                        syms.remove(expr)
-                else:
-                    for term in expr.iter_basic_args():
-                        if not syms:
-                            break
-                        else:
-                            search(term)
+            for expr in _walk(self):
+                if expr.is_Symbol and expr in syms:
+                    syms.remove(expr)
 
-            search(self)
+                    if not syms:
+                        return True
 
-            return not syms
+            return False
 
     def has(self, *patterns):
         """
@@ -1212,7 +1503,6 @@ def has(self, *patterns):
         False
 
         """
-        from sympy.utilities.iterables import flatten
         if len(patterns)>1:
             for p in patterns:
                 if self.has(p):
@@ -1233,14 +1523,8 @@ def has(self, *patterns):
                 return False
             else:
                 return True
-        if p.matches(self) is not None:
-            return True
-        if not False:
-            args = self.args[:]
-        else:
-            args = (self.func,)+self.args[:]
-        for e in flatten(args):
-            if isinstance(e, Basic) and e.has(p):
+        for expr in _walk(self, rawargs=True):
+            if p.matches(expr) is not None:
                 return True
         return False
 
@@ -6,6 +6,9 @@
 CACHE = []  # [] of
             #    (item, {} or tuple of {})
 
+# hit/miss counters of registered caches:
+CACHE_STATS = {}    # item -> [hits, misses]
+
 def print_cache():
     """print cache content"""
 
@@ -39,6 +42,303 @@ def clear_cache():
         for kv in cache:
             kv.clear()
 
+def _sizeof_cache(cache):
+    """approximate memory used by a cache container and its entries
+
+       Keys and values are measured shallowly (arguments and results are
+       usually shared with the rest of the program).  Returns None when
+       sys.getsizeof() is not available (Python < 2.6).
+    """
+    import sys
+
+    try:
+        sizeof = sys.getsizeof
+    except AttributeError:
+        return None
+
+    total = sizeof(cache)
+
+    if isinstance(cache, BoundedCache):
+        total += sizeof(cache._map)
+
+        for entry in cache._map.itervalues():
+            total += sizeof(entry)
+
+    for key, value in cache.iteritems():
+        total += sizeof(key) + sizeof(value)
+
+    return total
+
+def cache_stats():
+    """return usage statistics of all caches
+
+       The result is a list with one dictionary per cached function (both
+       @cacheit and Memoizer) with the following items:
+
+         name       -- module and name of the function
+         function   -- the function itself
+         hits       -- number of calls answered from the cache
+         misses     -- number of calls that computed a new result
+         evictions  -- number of entries dropped by a bounded cache
+         size       -- number of entries currently cached
+         maxsize    -- maximum number of entries (None if unbounded)
+         bytes      -- approximate memory used by the cache (or None)
+
+       Example
+       -------
+
+       >>> from sympy.core.cache import cache_stats
+       >>> stats = cache_stats()
+       >>> sorted(stats[0].keys())
+       ['bytes', 'evictions', 'function', 'hits', 'maxsize', 'misses', 'name', 'size']
+
+    """
+    stats = []
+
+    for item, cache in CACHE:
+        if not isinstance(cache, tuple):
+            cache = (cache,)
+
+        hits, misses = CACHE_STATS.get(item, (0, 0))
+        evictions, size, maxsize, nbytes = 0, 0, None, 0
+
+        for kv in cache:
+            size += len(kv)
+
+            if isinstance(kv, BoundedCache):
+                evictions += kv.evictions
+
+                if kv.maxsize is not None:
+                    maxsize = (maxsize or 0) + kv.maxsize
+
+            if nbytes is not None:
+                kv_bytes = _sizeof_cache(kv)
+
+                if kv_bytes is None:
+                    nbytes = None
+                else:
+                    nbytes += kv_bytes
+
+        stats.append({
+            'name'      : '%s.%s' % (item.__module__, item.__name__),
+            'function'  : item,
+            'hits'      : hits,
+            'misses'    : misses,
+            'evictions' : evictions,
+            'size'      : size,
+            'maxsize'   : maxsize,
+            'bytes'     : nbytes,
+        })
+
+    return stats
+
+def print_cache_stats():
+    """print cache statistics, most used caches first"""
+    stats = cache_stats()
+    stats.sort(key=lambda info: -(info['hits'] + info['misses']))
+
+    print '%-50s %10s %10s %10s %8s %10s' % \
+        ('function', 'hits', 'misses', 'evictions', 'size', 'bytes')
+
+    for info in stats:
+        print '%-50s %10s %10s %10s %8s %10s' % (info['name'], info['hits'],
+            info['misses'], info['evictions'], info['size'], info['bytes'])
+
+def reset_cache_stats():
+    """reset hit, miss and eviction counters of all caches"""
+    for stats in CACHE_STATS.itervalues():
+        stats[:] = [0, 0]
+
+    for item, cache in CACHE:
+        if not isinstance(cache, tuple):
+            cache = (cache,)
+
+        for kv in cache:
+            if isinstance(kv, BoundedCache):
+                kv.evictions = 0
+
+def set_cache_size(func, maxsize):
+    """change the maximum number of entries kept in the cache of ``func``
+
+       ``func`` is a function decorated with @cacheit (or a method of a
+       class, e.g. Add.flatten).  Only bounded caches can be resized, i.e.
+       SYMPY_USE_CACHE has to be set to 'lru' or 'lfu'.  ``maxsize=None``
+       makes the cache unbounded.
+
+       Example
+       -------
+
+       set_cache_size(Add.flatten, 10000)
+    """
+    try:
+        cache = func._cache_it_cache
+    except AttributeError:
+        raise ValueError('%s is not a cached function' % func)
+
+    if not isinstance(cache, BoundedCache):
+        raise ValueError('cache of %s is not bounded, set SYMPY_USE_CACHE '
+                         'to lru or lfu' % func)
+
+    cache.resize(maxsize)
+
+########################################
+
+class BoundedCache(object):
+    """base class for dictionary-like caches holding at most ``maxsize`` items
+
+       Subclasses define which entries are evicted when the cache is full.
+       ``maxsize=None`` means the cache is never pruned.
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self.evictions = 0
+
+    def resize(self, maxsize):
+        """set new maximum size, evicting entries if necessary"""
+        self.maxsize = maxsize
+        self._prune()
+
+    def _prune(self):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return '%s(maxsize=%s)' % (self.__class__.__name__, self.maxsize)
+
+class LRUCache(BoundedCache):
+    """bounded cache evicting the least recently used entry
+
+       Entries are kept in a circular doubly linked list of
+       [prev, next, key, value] links, so that lookup, insertion and
+       eviction are all O(1).
+    """
+
+    def __init__(self, maxsize=None):
+        BoundedCache.__init__(self, maxsize)
+        self._map = {}
+        # root.next is the least, root.prev the most recently used link
+        self._root = root = []
+        root[:] = [root, root, None, None]
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def __getitem__(self, key):
+        link = self._map[key]
+        root = self._root
+
+        # unlink and move to the most recently used end
+        link_prev, link_next = link[0], link[1]
+        link_prev[1] = link_next
+        link_next[0] = link_prev
+
+        last = root[0]
+        last[1] = root[0] = link
+        link[0] = last
+        link[1] = root
+
+        return link[3]
+
+    def __setitem__(self, key, value):
+        try:
+            self[key]
+        except KeyError:
+            root = self._root
+            last = root[0]
+            last[1] = root[0] = self._map[key] = [last, root, key, value]
+            self._prune()
+        else:
+            self._map[key][3] = value
+
+    def _prune(self):
+        maxsize = self.maxsize
+
+        if maxsize is None:
+            return
+
+        _map, root = self._map, self._root
+
+        while len(_map) > maxsize:
+            link = root[1]
+            root[1] = link[1]
+            link[1][0] = root
+            del _map[link[2]]
+            self.evictions += 1
+
+    def clear(self):
+        self._map.clear()
+        root = self._root
+        root[:] = [root, root, None, None]
+
+    def iteritems(self):
+        root = self._root
+        link = root[1]
+
+        while link is not root:
+            yield link[2], link[3]
+            link = link[1]
+
+class LFUCache(BoundedCache):
+    """bounded cache evicting the least frequently used entries
+
+       Every entry carries a hit counter.  When the cache overflows, the
+       least used eighth of entries is dropped at once (the newest entry
+       is always kept) and the counters of the survivors are halved, so
+       that formerly hot entries age out eventually.
+    """
+
+    def __init__(self, maxsize=None):
+        BoundedCache.__init__(self, maxsize)
+        self._map = {}
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def __getitem__(self, key):
+        entry = self._map[key]
+        entry[1] += 1
+        return entry[0]
+
+    def __setitem__(self, key, value):
+        try:
+            self._map[key][0] = value
+        except KeyError:
+            self._map[key] = [value, 1]
+            self._prune(key)
+
+    def _prune(self, keep=None):
+        maxsize = self.maxsize
+
+        if maxsize is None or len(self._map) <= maxsize:
+            return
+
+        _map = self._map
+        n = len(_map) - maxsize + (maxsize >> 3)
+
+        entries = [ (entry[1], key) for key, entry in _map.iteritems() if key is not keep ]
+        entries.sort(key=lambda item: item[0])
+
+        for count, key in entries[:n]:
+            del _map[key]
+
+        self.evictions += len(entries[:n])
+
+        for entry in _map.itervalues():
+            entry[1] = (entry[1] + 1) >> 1
+
+    def clear(self):
+        self._map.clear()
+
+    def iteritems(self):
+        for key, entry in self._map.iteritems():
+            yield key, entry[0]
+
 ########################################
 
 def __cacheit_nocache(func):
@@ -67,8 +367,9 @@ def f(a,b):
        set environment variable SYMPY_USE_CACHE to 'debug'
     """
 
-    func._cache_it_cache = func_cache_it_cache = {}
+    func._cache_it_cache = func_cache_it_cache = _new_cache()
     CACHE.append((func, func_cache_it_cache))
+    CACHE_STATS[func] = stats = [0, 0]
 
     def wrapper(*args, **kw_args):
         if kw_args:
@@ -79,14 +380,19 @@ def wrapper(*args, **kw_args):
         else:
             k = args
         try:
-            return func_cache_it_cache[k]
+            r = func_cache_it_cache[k]
         except KeyError:
             pass
+        else:
+            stats[0] += 1
+            return r
+        stats[1] += 1
         func_cache_it_cache[k] = r = func(*args, **kw_args)
         return r
 
     wrapper.__doc__ = func.__doc__
     wrapper.__name__ = func.__name__
+    wrapper._cache_it_cache = func_cache_it_cache
 
     return wrapper
 
@@ -117,12 +423,14 @@ def wrapper(*args, **kw_args):
 
     wrapper.__doc__ = func.__doc__
     wrapper.__name__ = func.__name__
+    wrapper._cache_it_cache = cfunc._cache_it_cache
 
     return wrapper
 
 def __cacheit_nondummy(func):
-    func._cache_it_cache = func_cache_it_cache = {}
+    func._cache_it_cache = func_cache_it_cache = _new_cache()
     CACHE.append((func, func_cache_it_cache))
+    CACHE_STATS[func] = stats = [0, 0]
 
     def wrapper(*args, **kw_args):
         if kw_args:
@@ -139,14 +447,19 @@ def wrapper(*args, **kw_args):
         else:
             k = args
         try:
-            return func_cache_it_cache[k]
+            r = func_cache_it_cache[k]
         except KeyError:
             pass
+        else:
+            stats[0] += 1
+            return r
+        stats[1] += 1
         func_cache_it_cache[k] = r = func(*args, **kw_args)
         return r
 
     wrapper.__doc__ = func.__doc__
     wrapper.__name__ = func.__name__
+    wrapper._cache_it_cache = func_cache_it_cache
 
     return wrapper
 
@@ -254,16 +567,20 @@ def fix_allowed_types(self, have_been_here={}):
         have_been_here[i] = True
 
     def __call__(self, func):
-        cache = {}
-        value_cache = {}
+        cache = _new_cache()
+        value_cache = _new_cache()
         CACHE.append((func, (cache, value_cache)))
+        CACHE_STATS[func] = stats = [0, 0]
 
         def wrapper(*args, **kw_args):
             kw_items = tuple(kw_args.items())
             try:
-                return self.return_value_converter(cache[args,kw_items])
+                r = cache[args,kw_items]
             except KeyError:
                 pass
+            else:
+                stats[0] += 1
+                return self.return_value_converter(r)
             self.fix_allowed_types()
             new_args = tuple([template.process(a,func,i) for (a, template, i) in zip(args, self.arg_templates, range(len(args)))])
             assert len(args)==len(new_args)
@@ -274,8 +591,9 @@ def wrapper(*args, **kw_args):
                 new_kw_args[k] = v
             new_kw_items = tuple(new_kw_args.items())
             try:
-                return self.return_value_converter(cache[new_args, new_kw_items])
+                r = cache[new_args, new_kw_items]
             except KeyError:
+                stats[1] += 1
                 r = func(*new_args, **new_kw_args)
                 try:
                     try:
@@ -285,7 +603,10 @@ def wrapper(*args, **kw_args):
                 except TypeError:
                     pass
                 cache[new_args, new_kw_items] = cache[args, kw_items] = r
-                return self.return_value_converter(r)
+            else:
+                stats[0] += 1
+            return self.return_value_converter(r)
+        wrapper._cache_it_cache = cache
         return wrapper
 
 
@@ -312,16 +633,38 @@ def wrapper(*args, **kw_args):
 
 
 
-# SYMPY_USE_CACHE=yes/no/debug
+# SYMPY_USE_CACHE=yes/no/debug/lru/lfu
 def __usecache():
     import os
     return os.getenv('SYMPY_USE_CACHE', 'yes').lower()
 usecache = __usecache()
 
+# SYMPY_CACHE_SIZE=some_integer/none
+# (maximum number of entries per function for lru and lfu caches)
+def __cachesize():
+    import os
+    size = os.getenv('SYMPY_CACHE_SIZE', '1000').lower()
+    if size == 'none':
+        return None
+    try:
+        return int(size)
+    except ValueError:
+        raise RuntimeError('SYMPY_CACHE_SIZE must be an integer or none, got: %s' % size)
+cachesize = __cachesize()
+
+def _new_cache():
+    """create an empty cache object for a new cached function"""
+    if usecache == 'lru':
+        return LRUCache(cachesize)
+    elif usecache == 'lfu':
+        return LFUCache(cachesize)
+    else:
+        return {}
+
 if usecache=='no':
     Memoizer            = Memoizer_nocache
     cacheit             = __cacheit_nocache
-elif usecache=='yes':
+elif usecache in ('yes', 'lru', 'lfu'):
     cacheit = __cacheit
 elif usecache=='debug':
     cacheit = __cacheit_debug   # a lot slower
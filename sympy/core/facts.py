@@ -676,6 +676,9 @@ class FactRules:
        .prereq  -- {} k <- [] of k's prerequisites
 
        .defined_facts -- set of defined fact names
+
+       .fact_bits, .alpha_bits, .beta_bits -- the above tables compiled into
+                    bitmasks, which are used by `deduce_all_facts`
     """
 
     def __init__(self, rules):
@@ -810,158 +813,208 @@ def __init__(self, rules):
 
         self.prereq = prereq
 
+        # compile rels and beta_rules into bitmask tables
+        self._compile_bits()
 
 
-    # --- DEDUCTION ENGINE: RUNTIME CORE ---
+    def _compile_bits(self):
+        """Compile deduction tables into bitmasks (done once per FactRules)
 
-    # TODO: add proper support for U (None), i.e.
-    #       integer=U  -> rational=U  ??? (XXX i'm not sure)
+           Every fact gets a bit. A set of facts with their values is then
+           represented by two integers: `known` -- which facts are known (to
+           be T or F), and `true` -- which of the known facts are T.
 
+           .fact_bits   -- {} k -> bit
+           .bit_facts   -- {} bit -> k
+           .alpha_bits  -- {} (k,v) -> (known, true) of all implications of
+                           k=v, including k=v itself
+           .beta_bits   -- [] of (known, true, k, v) for &(...) -> k=v, where
+                           known/true describe the &(...) condition
+        """
+        names = set(self.defined_facts)
 
-    def deduce_all_facts(self, facts, base=None):
-        """Deduce all facts from known facts ({} or [] of (k,v))
+        for rel in [self.rel_tt, self.rel_tf, self.rel_ft, self.rel_ff]:
+            for k, impl in rel.iteritems():
+                names.add(k)
+                names.update(impl)
 
-           *********************************************
-           * This is the workhorse, so keep it *fast*. *
-           *********************************************
+        for bcond, bimpl in self.beta_rules:
+            names.add(bimpl.lstrip('!'))
 
-           base  --  previously known facts (must be: fully deduced set)
-                     attention: base is modified *inplace*  /optional/
+        fact_bits = {}
 
-           providing `base` could be needed for performance reasons -- we don't
-           want to spend most of the time just re-deducing base from base
-           (e.g. #base=50, #facts=2)
-        """
+        for i, k in enumerate(sorted(names)):
+            fact_bits[k] = 1 << i
 
-        # keep frequently used attributes locally, so we'll avoid extra
-        # attribute access overhead
-        rels = self.rels
-        beta_rules = self.beta_rules
+        def mask(keys):
+            m = 0
+            for k in keys:
+                m |= fact_bits[k]
+            return m
 
-        if base is not None:
-            new_facts = base
-        else:
-            new_facts = {}
+        alpha_bits = {}
+        empty = ()
 
+        for k, bit in fact_bits.iteritems():
+            t = mask(self.rel_tt.get(k,empty)) | bit
+            f = mask(self.rel_tf.get(k,empty))
+            alpha_bits[(k, True)]  = (t | f, t)
 
-        # XXX better name ?
-        def x_new_facts(keys, v):
-            #print 'x_new_facts(%r,%r)' % (keys, v)
-            for k in keys:
-                if k in new_facts:
-                    #print 'seen_fact  %s:\t %s' % (k,v)
-                    assert new_facts[k] == v, ('inconsitency between facts',new_facts,k,v)
-                    continue
+            t = mask(self.rel_ft.get(k,empty))
+            f = mask(self.rel_ff.get(k,empty)) | bit
+            alpha_bits[(k, False)] = (t | f, t)
+
+        beta_bits = []
 
+        for bcond, bimpl in self.beta_rules:
+            known = true = 0
+
+            for bk in bcond.args:
+                if bk[:1] == '!':
+                    known |= fact_bits[bk[1:]]
                 else:
-                    #print 'new_fact   %s:\t %s' % (k,v)
-                    new_facts[k] = v
+                    known |= fact_bits[bk]
+                    true  |= fact_bits[bk]
 
+            if bimpl[:1] == '!':
+                beta_bits.append( (known, true, bimpl[1:], False) )
+            else:
+                beta_bits.append( (known, true, bimpl, True) )
 
-        if type(facts) is dict:
-            fseq = facts.iteritems()
-        else:
-            fseq = facts
+        self.fact_bits  = fact_bits
+        self.bit_facts  = dict( (bit,k) for k, bit in fact_bits.iteritems() )
+        self.alpha_bits = alpha_bits
+        self.beta_bits  = beta_bits
 
 
-        while True:
-            beta_maytrigger = set()
 
-            # --- alpha chains ---
-            #print '**'
-            for k,v in fseq:
-                #print '--'
+    # --- DEDUCTION ENGINE: RUNTIME CORE ---
 
-                # first, convert name to be not a not-name
-                if k[:1] == '!':
-                    k = name_not(k)
-                    v = fuzzy_not(v)
+    # TODO: add proper support for U (None), i.e.
+    #       integer=U  -> rational=U  ??? (XXX i'm not sure)
 
-                #new_fact(k, v)
-                if k in new_facts:
-                    assert new_facts[k] == v, ('inconsitency between facts',new_facts,k,v)
 
-                    # performance-wise it is important not to fire implied rules
-                    # for already-seen fact -- we already did them all.
-                    continue
+    def deduce_bits(self, facts, known=0, true=0):
+        """Deduce all facts from known facts ([] of (k,v)) in bitmask form
 
-                else:
-                    new_facts[k] = v
+           known, true  --  previously known facts as bitmasks (must be: fully
+                            deduced set), see _compile_bits
+
+           returns new (known, true)
 
+           Only facts with boolean values are handled here, i.e. k=None is
+           not allowed.
+        """
+        alpha_bits = self.alpha_bits
+        beta_bits  = self.beta_bits
+        fact_bits  = self.fact_bits
+
+        while facts:
+            # --- alpha chains ---
+            # alpha_bits contain *all* the implications of k=v, so we do not
+            # have to process each implication recursively
+            for kv in facts:
+                kknown, ktrue = alpha_bits[kv]
+
+                assert not (known & kknown & (true ^ ktrue)), \
+                        ('inconsitency between facts', kv, known, true)
+
+                known |= kknown
+                true  |= ktrue
 
-                # some known fact -- let's follow it's implications
-                if v is not None:
+            # --- beta chains ---
+            facts = []
+
+            for bknown, btrue, k, v in beta_bits:
+                if (known & bknown) == bknown and (true & bknown) == btrue:
+                    bit = fact_bits[k]
+
+                    if not (known & bit):
+                        facts.append( (k,v) )
 
-                    # lookup routing tables
-                    try:
-                        tt, tf, tbeta,  ft, ff, fbeta = rels[k]
-                    except KeyError:
-                        pass
                     else:
-                        # Now we have routing tables with *all* the needed
-                        # implications for this k. This means we do not have to
-                        # process each implications recursively!
-                        # XXX this ^^^ is true only for alpha chains
+                        assert bool(true & bit) == v, \
+                                ('inconsitency between facts', k, v, known, true)
 
-                        # k=T
-                        if v:
-                            x_new_facts(tt, True)   # k -> i
-                            x_new_facts(tf, False)  # k -> !i
+        return known, true
 
-                            beta_maytrigger.update(tbeta)
 
-                        # k=F
-                        else:
-                            x_new_facts(ft, True)   # !k -> i
-                            x_new_facts(ff, False)  # !k -> !i
+    def deduce_all_facts(self, facts, base=None):
+        """Deduce all facts from known facts ({} or [] of (k,v))
 
-                            beta_maytrigger.update(fbeta)
+           *********************************************
+           * This is the workhorse, so keep it *fast*. *
+           *********************************************
 
+           base  --  previously known facts (must be: fully deduced set)
+                     attention: base is modified *inplace*  /optional/
 
+           providing `base` could be needed for performance reasons -- we don't
+           want to spend most of the time just re-deducing base from base
+           (e.g. #base=50, #facts=2)
 
+           The deduction itself is done with bitmasks, see deduce_bits.
+        """
+        fact_bits = self.fact_bits
 
-            # --- beta chains ---
+        if base is not None:
+            new_facts = base
+        else:
+            new_facts = {}
+
+        if type(facts) is dict:
+            fseq = facts.iteritems()
+        else:
+            fseq = facts
 
-            # if no beta-rules may trigger -- it's an end-of-story
-            if not beta_maytrigger:
-                break
+        kvs = []
 
+        for k, v in fseq:
+            # first, convert name to be not a not-name
+            if k[:1] == '!':
+                k = name_not(k)
+                v = fuzzy_not(v)
 
-            #print '(β) MayTrigger: %s' % beta_maytrigger
+            if k in new_facts:
+                assert new_facts[k] == v, ('inconsitency between facts',new_facts,k,v)
 
-            fseq = []
+                # performance-wise it is important not to fire implied rules
+                # for already-seen fact -- we already did them all.
+                continue
 
-            # XXX this is dumb proof-of-concept trigger -- we'll need to optimize it
-            # let's see which beta-rules to trigger
-            for bidx in beta_maytrigger:
-                bcond,bimpl = beta_rules[bidx]
+            new_facts[k] = v
 
-                # let's see whether bcond is satisfied
-                for bk in bcond.args:
-                    try:
-                        if bk[:1] == '!':
-                            bv = fuzzy_not(new_facts[bk[1:]])
-                        else:
-                            bv = new_facts[bk]
-                    except KeyError:
-                        break   # fact not found -- bcond not satisfied
+            # unknown value or unknown fact -- nothing can be deduced
+            if v is not None and k in fact_bits:
+                kvs.append( (k,v) )
 
-                    # one of bcond's condition does not hold
-                    if not bv:
-                        break
+        if not kvs:
+            return new_facts
 
-                else:
-                    # all of bcond's condition hold -- let's fire this beta rule
-                    #print '(β) Trigger #%i  (%s)' % (bidx, bimpl)
+        # previously known facts (including kvs) in bitmask form
+        known = true = 0
 
-                    if bimpl[:1] == '!':
-                        bimpl = bimpl[1:]
-                        v = False
-                    else:
-                        v = True
+        for k, v in new_facts.iteritems():
+            if v is not None:
+                bit = fact_bits.get(k)
+
+                if bit is not None:
+                    known |= bit
+
+                    if v:
+                        true |= bit
+
+        known0 = known
+        known, true = self.deduce_bits(kvs, known, true)
 
-                    fseq.append( (bimpl,v) )
+        # store newly derived facts back into new_facts
+        bit_facts = self.bit_facts
+        added = known & ~known0
 
+        while added:
+            bit = added & -added
+            new_facts[bit_facts[bit]] = bool(true & bit)
+            added ^= bit
 
         return new_facts
 
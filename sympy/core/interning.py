@@ -0,0 +1,95 @@
+"""Hash-consing (interning) of SymPy objects.
+
+   When interning is enabled, every construction of a SymPy object, e.g.
+   Add(x, y) or sin(x), returns the single shared instance structurally
+   equal to it, if one is alive. This way identical subexpressions built
+   in different places share memory and comparisons of equal expressions
+   reduce to an identity check.
+
+   Interning is disabled by default, because it slows down construction
+   of new objects a bit. Use enable_interning() and disable_interning()
+   or set environment variable SYMPY_USE_INTERNING to 'yes'.
+
+   The table holds weak references to objects, so interned objects are
+   freed as soon as they aren't used anymore. Objects must not be mutated
+   after construction, which is the case for all SymPy objects.
+"""
+
+import weakref
+
+from basic import Basic, BasicMeta
+
+_table = weakref.WeakValueDictionary()
+
+def _key(obj):
+    """Returns a key identifying obj up to structural equality.
+
+       Arguments are compared by identity, because some objects compare
+       equal although their arguments differ, e.g. O(1, x) == O(1, y).
+       This is safe as an interned object keeps its arguments alive.
+    """
+    keys = obj._assume_type_keys
+
+    if keys is None:
+        assumptions = ()
+    else:
+        kv = obj._assumptions
+        assumptions = tuple([ (k, kv[k]) for k in sorted(keys) ])
+
+    args = tuple([ id(arg) for arg in obj.args ])
+
+    return (type(obj), obj._hashable_content(), args, assumptions)
+
+def intern_basic(obj):
+    """Returns the shared instance structurally equal to obj.
+
+       >>> from sympy import Symbol, sin
+       >>> from sympy.core.interning import intern_basic
+       >>> x = Symbol('x')
+       >>> a = intern_basic(sin(x) + 1)
+       >>> b = intern_basic(sin(x) + 1)
+       >>> a is b
+       True
+
+    """
+    if not isinstance(obj, Basic):
+        return obj
+
+    try:
+        key = _key(obj)
+        return _table.setdefault(key, obj)
+    except TypeError:
+        # some objects have unhashable content
+        return obj
+
+def _interning_call(cls, *args, **kwargs):
+    return intern_basic(type.__call__(cls, *args, **kwargs))
+
+def enable_interning():
+    """Make all newly constructed SymPy objects interned. """
+    BasicMeta.__call__ = _interning_call
+
+def disable_interning():
+    """Stop interning of newly constructed SymPy objects. """
+    if '__call__' in BasicMeta.__dict__:
+        del BasicMeta.__call__
+
+def interning_enabled():
+    """Returns True if SymPy objects are interned. """
+    return BasicMeta.__dict__.get('__call__') is _interning_call
+
+def clear_interned():
+    """Forget all interned objects. """
+    _table.clear()
+
+def interned_count():
+    """Returns the number of live interned objects. """
+    return len(_table)
+
+# SYMPY_USE_INTERNING=yes/no
+def __useinterning():
+    import os
+    return os.getenv('SYMPY_USE_INTERNING', 'no').lower()
+
+if __useinterning() == 'yes':
+    enable_interning()
@@ -837,9 +837,86 @@ def _sage_(self):
             s *= x._sage_()
         return s
 
+    @classmethod
+    def fromiter(cls, args):
+        """Create Mul from an iterable of factors (e.g. a generator)
+
+           >>> from sympy import Mul, Symbol
+           >>> x = Symbol('x')
+           >>> Mul.fromiter(x + i for i in range(3))
+           x*(1 + x)*(2 + x)
+
+        """
+        factors = MulAccumulator()
+        factors.extend(args)
+        return factors.as_expr()
+
+
+class MulAccumulator(object):
+    """Collects factors of a product
+
+       Numbers are multiplied out as they come and nested Muls are split into
+       their factors. Everything else is only stored, so that the product can
+       be built incrementally in linear time, with Mul.flatten run just once
+       over all factors:
+
+       >>> from sympy import Symbol
+       >>> from sympy.core.mul import MulAccumulator
+       >>> x, y = Symbol('x'), Symbol('y')
+       >>> acc = MulAccumulator()
+       >>> acc.append(2)
+       >>> acc.extend([x, 3*y, x])
+       >>> acc.as_expr()
+       6*y*x**2
+
+    """
+
+    __slots__ = ['coeff', 'factors']
+
+    def __init__(self):
+        self.coeff = S.One      # number factor
+        self.factors = []       # other factors, in order of appearance
+
+    def append(self, o):
+        """Multiply by one factor. """
+        self._extend((_sympify(o),))
+
+    def extend(self, seq):
+        """Multiply by all factors from iterable seq. """
+        self._extend([ _sympify(o) for o in seq ])
+
+    def _extend(self, seq):
+        coeff = self.coeff
+        factors = self.factors
+
+        for o in seq:
+            if o.is_Number:
+                coeff *= o
+            elif o.is_Mul:
+                # args of Mul are never Muls, so we don't have to recurse
+                for f in o.args:
+                    if f.is_Number:
+                        coeff *= f
+                    else:
+                        factors.append(f)
+            else:
+                factors.append(o)
+
+        self.coeff = coeff
+
+    def as_args(self):
+        """Returns (commutative_part, noncommutative_part, order_symbols)
+           as Mul.flatten does.
+        """
+        return Mul.flatten([self.coeff] + self.factors)
+
+    def as_expr(self):
+        """Returns the product of all collected factors. """
+        return Mul._from_flattened(*self.as_args())
+
 
 from power import Pow
 from numbers import Real
 from function import FunctionClass
-from sympify import sympify
+from sympify import sympify, _sympify
 from add import Add
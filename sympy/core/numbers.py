@@ -1,6 +1,6 @@
 from basic import Atom, SingletonMeta, S, Basic
 from decorators import _sympifyit
-from cache import Memoizer, MemoizerArg
+from cache import Memoizer
 import sympy.mpmath as mpmath
 import sympy.mpmath.libmpf as mlib
 import sympy.mpmath.libmpc as mlibc
@@ -490,9 +490,33 @@ class Rational(Number):
 
     is_Rational = True
 
-    @Memoizer(type, (int, long, str, 'Integer'),
-              MemoizerArg((int, long, 'Integer', type(None)), name="q"))
     def __new__(cls, p, q = None):
+        global _ratcache_hits, _ratcache_misses, _ratcache_evictions
+
+        try:
+            obj = _ratcache[p, q]
+        except KeyError:
+            pass
+        else:
+            _ratcache_hits += 1
+            return obj
+
+        _ratcache_misses += 1
+        obj = Rational.__xnew__(cls, p, q)
+
+        if len(_ratcache) >= _ratcache_maxsize:
+            _ratcache_evictions += len(_ratcache)
+            _ratcache.clear()
+
+        _ratcache[p, q] = obj
+        return obj
+
+    def __new_stage2__(cls, p, q = None):
+        if not isinstance(p, (int, long, str, Integer)):
+            raise ValueError('invalid argument for Rational: %r' % (p,))
+        if not isinstance(q, (int, long, Integer, type(None))):
+            raise ValueError('invalid argument for Rational: %r' % (q,))
+
         if q is None:
             if isinstance(p, str):
                 p, q = _parse_rational(p)
@@ -521,6 +545,8 @@ def __new__(cls, p, q = None):
         #obj._args = (p, q)
         return obj
 
+    __xnew__ = staticmethod(__new_stage2__)     # never cached
+
     def __getnewargs__(self):
         return (self.p, self.q)
 
@@ -708,63 +734,139 @@ def _sage_(self):
         #return sage.Integer(self[0])/sage.Integer(self[1])
         return sage.Integer(self.p)/sage.Integer(self.q)
 
+# Caches of Integers and Rationals
+# --------------------------------
+#
+# Integers in [_smallint_min, _smallint_max] are preallocated and are never
+# dropped from _intcache. Other Integers and Rationals (by their (p, q)
+# arguments) are cached up to a given number of entries. When a cache is
+# full, all of its (not preallocated) entries are dropped at once, which is
+# cheaper than tracking usage of entries on every lookup.
+#
+# See set_number_caches() and number_cache_stats().
+
 # int -> Integer
 _intcache = {}
+# preallocated part of _intcache
+_smallints = {}
+_smallint_min = -256
+_smallint_max = 1024
+_intcache_maxsize = 10000
 
+# (p, q) -> Rational
+_ratcache = {}
+_ratcache_maxsize = 10000
 
-# TODO move this tracing facility to  sympy/core/trace.py  ?
-def _intcache_printinfo():
-    ints = sorted(_intcache.keys())
-    nhit = _intcache_hits
-    nmiss= _intcache_misses
+_intcache_hits      = 0
+_intcache_misses    = 0
+_intcache_evictions = 0
 
-    if nhit == 0 and nmiss == 0:
-        print
-        print 'Integer cache statistic was not collected'
-        return
+_ratcache_hits      = 0
+_ratcache_misses    = 0
+_ratcache_evictions = 0
 
-    miss_ratio = float(nmiss) / (nhit+nmiss)
+def set_number_caches(smallints=None, integers=None, rationals=None):
+    """Configure caches of Integer and Rational instances.
 
-    print
-    print 'Integer cache statistic'
-    print '-----------------------'
-    print
-    print '#items: %i' % len(ints)
-    print
-    print ' #hit   #miss               #total'
-    print
-    print '%5i   %5i (%7.5f %%)   %5i'    % (nhit, nmiss, miss_ratio*100, nhit+nmiss)
-    print
-    print ints
+       smallints  -- (min, max) range of preallocated Integers
+       integers   -- maximum number of cached Integers outside that range
+       rationals  -- maximum number of cached Rationals
 
-_intcache_hits   = 0
-_intcache_misses = 0
+       Arguments which are None are left unchanged.
 
-def int_trace(f):
-    import os
-    if os.getenv('SYMPY_TRACE_INT', 'no').lower() != 'yes':
-        return f
+       >>> from sympy.core.numbers import set_number_caches
+       >>> set_number_caches(smallints=(-256, 1024), integers=10000)
+
+    """
+    global _smallint_min, _smallint_max, _intcache_maxsize, _ratcache_maxsize
+
+    if smallints is not None:
+        _smallint_min, _smallint_max = smallints
+
+    if integers is not None:
+        _intcache_maxsize = integers
+
+    if rationals is not None:
+        _ratcache_maxsize = rationals
+
+    _ratcache.clear()
 
-    def Integer_tracer(cls, i):
-        global _intcache_hits, _intcache_misses
+    # reuse existing instances, so that e.g. Integer(0) is still S.Zero
+    small = {}
 
+    for i in xrange(_smallint_min, _smallint_max+1):
         try:
-            _intcache_hits += 1
-            return _intcache[i]
+            small[i] = _intcache[i]
         except KeyError:
-            _intcache_hits   -= 1
-            _intcache_misses += 1
+            small[i] = obj = Basic.__new__(Integer)
+            obj.p = i
 
-            return f(cls, i)
+    for i in (-1, 0, 1):
+        small[i] = _intcache[i]
 
+    _smallints.clear()
+    _smallints.update(small)
 
-    # also we want to hook our _intcache_printinfo into sys.atexit
-    import atexit
-    atexit.register(_intcache_printinfo)
+    _intcache.clear()
+    _intcache.update(_smallints)
+
+def number_cache_stats():
+    """Returns usage statistics of Integer and Rational caches.
+
+       The result is in the same format as sympy.core.cache.cache_stats(),
+       i.e. a list of dictionaries with 'name', 'hits', 'misses',
+       'evictions', 'size' and 'maxsize' items.
+
+       >>> from sympy.core.numbers import number_cache_stats
+       >>> [ stats['name'] for stats in number_cache_stats() ]
+       ['Integer', 'Rational']
+
+    """
+    stats = []
+
+    for name, hits, misses, evictions, size, maxsize in [
+            ('Integer', _intcache_hits, _intcache_misses, _intcache_evictions,
+                len(_intcache) - len(_smallints), _intcache_maxsize),
+            ('Rational', _ratcache_hits, _ratcache_misses, _ratcache_evictions,
+                len(_ratcache), _ratcache_maxsize)]:
+        stats.append({
+            'name'      : name,
+            'hits'      : hits,
+            'misses'    : misses,
+            'evictions' : evictions,
+            'size'      : size,
+            'maxsize'   : maxsize,
+        })
+
+    return stats
+
+def reset_number_cache_stats():
+    """Reset hit, miss and eviction counters of Integer and Rational caches. """
+    global _intcache_hits, _intcache_misses, _intcache_evictions
+    global _ratcache_hits, _ratcache_misses, _ratcache_evictions
+
+    _intcache_hits = _intcache_misses = _intcache_evictions = 0
+    _ratcache_hits = _ratcache_misses = _ratcache_evictions = 0
+
+def _number_cache_printinfo():
+    print
+    print 'Integer/Rational cache statistic'
+    print '--------------------------------'
+    print
+    print '%-10s %10s %10s %10s %8s' % ('', 'hits', 'misses', 'evictions', 'size')
 
-    return Integer_tracer
+    for stats in number_cache_stats():
+        print '%-10s %10s %10s %10s %8s' % (stats['name'], stats['hits'],
+            stats['misses'], stats['evictions'], stats['size'])
 
+# SYMPY_TRACE_INT=yes prints cache statistics at exit
+def __traceint():
+    import os
+    return os.getenv('SYMPY_TRACE_INT', 'no').lower()
 
+if __traceint() == 'yes':
+    import atexit
+    atexit.register(_number_cache_printinfo)
 
 
 class Integer(Rational):
@@ -774,7 +876,8 @@ class Integer(Rational):
 
     is_Integer = True
 
-    __slots__ = ['p']
+    # p is Rational's slot, q is shadowed by the class attribute above
+    __slots__ = []
 
     def _as_mpf_val(self, prec):
         return mlib.from_int(self.p)
@@ -783,26 +886,40 @@ def _mpmath_(self, prec, rnd):
         return mpmath.make_mpf(self._as_mpf_val(prec))
 
     # TODO caching with decorator, but not to degrade performance
-    @int_trace
     def __new__(cls, i):
+        global _intcache_hits, _intcache_misses, _intcache_evictions
+
         try:
-            return _intcache[i]
+            obj = _intcache[i]
         except KeyError:
-            # The most often situation is when Integers are created from Python
-            # int or long
-            if isinstance(i, (int, long)):
-                obj = Basic.__new__(cls)
-                obj.p = i
-                _intcache[i] = obj
-                return obj
-
-            # Also, we seldomly need the following to work:
-            # UC: Integer(Integer(4))   <-- sympify('4')
-            elif isinstance(i, Integer):
-                return i
+            pass
+        else:
+            _intcache_hits += 1
+            return obj
 
-            else:
-                raise ValueError('invalid argument for Integer: %r' % (i,))
+        # The most often situation is when Integers are created from Python
+        # int or long
+        if isinstance(i, (int, long)):
+            _intcache_misses += 1
+
+            obj = Basic.__new__(cls)
+            obj.p = i
+
+            if len(_intcache) - len(_smallints) >= _intcache_maxsize:
+                _intcache_evictions += len(_intcache) - len(_smallints)
+                _intcache.clear()
+                _intcache.update(_smallints)
+
+            _intcache[i] = obj
+            return obj
+
+        # Also, we seldomly need the following to work:
+        # UC: Integer(Integer(4))   <-- sympify('4')
+        elif isinstance(i, Integer):
+            return i
+
+        else:
+            raise ValueError('invalid argument for Integer: %r' % (i,))
 
     def __getnewargs__(self):
         return (self.p,)
@@ -1600,6 +1717,9 @@ def _sage_(self):
 _intcache[1] = S.One
 _intcache[-1]= S.NegativeOne
 
+# preallocate small Integers
+set_number_caches()
+
 Basic.singleton['E'] = Exp1
 Basic.singleton['pi'] = Pi
 Basic.singleton['I'] = ImaginaryUnit
@@ -19,7 +19,8 @@ class AssocOp(Basic):
 
     # for performance reason, we don't let is_commutative go to assumptions,
     # and keep it right here
-    __slots__ = ['is_commutative']
+    __slots__ = ['is_commutative', '_fprint']
+    _stores_fprint = True
 
     @cacheit
     def __new__(cls, *args, **assumptions):
@@ -30,6 +31,11 @@ def __new__(cls, *args, **assumptions):
         if len(args)==1:
             return _sympify(args[0])
         c_part, nc_part, order_symbols = cls.flatten(map(_sympify, args))
+        return cls._from_flattened(c_part, nc_part, order_symbols, **assumptions)
+
+    @classmethod
+    def _from_flattened(cls, c_part, nc_part, order_symbols, **assumptions):
+        """create new instance of cls from the result of cls.flatten()"""
         if len(c_part) + len(nc_part) <= 1:
             if c_part: obj = c_part[0]
             elif nc_part: obj = nc_part[0]
@@ -42,6 +48,15 @@ def __new__(cls, *args, **assumptions):
             obj = C.Order(obj, *order_symbols)
         return obj
 
+    @classmethod
+    def fromiter(cls, args, **assumptions):
+        """Create new instance of cls from an iterable of args
+
+           This is the same as cls(*args), but args can be any iterable,
+           e.g. a generator.
+        """
+        return cls(*tuple(args), **assumptions)
+
 
     def _new_rawargs(self, *args):
         """create new instance of own class with args exactly as provided by caller
@@ -65,7 +65,8 @@ class Pow(Basic):
 
     is_Pow = True
 
-    __slots__ = ['is_commutative']
+    __slots__ = ['is_commutative', '_fprint']
+    _stores_fprint = True
 
     @cacheit
     def __new__(cls, b, e, **assumptions):
@@ -102,7 +102,8 @@ def Ge(a, b):
 
 class Relational(Basic):
 
-    __slots__ = []
+    __slots__ = ['_fprint']
+    _stores_fprint = True
 
     @staticmethod
     def get_relational_class(rop):
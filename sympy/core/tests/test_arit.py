@@ -1,5 +1,5 @@
 from sympy import Symbol, sin, cos, exp, O, sqrt, Rational, Real, re, pi, \
-        sympify, sqrt, Add, Mul, Pow, I, log
+        sympify, sqrt, Add, Mul, Pow, I, log, oo, nan
 from sympy.utilities.pytest import XFAIL
 
 x = Symbol('x')
@@ -1071,3 +1071,63 @@ def test_Add_as_coeff_terms():
 def test_issue974():
     assert -1/(-1-x)    == 1/(1+x)
 
+
+def test_Add_Mul_fromiter():
+    assert Add.fromiter(i*x**i for i in range(4)) == x + 2*x**2 + 3*x**3
+    assert Add.fromiter([]) == 0
+    assert Add.fromiter([x]) == x
+    assert Add.fromiter([x, O(x**2), 1]) == 1 + x + O(x**2)
+
+    assert Mul.fromiter(x + i for i in range(3)) == x*(x + 1)*(x + 2)
+    assert Mul.fromiter([]) == 1
+    assert Mul.fromiter([2, x, 3*y]) == 6*x*y
+
+def test_AddAccumulator():
+    from sympy.core.add import AddAccumulator
+    terms = [ i*x**i for i in range(20) ] + [ -x**5, y, 2*(x + y), 3 ]
+
+    acc = AddAccumulator()
+    for t in terms:
+        acc.append(t)
+
+    e = acc.as_expr()
+    assert e == Add(*terms)
+    assert e.args == Add(*terms).args
+
+    acc = AddAccumulator()
+    acc.extend([x, -x])
+    assert acc.as_expr() == 0
+
+    acc = AddAccumulator()
+    acc.extend([1, oo, x, y**2])
+    assert acc.as_expr() == oo + y**2 + x
+
+    acc = AddAccumulator()
+    acc.extend([nan, x])
+    assert acc.as_expr() is nan
+
+def test_MulAccumulator():
+    from sympy.core.mul import MulAccumulator
+    A = Symbol('A', commutative=False)
+    B = Symbol('B', commutative=False)
+    factors = [2, x, 3*y, x, A*B, Rational(1, 6), A, x + y]
+
+    acc = MulAccumulator()
+    for f in factors:
+        acc.append(f)
+
+    assert acc.as_expr() == Mul(*factors)
+    assert acc.as_expr() == x**2*y*(x + y)*A*B*A
+
+def test_Accumulator_sympify():
+    from sympy.core.add import AddAccumulator
+    from sympy.core.mul import MulAccumulator
+    from sympy.core.sympify import SympifyError
+    from sympy.utilities.pytest import raises
+
+    # both accept what Add and Mul accept, but not strings
+    for Accumulator in [AddAccumulator, MulAccumulator]:
+        acc = Accumulator()
+        acc.extend([2, 1.5, x])
+        raises(SympifyError, "acc.append('y')")
+        raises(SympifyError, "acc.extend(['y'])")
@@ -472,3 +472,28 @@ def test_hash_vs_eq():
     assert a == b
     assert ha== hb
 
+
+def test_shared_facts():
+    """objects with the same premises share deduced facts until they learn"""
+    # fresh names, so that no other test has taught these symbols anything
+    x = Symbol('x_shared', positive=True)
+    y = Symbol('y_shared', positive=True)
+
+    assert x._assumptions is y._assumptions
+    assert x.assumptions0 == y.assumptions0
+
+    assert x.is_integer == None
+    assert x._assumptions is not y._assumptions
+
+    assert y._assumptions == Symbol('z_shared', positive=True)._assumptions
+    assert 'integer' not in y._assumptions
+
+def test_inprogress():
+    """requests being deduced are not stored in objects"""
+    from sympy.core.assumptions import _a_inprogress
+    x = Symbol('x', positive=True)
+
+    assert not hasattr(x, '_a_inprogress')
+    assert (x + 1).is_positive == True
+    assert (x - 1).is_positive == None
+    assert not _a_inprogress
@@ -1,6 +1,6 @@
 from sympy import Basic, S, Symbol, Real, Integer, Rational,  \
     sin, cos, exp, log, oo, sqrt, symbols, Integral, sympify, \
-    WildFunction, Poly, Function, Derivative, Number, pi, var
+    WildFunction, Poly, Function, Derivative, Number, pi, var, C
 
 from sympy.utilities.pytest import XFAIL, raises
 
@@ -487,6 +487,77 @@ def test_has_all_symbols():
     assert expr.has_all_symbols(x, y, z, t) == True
     assert expr.has_all_symbols(x, y, z, t, u) == False
 
+def test_walk_deep_and_shared():
+    x, y = symbols('xy')
+
+    # deeper than the recursion limit
+    e = x
+    for i in xrange(2000):
+        e = (e + 1)**y
+
+    assert e.atoms() == set([x, y, S.One])
+    assert e.atoms(Symbol) == set([x, y])
+    assert e.has(x) == True
+    assert e.has(sin(y)) == False
+    assert e.has_any_symbols(x) == True
+    assert e.has_all_symbols(x, y) == True
+    assert (x + 1 in e) == True
+
+    # 2**60 paths, but only 121 unique nodes
+    e = x
+    for i in xrange(60):
+        e = Basic.__new__(C.Add, e, Basic.__new__(C.Mul, e, y))
+
+    assert e.atoms() == set([x, y])
+    assert e.has(y) == True
+    assert e.has(sin(y)) == False
+    assert e.has_all_symbols(x, y) == True
+    assert (sin(x) in e) == False
+
+def test_fingerprint():
+    from sympy.core.basic import _fingerprint
+    from sympy import Lambda
+    x, y = symbols('xy')
+
+    assert _fingerprint(x + 1) == _fingerprint(x + 1)
+    assert _fingerprint(x + 1) != _fingerprint(y + 1)
+    assert _fingerprint(x) != _fingerprint(y)
+
+    # fingerprints must agree with ==
+    assert x + 2 == x + Real(2.0)
+    assert _fingerprint(x + 2) == _fingerprint(x + Real(2.0))
+
+    p = Symbol('p', positive=True)
+    q = Symbol('p')
+    assert (p + 1 == q + 1) == (p == q)
+
+    # classes with custom __eq__ don't have a fingerprint
+    t = Symbol('t')
+    assert _fingerprint(Lambda(x, x)) == -1
+    assert sin(Lambda(x, x)) == sin(Lambda(t, t))
+
+    # deeper than the recursion limit
+    a, b = x, x
+    for i in xrange(2000):
+        a = Basic.__new__(C.Pow, a, y)
+        b = Basic.__new__(C.Pow, b, y)
+
+    assert a is not b
+    assert _fingerprint(a) == _fingerprint(b)
+    assert Basic.__new__(C.Pow, a, x) != Basic.__new__(C.Pow, b, y)
+    assert (Basic.__new__(C.Pow, a, x) == Basic.__new__(C.Pow, b, y)) == False
+
+    # nodes without a stored fingerprint, fingerprinted in linear time
+    f = Function('f')
+    a, b = x, x
+    for i in xrange(40):
+        a = Basic.__new__(f, a)
+        b = Basic.__new__(f, b)
+
+    assert a is not b
+    assert _fingerprint(a) == _fingerprint(b)
+    assert a == b and a != Basic.__new__(f, b)
+
 def test_as_poly_basic():
     x, y = symbols('xy')
 
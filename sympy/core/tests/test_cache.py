@@ -1,4 +1,6 @@
-from sympy.core.cache import cacheit
+from sympy.core.cache import cacheit, LRUCache, LFUCache, BoundedCache, \
+        set_cache_size, cache_stats, reset_cache_stats
+from sympy.utilities.pytest import raises
 
 def test_cacheit_doc():
     @cacheit
@@ -8,3 +10,122 @@ def testfn():
 
     assert testfn.__doc__ == "test docstring"
     assert testfn.__name__ == "testfn"
+
+def test_lru_cache():
+    cache = LRUCache(3)
+
+    for i in range(3):
+        cache[i] = -i
+
+    assert cache[0] == 0    # 0 is now most recently used
+
+    cache[3] = -3           # evicts 1
+
+    assert len(cache) == 3
+    assert 1 not in cache
+    assert list(cache.iteritems()) == [(2, -2), (0, 0), (3, -3)]
+
+    cache[2] = 2            # overwriting refreshes the entry
+    cache[4] = -4           # evicts 0
+
+    assert list(cache.iteritems()) == [(3, -3), (2, 2), (4, -4)]
+
+    cache.resize(1)
+    assert list(cache.iteritems()) == [(4, -4)]
+
+    cache.clear()
+    assert len(cache) == 0
+    raises(KeyError, "cache[4]")
+
+    cache = LRUCache(None)
+
+    for i in range(100):
+        cache[i] = i
+
+    assert len(cache) == 100
+
+def test_lfu_cache():
+    cache = LFUCache(8)
+
+    for i in range(8):
+        cache[i] = -i
+
+    for i in range(4):
+        for j in range(i+1):
+            cache[i]
+
+    cache[8] = -8
+
+    assert len(cache) <= 8
+    assert 8 in cache
+    assert 0 in cache and 1 in cache and 2 in cache and 3 in cache
+    assert cache[8] == -8
+
+    cache.resize(2)
+    assert len(cache) == 2
+    assert 3 in cache
+
+def test_set_cache_size():
+    def f(x):
+        return x
+
+    raises(ValueError, "set_cache_size(f, 10)")
+
+    @cacheit
+    def g(x):
+        return x
+
+    if isinstance(g._cache_it_cache, BoundedCache):
+        set_cache_size(g, 2)
+
+        for i in range(10):
+            assert g(i) == i
+
+        assert len(g._cache_it_cache) == 2
+    else:
+        raises(ValueError, "set_cache_size(g, 2)")
+
+def test_cache_stats():
+    @cacheit
+    def _test_cache_stats_fn(x):
+        return 2*x
+
+    reset_cache_stats()
+
+    for i in range(5):
+        _test_cache_stats_fn(1)
+
+    _test_cache_stats_fn(2)
+
+    for info in cache_stats():
+        if info['name'].endswith('._test_cache_stats_fn') and info['size'] == 2:
+            break
+    else:
+        assert False, "statistics of _test_cache_stats_fn() not found"
+
+    assert info['hits'] == 4
+    assert info['misses'] == 2
+    assert info['evictions'] == 0
+
+    if info['bytes'] is not None:
+        assert info['bytes'] > 0
+
+    reset_cache_stats()
+
+    for info in cache_stats():
+        assert info['hits'] == info['misses'] == info['evictions'] == 0
+
+def test_cache_stats_evictions():
+    cache = LRUCache(2)
+
+    for i in range(5):
+        cache[i] = i
+
+    assert cache.evictions == 3
+
+    cache = LFUCache(8)
+
+    for i in range(9):
+        cache[i] = i
+
+    assert cache.evictions == 2
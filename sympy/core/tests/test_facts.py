@@ -304,6 +304,30 @@ def test_FactRules_deduce_staticext():
     assert 'npos' in f.rel_tt['zero']
 
 
+def test_FactRules_deduce_bits():
+    f = FactRules(['real  == neg | zero | pos',
+                   'neg   -> real & !zero & !pos',
+                   'pos   -> real & !zero & !neg'])
+    D = f.deduce_bits
+    b = f.fact_bits
+
+    assert sorted(b.values()) == [1, 2, 4, 8]
+
+    known, true = D([('pos', T)])
+    assert known == b['real'] | b['neg'] | b['zero'] | b['pos']
+    assert true  == b['real'] | b['pos']
+
+    # beta-rule: real & !neg & !zero -> pos
+    known, true = D([('real', T), ('neg', F)])
+    assert known == b['real'] | b['neg']
+    known, true = D([('zero', F)], known, true)
+    assert known == b['real'] | b['neg'] | b['zero'] | b['pos']
+    assert true  == b['real'] | b['pos']
+
+    raises(AssertionError, "D([('pos', T), ('neg', T)])")
+    raises(AssertionError, "f.deduce_all_facts({'pos': T, 'real': F})")
+
+
 # NOTE: once upon a time there was an idea to intoruce copy-on-write (COW) mode
 # in deduce_all_facts, and also teach it to return list of newly derived knowledge.
 #
@@ -0,0 +1,63 @@
+from sympy import Symbol, Rational, Integer, sin, exp, Add
+from sympy.core.interning import (intern_basic, enable_interning,
+    disable_interning, interning_enabled, clear_interned, interned_count)
+from sympy.core.cache import clear_cache
+
+import gc, pickle, weakref
+
+x, y = Symbol('x'), Symbol('y')
+
+def test_intern_basic():
+    a = intern_basic(sin(x) + y**2)
+    b = intern_basic(sin(x) + y**2)
+
+    assert a is b
+    assert intern_basic(1) == 1
+
+    z = intern_basic(Symbol('z', positive=True))
+
+    assert intern_basic(Symbol('z')) is not z
+    assert intern_basic(Symbol('z', positive=True)) is z
+
+    clear_interned()
+
+def test_interning():
+    was_enabled = interning_enabled()
+    enable_interning()
+
+    try:
+        assert interning_enabled() == True
+
+        a = exp(x)*sin(x + y) + Rational(1, 3)
+        b = exp(x)*sin(x + y) + Rational(1, 3)
+
+        assert a is b
+        assert Add(*a.args) is a
+        assert a == b and not a != b
+
+        assert pickle.loads(pickle.dumps(a)) == a
+
+        clear_interned()
+        a = b = None
+        gc.collect()
+
+        terms = [ sin(x + Integer(i % 10)) for i in xrange(100) ]
+
+        assert terms[3] is terms[13]
+        assert interned_count() < 100
+
+        ref = weakref.ref(terms[3])
+
+        terms = None
+        clear_cache()
+        gc.collect()
+
+        assert ref() is None
+    finally:
+        if not was_enabled:
+            disable_interning()
+
+        clear_interned()
+
+    if not was_enabled:
+        assert interning_enabled() == False
@@ -452,3 +452,46 @@ def test_conversion_to_mpmath():
     assert mpmath.mpmathify(Integer(1)) == mpmath.mpf(1)
     assert mpmath.mpmathify(Rational(1, 2)) == mpmath.mpf(0.5)
     assert mpmath.mpmathify(Real('1.23')) == mpmath.mpf('1.23')
+
+def test_number_caches():
+    from sympy.core.numbers import set_number_caches, number_cache_stats, \
+            reset_number_cache_stats
+
+    def stats():
+        return [ (s['hits'], s['misses'], s['evictions']) for s in number_cache_stats() ]
+
+    assert Integer(0) is S.Zero
+    assert Integer(-256) is Integer(-256)
+    assert Integer(1024) is Integer(1024)
+
+    reset_number_cache_stats()
+    Integer(7)
+    Integer(7L)
+    assert stats()[0] == (2, 0, 0)
+
+    set_number_caches(smallints=(-1, 10), integers=3, rationals=2)
+
+    try:
+        assert Integer(0) is S.Zero
+        assert Integer(1) is S.One
+        assert Integer(-1) is S.NegativeOne
+
+        reset_number_cache_stats()
+
+        for i in [100, 101, 102, 100, 103, 104]:
+            assert Integer(i).p == i
+
+        assert stats()[0] == (1, 5, 3)
+        assert number_cache_stats()[0]['size'] == 2
+
+        assert Rational(1, 3) is Rational(1, 3)
+        assert Rational(2, 6) == Rational(1, 3)
+        Rational(1, 5)
+
+        assert stats()[1] == (2, 3, 2)
+        assert number_cache_stats()[1]['size'] == 1
+    finally:
+        set_number_caches(smallints=(-256, 1024), integers=10000, rationals=10000)
+
+    assert Integer(0) is S.Zero
+    assert Integer(1024) is Integer(1024)
@@ -300,3 +300,28 @@ def test_functions_subs():
     assert (f(x,y)).subs(f,sin) == f(x,y)
     assert (sin(x)+atan2(x,y)).subs([[atan2,f],[sin,g]]) == f(x,y) + g(x)
     assert (g(f(x+y, x))).subs([[f, l], [g, exp]]) == exp(x + sin(x + y))
+
+def test_subs_simultaneous():
+    x, y, z = symbols('xyz')
+    f = Function('f')
+
+    assert (x*y**2).subs({x: y, y: x}, simultaneous=True) == y*x**2
+    assert (x + 2*y).subs({x: y, y: z}, simultaneous=True) == y + 2*z
+    assert (f(x) + sin(y)).subs({x: y, y: x}, simultaneous=True) == f(y) + sin(x)
+
+    assert (sin(x + y) + x + y).subs({x + y: z}, simultaneous=True) == \
+        x + y + sin(z)
+
+    e = exp(x)*sqrt(x**2 + y)
+    assert e.subs({x: 1, y: 3}) == 2*exp(1)
+    assert e.subs({x: 1, y: 3}, simultaneous=True) == 2*exp(1)
+
+    from sympy import Integral
+    e = Integral(x*y, (x, 0, y))
+    assert e.subs({y: z, z: y}, simultaneous=True) == Integral(x*z, (x, 0, z))
+
+    X = [ Symbol('a%d' % i) for i in range(20) ]
+    e = Add(*[ X[i]*X[(i + 1) % 20]**2 for i in range(20) ])
+    d = dict([ (X[i], i) for i in range(20) ])
+    assert e.subs(d) == e._subs_list(d.items()) == \
+        sum([ i*((i + 1) % 20)**2 for i in range(20) ])
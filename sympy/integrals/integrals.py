@@ -60,7 +60,15 @@ def __new__(cls, function, *symbols, **assumptions):
 
     def __getnewargs__(self):
         function, limits = self.args
-        return (function,) + limits
+        newargs = [function]
+
+        for x, ab in limits:
+            if ab is None:
+                newargs.append(x)
+            else:
+                newargs.append((x,) + ab)
+
+        return tuple(newargs)
 
     @property
     def function(self):
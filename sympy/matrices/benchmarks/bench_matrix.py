@@ -1,8 +1,30 @@
-from sympy import eye, zeros, Integer
+from sympy import eye, zeros, Integer, Matrix, Symbol, symbols
 
 i3 = Integer(3)
 M  = eye(100)
 
+# dense integer matrix, handled by sympy.matrices.exact
+A  = Matrix(30, 30, lambda i, j: (7*i + 11*j + i*j) % 19 - 9 + 100*(i == j))
+b  = Matrix(30, 1, lambda i, j: i - 15)
+
+# many right hand sides for the same matrix, solved with a cached factorization
+C  = [ Matrix(30, 1, lambda i, j: (i*k) % 13 - 6) for k in range(20) ]
+
+# dense integer matrices of growing size, 500 x 500 uses Strassen's algorithm
+D50  = Matrix(50, 50, lambda i, j: (i*j + 3*i - j) % 23 - 11)
+D200 = Matrix(200, 200, lambda i, j: (i*j + 3*i - j) % 23 - 11)
+D500 = Matrix(500, 500, lambda i, j: (i*j + 3*i - j) % 23 - 11)
+
+# symbolic matrices, dense and with many zeros
+x, y = symbols('xy')
+S20 = Matrix(20, 20, lambda i, j: x**(i % 4) + (j - i)*y)
+Z20 = Matrix(20, 20, lambda i, j: (x + j*y)*((i + j) % 4 == 0))
+
+# polynomial matrices, for characteristic polynomials and eigenvalues
+t = Symbol('t')
+P10 = Matrix(10, 10, lambda i, j: ((i + 2*j) % 5 - 2)*x**((i*j) % 3) + (i == j)*y)
+B8 = Matrix(8, 8, lambda i, j: (i // 2 == j // 2)*(x + i // 2 + (i != j)*(y - x - i // 2)))
+
 
 def timeit_Matrix__getitem_ii():
     M[3,3]
@@ -15,3 +37,46 @@ def timeit_Matrix__getslice():
 
 def timeit_Matrix_zeronm():
     zeros((100, 100))
+
+def timeit_Matrix_det_integer():
+    A.det()
+
+def timeit_Matrix_LUsolve_integer():
+    A.LUsolve(b)
+
+def timeit_Matrix_mul_integer_50():
+    D50*D50
+
+def timeit_Matrix_mul_integer_200():
+    D200*D200
+
+def timeit_Matrix_mul_integer_500():
+    D500*D500
+
+def timeit_Matrix_mul_symbolic_20():
+    S20*S20
+
+def timeit_Matrix_mul_symbolic_sparse_20():
+    Z20*Z20
+
+def timeit_Matrix_charpoly_integer():
+    A.charpoly(x)
+
+def timeit_Matrix_berkowitz_charpoly_integer():
+    A.berkowitz_charpoly(x)
+
+def timeit_Matrix_charpoly_symbolic_10():
+    P10.charpoly(t)
+
+def timeit_Matrix_berkowitz_charpoly_symbolic_10():
+    P10.berkowitz_charpoly(t)
+
+def timeit_Matrix_eigenvals_symbolic_block_8():
+    B8.eigenvals()
+
+def timeit_Matrix_berkowitz_eigenvals_symbolic_block_8():
+    B8.berkowitz_eigenvals()
+
+def timeit_Matrix_LUsolve_integer_many():
+    for c in C:
+        A.LUsolve(c)
@@ -0,0 +1,799 @@
+"""Exact linear algebra over integers and rationals.
+
+Matrices in which all entries are Integers or Rationals (very common in
+practice) don't need general symbolic arithmetic. Routines in this module
+work on lists of rows of raw Python integers, converting to SymPy numbers
+only at the end, which is many times faster than building Add and Mul
+objects for every operation. Rational matrices are handled by clearing
+denominators of every row first, so no fractions are involved in inner
+loops, and fraction-free algorithms keep all intermediate values integral.
+
+Matrix methods (det, rref, inv, LUsolve, LUdecomposition, multiplication)
+use these routines automatically for numeric matrices. Functions here take
+and return lists of rows of Python integers, unless stated otherwise.
+"""
+
+from itertools import izip, imap
+from operator import add, sub, mul
+
+from sympy.core.numbers import Integer, Rational, igcd, ilcm
+
+# Strassen's algorithm is used for products of matrices with all dimensions
+# at least STRASSEN_THRESHOLD, recursing down to STRASSEN_CUTOFF. Below that,
+# the classical algorithm (with dot products computed in C) is faster.
+STRASSEN_THRESHOLD = 256
+STRASSEN_CUTOFF = 128
+
+def is_exact(mat):
+    """Returns True if all entries of a flat list mat are rational numbers. """
+    for a in mat:
+        if not a.is_Rational:
+            return False
+
+    return True
+
+def to_int_rows(mat, rows, cols):
+    """Converts a flat list of rational numbers to integer rows.
+
+       Every row is multiplied by the least common multiple of denominators
+       of its entries. Returns (rows, denominators), where denominators is
+       the list of these multipliers.
+    """
+    M, dens = [], []
+
+    for i in xrange(0, rows*cols, cols):
+        row = mat[i:i+cols]
+        den = 1
+
+        for a in row:
+            if a.q != 1:
+                den = ilcm(den, a.q)
+
+        if den == 1:
+            M.append([ a.p for a in row ])
+        else:
+            M.append([ a.p*(den // a.q) for a in row ])
+
+        dens.append(den)
+
+    return M, dens
+
+def to_rational(p, q=1):
+    """Returns Rational p/q, for Python integers p and q. """
+    if q == 1:
+        return Integer(p)
+
+    if q < 0:
+        p, q = -p, -q
+
+    g = igcd(p, q)
+
+    if g != 1:
+        p //= g
+        q //= g
+
+    if q == 1:
+        return Integer(p)
+    else:
+        return Rational(p, q)
+
+def _bareiss(M, n):
+    """Fraction-free forward elimination in the first n columns of M.
+
+       M is modified in place and becomes upper triangular (in the first n
+       columns), with M[n-1][n-1] equal to the determinant of its leading
+       n x n block (up to sign). Returns the sign (-1 or 1) of the row
+       permutation, or 0 if the leading block is singular.
+    """
+    sign, prev = 1, 1
+
+    for k in xrange(n-1):
+        if not M[k][k]:
+            for i in xrange(k+1, n):
+                if M[i][k]:
+                    M[k], M[i] = M[i], M[k]
+                    sign = -sign
+                    break
+            else:
+                return 0
+
+        pivot_row = M[k][k+1:]
+        pivot = M[k][k]
+
+        for i in xrange(k+1, len(M)):
+            row = M[i]
+            a = row[k]
+
+            if a:
+                row[k+1:] = [ (pivot*b - a*c) // prev for b, c in izip(row[k+1:], pivot_row) ]
+                row[k] = 0
+            elif pivot != prev:
+                row[k+1:] = [ (pivot*b) // prev for b in row[k+1:] ]
+
+        prev = pivot
+
+    if not M[n-1][n-1]:
+        return 0
+
+    return sign
+
+def det_bareiss(M):
+    """Determinant of a square integer matrix by Bareiss' algorithm.
+
+       Fraction-free Gaussian elimination: all divisions are exact, and
+       intermediate values are minors of M, so they stay small.
+
+       >>> from sympy.matrices.exact import det_bareiss
+       >>> det_bareiss([[2, 1, 3], [1, 0, 1], [4, 2, 7]])
+       -1
+
+    """
+    n = len(M)
+
+    if not n:
+        return 1
+
+    M = [ list(row) for row in M ]
+    sign = _bareiss(M, n)
+
+    return sign*M[n-1][n-1]
+
+def _det_mod(M, p):
+    """Determinant of a square integer matrix modulo prime p. """
+    n = len(M)
+    M = [ [ a % p for a in row ] for row in M ]
+    det = 1
+
+    for k in xrange(n):
+        for i in xrange(k, n):
+            if M[i][k]:
+                break
+        else:
+            return 0
+
+        if i != k:
+            M[k], M[i] = M[i], M[k]
+            det = -det
+
+        pivot = M[k][k]
+        det = det*pivot % p
+
+        inv = pow(pivot, p-2, p)
+        pivot_row = [ a*inv % p for a in M[k][k+1:] ]
+
+        for i in xrange(k+1, n):
+            row = M[i]
+            a = row[k]
+
+            if a:
+                M[i][k+1:] = [ (b - a*c) % p for b, c in izip(row[k+1:], pivot_row) ]
+
+    return det % p
+
+def det_modular(M):
+    """Determinant of a square integer matrix by modular method.
+
+       Determinants modulo word sized primes are combined by the Chinese
+       remainder theorem, until their product exceeds twice the Hadamard
+       bound of the determinant.
+
+       >>> from sympy.matrices.exact import det_modular
+       >>> det_modular([[2, 1, 3], [1, 0, 1], [4, 2, 7]])
+       -1
+
+    """
+    from sympy.ntheory import prevprime
+    from sympy.ntheory.modular import crt
+
+    n = len(M)
+
+    if not n:
+        return 1
+
+    # Hadamard bound, squared
+    bound = 1
+
+    for row in M:
+        bound *= sum([ a*a for a in row ])
+
+    if not bound:
+        return 0
+
+    primes, residues = [], []
+    p, m = 2**31, 1
+
+    while m*m <= 4*bound:
+        p = prevprime(p)
+        primes.append(p)
+        residues.append(_det_mod(M, p))
+        m *= p
+
+    return crt(primes, residues, symmetric=True)
+
+def _dot(u, v, add, mul, zero):
+    s = zero
+
+    for a, b in izip(u, v):
+        s = add(s, mul(a, b))
+
+    return s
+
+def berkowitz(M, add, mul, neg, zero, one):
+    """Coefficients of the characteristic polynomial det(t*I - M).
+
+       Berkowitz' algorithm doesn't divide, so M can be a matrix over any
+       commutative ring, given by functions add, mul, neg and elements zero
+       and one, e.g. polynomials in dense representation. Returns the list
+       of coefficients, leading one first.
+
+       >>> from operator import add, mul, neg
+       >>> from sympy.matrices.exact import berkowitz
+       >>> berkowitz([[1, 2], [3, 4]], add, mul, neg, 0, 1)
+       [1, -5, -2]
+
+    """
+    n = len(M)
+
+    if not n:
+        return [one]
+
+    poly = [one, neg(M[0][0])]
+
+    for k in xrange(1, n):
+        # characteristic polynomial of the leading (k+1) x (k+1) block is
+        # T*poly, where T is a Toeplitz matrix with the first column
+        # 1, -M[k][k], -R*C, -R*A*C, ..., -R*A**(k-1)*C
+        A = [ M[i][:k] for i in xrange(k) ]
+        R = M[k][:k]
+        C = [ M[i][k] for i in xrange(k) ]
+
+        items = [one, neg(M[k][k])]
+
+        for i in xrange(k):
+            items.append(neg(_dot(R, C, add, mul, zero)))
+
+            if i < k - 1:
+                C = [ _dot(row, C, add, mul, zero) for row in A ]
+
+        poly = [ _dot(items[i::-1], poly[:i+1], add, mul, zero)
+            for i in xrange(k + 2) ]
+
+    return poly
+
+def _charpoly_mod(M, p):
+    """Characteristic polynomial of an integer matrix modulo prime p.
+
+       M is reduced to upper Hessenberg form H by similarity transforms,
+       then the characteristic polynomials of leading blocks of H satisfy
+       a recurrence, which costs O(n**3) operations in total.
+    """
+    n = len(M)
+    H = [ [ a % p for a in row ] for row in M ]
+
+    for m in xrange(1, n - 1):
+        for i in xrange(m, n):
+            if H[i][m-1]:
+                break
+        else:
+            continue
+
+        if i != m:
+            H[m], H[i] = H[i], H[m]
+
+            for row in H:
+                row[m], row[i] = row[i], row[m]
+
+        inv = pow(H[m][m-1], p - 2, p)
+        pivot_row = H[m]
+
+        for i in xrange(m + 1, n):
+            u = H[i][m-1]*inv % p
+
+            if u:
+                H[i] = [ (a - u*b) % p for a, b in izip(H[i], pivot_row) ]
+
+                for row in H:
+                    row[m] = (row[m] + u*row[i]) % p
+
+    # polys[k] is the characteristic polynomial of the leading k x k
+    # block of H, lowest degree first
+    polys = [[1]]
+
+    for k in xrange(1, n + 1):
+        h = H[k-1][k-1]
+        prev = polys[k-1]
+
+        poly = [0] + prev
+        for i, a in enumerate(prev):
+            poly[i] = (poly[i] - h*a) % p
+
+        prod = 1
+
+        for i in xrange(1, k):
+            prod = prod*H[k-i][k-i-1] % p
+
+            if not prod:
+                break
+
+            c = prod*H[k-i-1][k-1] % p
+
+            if c:
+                for j, a in enumerate(polys[k-i-1]):
+                    poly[j] = (poly[j] - c*a) % p
+
+        polys.append(poly)
+
+    poly = polys[n]
+    poly.reverse()
+
+    return poly
+
+def charpoly_modular(M):
+    """Characteristic polynomial of a square integer matrix.
+
+       Returns the list of coefficients of det(t*I - M), leading one first.
+       Characteristic polynomials modulo word sized primes (computed via
+       Hessenberg form) are combined by the Chinese remainder theorem.
+
+       >>> from sympy.matrices.exact import charpoly_modular
+       >>> charpoly_modular([[1, 2], [3, 4]])
+       [1, -5, -2]
+
+    """
+    from sympy.ntheory import prevprime
+    from sympy.ntheory.modular import crt
+
+    n = len(M)
+
+    if not n:
+        return [1]
+
+    # coefficients are sums of principal minors, which are bounded by
+    # products of norms of rows, so |c_k| <= (1 + B)**n, where B is the
+    # maximum norm of a row; the squared bound is used
+    B = 0
+
+    for row in M:
+        B = max(B, sum([ a*a for a in row ]))
+
+    bound = (2 + 2*B)**n
+
+    primes, residues = [], []
+    p, m = 2**31, 1
+
+    while m*m <= 4*bound:
+        p = prevprime(p)
+        primes.append(p)
+        residues.append(_charpoly_mod(M, p))
+        m *= p
+
+    return [ crt(primes, list(r), symmetric=True) for r in izip(*residues) ]
+
+def rref_ff(M):
+    """Fraction-free Gauss-Jordan elimination of an integer matrix.
+
+       Returns (R, pivots, d), where R is an integer matrix, such that R/d is
+       the reduced row-echelon form of M and pivots is the list of indices
+       of pivot columns. All entries of R are (up to sign) minors of M.
+
+       >>> from sympy.matrices.exact import rref_ff
+       >>> rref_ff([[1, 2, 3], [4, 5, 6]])
+       ([[-3, 0, 3], [0, -3, -6]], [0, 1], -3)
+
+    """
+    M = [ list(row) for row in M ]
+    rows = len(M)
+
+    if rows:
+        cols = len(M[0])
+    else:
+        cols = 0
+
+    pivots = []
+    prev, r = 1, 0
+
+    for c in xrange(cols):
+        if r == rows:
+            break
+
+        for i in xrange(r, rows):
+            if M[i][c]:
+                break
+        else:
+            continue
+
+        if i != r:
+            M[r], M[i] = M[i], M[r]
+
+        pivot_row = M[r]
+        pivot = pivot_row[c]
+
+        for i in xrange(rows):
+            if i == r:
+                continue
+
+            row = M[i]
+            a = row[c]
+
+            if a:
+                M[i] = [ (pivot*b - a*e) // prev for b, e in izip(row, pivot_row) ]
+            elif pivot != prev:
+                M[i] = [ (pivot*b) // prev for b in row ]
+
+        pivots.append(c)
+        prev = pivot
+        r += 1
+
+    return M, pivots, prev
+
+def rref(mat, rows, cols):
+    """Reduced row-echelon form of a flat list of rational numbers.
+
+       Returns (flat list of Rationals, pivots).
+    """
+    M, dens = to_int_rows(mat, rows, cols)
+    R, pivots, d = rref_ff(M)
+
+    result = []
+
+    for row in R:
+        result.extend([ to_rational(a, d) for a in row ])
+
+    return result, pivots
+
+def solve(mat, rhs, n, m):
+    """Solves A*X = B, for A n x n and B n x m, given as flat lists.
+
+       Returns the solution as a flat list of Rationals, or None if A is
+       singular. After fraction-free elimination, X = Y/d, where d is the
+       last pivot (the determinant, up to row scaling) and Y is integral
+       by Cramer's rule, so back substitution is done in integers, too.
+    """
+    aug = []
+
+    for i in xrange(n):
+        aug.extend(mat[i*n:(i+1)*n])
+        aug.extend(rhs[i*m:(i+1)*m])
+
+    M, dens = to_int_rows(aug, n, n+m)
+
+    if not n or not _bareiss(M, n):
+        return None
+
+    d = M[n-1][n-1]
+    Y = []
+
+    for c in xrange(n, n+m):
+        y = [0]*n
+
+        for i in xrange(n-1, -1, -1):
+            row = M[i]
+            s = d*row[c]
+
+            for a, b in izip(row[i+1:n], y[i+1:]):
+                if a and b:
+                    s -= a*b
+
+            y[i] = s // row[i]
+
+        Y.append(y)
+
+    result = []
+
+    for i in xrange(n):
+        result.extend([ to_rational(y[i], d) for y in Y ])
+
+    return result
+
+def det(mat, n, method="bareiss"):
+    """Determinant of a flat list of rational numbers, as a Rational. """
+    M, dens = to_int_rows(mat, n, n)
+
+    if method == "modular":
+        d = det_modular(M)
+    else:
+        d = det_bareiss(M)
+
+    den = 1
+
+    for q in dens:
+        den *= q
+
+    return to_rational(d, den)
+
+def charpoly(mat, n):
+    """Characteristic polynomial of a flat list of rational numbers.
+
+       Returns (F, d), where d is the least common multiple of denominators
+       of entries and F is the list of (integer) coefficients of the
+       characteristic polynomial of d*M, leading one first. Coefficients
+       of the characteristic polynomial of M are F[k]/d**k.
+    """
+    d = 1
+
+    for a in mat:
+        if a.q != 1:
+            d = ilcm(d, a.q)
+
+    M = [ [ a.p*(d // a.q) for a in mat[i:i+n] ] for i in xrange(0, n*n, n) ]
+
+    return charpoly_modular(M), d
+
+class FractionFreeLU(object):
+    """Fraction-free LU factorization of a square rational matrix.
+
+       mat is a flat list of Rationals (n x n). Rows are scaled to integers
+       and Bareiss' elimination is run once, recording row swaps in perm
+       (as Matrix.LUdecomposition_Simple does). In the resulting integer
+       matrix M, the upper triangle is the fraction-free U and entries below
+       the diagonal are the multipliers of every elimination step, i.e. the
+       fraction-free L. Solving a system then only repeats the elimination
+       on the right hand side and substitutes back, which takes O(n**2)
+       operations. ValueError is raised if the matrix is singular.
+
+       >>> from sympy import S
+       >>> from sympy.matrices.exact import FractionFreeLU
+       >>> lu = FractionFreeLU([S(2), S(1), S(4), S(3)], 2)
+       >>> lu.solve([S(1), S(1)])
+       [1, -1]
+       >>> lu.solve_many([S(1), S(0), S(0), S(1)], 2)
+       [3/2, -1/2, -2, 1]
+
+    """
+
+    def __init__(self, mat, n):
+        M, dens = to_int_rows(mat, n, n)
+        perm, prev = [], 1
+
+        for k in xrange(n):
+            for i in xrange(k, n):
+                if M[i][k]:
+                    break
+            else:
+                raise ValueError("Matrix is singular")
+
+            if i != k:
+                M[k], M[i] = M[i], M[k]
+                perm.append([i, k])
+
+            pivot_row = M[k]
+            pivot = pivot_row[k]
+
+            for i in xrange(k+1, n):
+                row = M[i]
+                a = row[k]
+
+                if a:
+                    row[k+1:] = [ (pivot*b - a*c) // prev for b, c in izip(row[k+1:], pivot_row[k+1:]) ]
+                elif pivot != prev:
+                    row[k+1:] = [ (pivot*b) // prev for b in row[k+1:] ]
+
+            prev = pivot
+
+        self.n, self.M, self.dens, self.perm = n, M, dens, perm
+
+    def _permute(self, b):
+        b = list(b)
+
+        for i, k in self.perm:
+            b[k], b[i] = b[i], b[k]
+
+        return b
+
+    def combined(self):
+        """Returns L and U combined (L's diagonal entries are 1) as a flat
+           list of Rationals, like Matrix.LUdecomposition_Simple does.
+        """
+        n, M = self.n, self.M
+
+        # rows were scaled, undo it in U (L is not affected, as the
+        # multipliers are invariant under row scaling up to the pivot row)
+        scale = self._permute(self.dens)
+
+        combined = []
+
+        for i in xrange(n):
+            row = M[i]
+
+            if i:
+                prev = M[i-1][i-1]
+            else:
+                prev = 1
+
+            for j in xrange(n):
+                if j < i:
+                    # L[i,j] = m_ij * s_i/s_j, with rows i and j scaled by s
+                    combined.append(to_rational(row[j]*scale[j], M[j][j]*scale[i]))
+                else:
+                    combined.append(to_rational(row[j], prev*scale[i]))
+
+        return combined
+
+    def solve_many(self, rhs, m):
+        """Solves A*X = B, for B n x m given as a flat list of Rationals.
+
+           Returns X as a flat list of Rationals. Every column is scaled to
+           integers and eliminated the same way as A was, then X = Y/d, where
+           d is the last pivot and Y is integral by Cramer's rule.
+        """
+        n, M = self.n, self.M
+
+        if not n:
+            return []
+
+        d = M[n-1][n-1]
+        Y = []
+
+        for c in xrange(m):
+            column = rhs[c::m]
+            den = 1
+
+            for b in column:
+                if b.q != 1:
+                    den = ilcm(den, b.q)
+
+            y = self._permute([ b.p*(den // b.q)*s
+                for b, s in izip(column, self.dens) ])
+
+            prev = 1
+
+            for k in xrange(n-1):
+                pivot = M[k][k]
+                a = y[k]
+
+                for i in xrange(k+1, n):
+                    l = M[i][k]
+
+                    if l and a:
+                        y[i] = (pivot*y[i] - l*a) // prev
+                    elif pivot != prev:
+                        y[i] = (pivot*y[i]) // prev
+
+                prev = pivot
+
+            for i in xrange(n-1, -1, -1):
+                row = M[i]
+                s = d*y[i]
+
+                for a, b in izip(row[i+1:], y[i+1:]):
+                    if a and b:
+                        s -= a*b
+
+                y[i] = s // row[i]
+
+            Y.append((y, d*den))
+
+        result = []
+
+        for i in xrange(n):
+            result.extend([ to_rational(y[i], q) for y, q in Y ])
+
+        return result
+
+    def solve(self, b):
+        """Solves A*x = b, for b given as a list of Rationals. """
+        return self.solve_many(b, 1)
+
+def lu(mat, n):
+    """LU decomposition of a flat list of rational numbers.
+
+       Returns (combined, perm) as Matrix.LUdecomposition_Simple does, with
+       combined as a flat list of Rationals, or None if the matrix is
+       singular. Multipliers are obtained from a fraction-free elimination:
+       L[i,k] = M[i][k]/M[k][k] and U[k,j] = M[k][j]/(previous pivot),
+       where M is the Bareiss matrix in step k.
+    """
+    try:
+        lu = FractionFreeLU(mat, n)
+    except ValueError:
+        return None
+
+    return lu.combined(), lu.perm
+
+def _multiply(A, BT):
+    """Product of integer matrices A and B, given by rows of its transpose. """
+    C = []
+
+    for row in A:
+        nonzero = [ (j, a) for j, a in enumerate(row) if a ]
+
+        if 2*len(nonzero) < len(row):
+            C.append([ sum([ a*col[j] for j, a in nonzero ]) for col in BT ])
+        else:
+            C.append([ sum(imap(mul, row, col)) for col in BT ])
+
+    return C
+
+def _add(A, B):
+    return [ map(add, a, b) for a, b in izip(A, B) ]
+
+def _sub(A, B):
+    return [ map(sub, a, b) for a, b in izip(A, B) ]
+
+def _strassen(A, B, n):
+    """Product of n x n integer matrices by Strassen's algorithm.
+
+       Halves are multiplied recursively, with 7 products instead of 8,
+       until n is at most STRASSEN_CUTOFF (or odd), where the classical
+       algorithm takes over.
+    """
+    if n <= STRASSEN_CUTOFF or n % 2:
+        return _multiply(A, zip(*B))
+
+    h = n // 2
+
+    A11, A12 = [ r[:h] for r in A[:h] ], [ r[h:] for r in A[:h] ]
+    A21, A22 = [ r[:h] for r in A[h:] ], [ r[h:] for r in A[h:] ]
+    B11, B12 = [ r[:h] for r in B[:h] ], [ r[h:] for r in B[:h] ]
+    B21, B22 = [ r[:h] for r in B[h:] ], [ r[h:] for r in B[h:] ]
+
+    M1 = _strassen(_add(A11, A22), _add(B11, B22), h)
+    M2 = _strassen(_add(A21, A22), B11, h)
+    M3 = _strassen(A11, _sub(B12, B22), h)
+    M4 = _strassen(A22, _sub(B21, B11), h)
+    M5 = _strassen(_add(A11, A12), B22, h)
+    M6 = _strassen(_sub(A21, A11), _add(B11, B12), h)
+    M7 = _strassen(_sub(A12, A22), _add(B21, B22), h)
+
+    C11 = _add(_sub(_add(M1, M4), M5), M7)
+    C12 = _add(M3, M5)
+    C21 = _add(M2, M4)
+    C22 = _add(_add(_sub(M1, M2), M3), M6)
+
+    return [ a + b for a, b in izip(C11, C12) ] + \
+           [ a + b for a, b in izip(C21, C22) ]
+
+def multiply_strassen(A, B):
+    """Product of integer matrices A and B by Strassen's algorithm.
+
+       Matrices are padded with zeros to a square of size c*2**k, with c at
+       most STRASSEN_CUTOFF, so that halving never leaves odd sizes.
+
+       >>> from sympy.matrices.exact import multiply_strassen
+       >>> multiply_strassen([[1, 2], [3, 4]], [[5, 6], [7, 8]])
+       [[19, 22], [43, 50]]
+
+    """
+    m, k, n = len(A), len(B), len(B[0])
+
+    size = max(m, k, n)
+    c, e = size, 1
+
+    while c > STRASSEN_CUTOFF:
+        c = (c + 1) // 2
+        e *= 2
+
+    size = c*e
+
+    A = [ list(row) + [0]*(size - k) for row in A ] + [[0]*size]*(size - m)
+    B = [ list(row) + [0]*(size - n) for row in B ] + [[0]*size]*(size - k)
+
+    return [ row[:n] for row in _strassen(A, B, size)[:m] ]
+
+def multiply(A, B, m, k, n):
+    """Product of flat lists of rational numbers A (m x k) and B (k x n).
+
+       Strassen's algorithm is used if all dimensions are at least
+       STRASSEN_THRESHOLD, otherwise the classical one.
+    """
+    rows, rdens = to_int_rows(A, m, k)
+
+    # columns of B are turned into rows of its transpose
+    BT = []
+
+    for j in xrange(n):
+        BT.extend([ B[i*n + j] for i in xrange(k) ])
+
+    cols, cdens = to_int_rows(BT, n, k)
+
+    if min(m, k, n) >= STRASSEN_THRESHOLD:
+        C = multiply_strassen(rows, zip(*cols))
+    else:
+        C = _multiply(rows, cols)
+
+    result = []
+
+    for row, rd in izip(C, rdens):
+        result.extend([ to_rational(a, rd*cd) for a, cd in izip(row, cdens) ])
+
+    return result
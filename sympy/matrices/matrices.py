@@ -1,11 +1,19 @@
 import warnings
-from sympy import Basic, Symbol, Integer
+from sympy import Basic, Symbol, Integer, Add
 from sympy.core import sympify
 
 from sympy.core.basic import S, C
-from sympy.polys import Poly, roots
+from sympy.core.cache import cacheit
+from sympy.core.numbers import ilcm
+from sympy.polys import Poly, PolynomialError, roots
+from sympy.polys.integerpolys import zzX_zero, zzX_const, zzX_add, \
+     zzX_mul, zzX_neg, zzX_from_dict, zzx_to_poly, zzX_to_poly, \
+     zzx_factor, zzX_factor
 from sympy.simplify import simplify
 
+import exact
+import sparse
+
 # from sympy.printing import StrPrinter /cyclic/
 
 import random
@@ -49,6 +57,12 @@ def _dims_to_nm( dims ):
 def _iszero(x):
     return x == 0
 
+def _cancel(x):
+    if x.is_Atom:
+        return x
+    else:
+        return Poly.cancel(x)
+
 class DeferredVector(object):
     def __init__(self,name):
         self.name=name
@@ -166,6 +180,15 @@ def key2ij(self,key):
             raise IndexError("Index out of range: a[%s]"%repr(key))
         return i,j
 
+    def _is_exact(self):
+        """Returns True if all entries are rational numbers.
+
+           Such matrices are handled by sympy.matrices.exact. Empty
+           matrices are left to the general algorithms.
+        """
+        return type(self.mat) is list and len(self.mat) > 0 and \
+            exact.is_exact(self.mat)
+
     def transpose(self):
         """
         Matrix transposition.
@@ -409,7 +432,7 @@ def __pow__(self, num):
             n = int(num)
             if n < 0:
                 return self.inv() ** -n   # A**-2 = (A**-1)**2
-            a = eye(self.cols)
+            a = self.eye(self.cols)
             while n:
                 if n % 2:
                     a = a * self
@@ -708,7 +731,7 @@ def slice2bounds(self, key, defmax):
         else:
             raise IndexError("Improper index type")
 
-    def applyfunc(self, f):
+    def applyfunc(self, f, parallel=False):
         """
         >>> from sympy import *
         >>> m = Matrix(2,2,lambda i,j: i*2+j)
@@ -718,9 +741,20 @@ def applyfunc(self, f):
         >>> m.applyfunc(lambda i: 2*i)  #doctest: +NORMALIZE_WHITESPACE
         [0, 2]
         [4, 6]
+
+        If parallel is True, or the number of processes, f is applied to
+        elements in parallel (see sympy.utilities.parallel).
         """
         assert callable(f)
-        out = Matrix(self.lines,self.cols,map(f,self.mat))
+        if parallel:
+            from sympy.utilities.parallel import parallel_map
+            if parallel is True:
+                mat = parallel_map(f, self.mat)
+            else:
+                mat = parallel_map(f, self.mat, parallel)
+        else:
+            mat = map(f, self.mat)
+        out = Matrix(self.lines,self.cols,mat)
         return out
 
     def evalf(self, prec=None, **options):
@@ -780,27 +814,47 @@ def LUsolve(self, rhs, iszerofunc=_iszero):
         """
         Solve the linear system Ax = b.
         self is the coefficient matrix A and rhs is the right side b.
+
+        The factorization of self is cached (see LUfactorization()), so
+        solving another system with the same coefficient matrix costs only
+        O(n**2) operations.
         """
         assert rhs.lines == self.lines
-        A, perm = self.LUdecomposition_Simple(iszerofunc=_iszero)
-        n = self.lines
-        b = rhs.permuteFwd(perm)
-        # forward substitution, all diag entries are scaled to 1
-        for i in range(n):
-            for j in range(i):
-                b.row(i, lambda x,k: x - b[j,k]*A[i,j])
-        # backward substitution
-        for i in range(n-1,-1,-1):
-            for j in range(i+1, n):
-                b.row(i, lambda x,k: x - b[j,k]*A[i,j])
-            b.row(i, lambda x,k: x / A[i,i])
-        return b
+        return self.LUfactorization(iszerofunc).solve_many(rhs)
+
+    def LUfactorization(self, iszerofunc=_iszero):
+        """
+        Returns the LU factorization of self, as an LUFactorization object.
+
+        Factorizations are cached by content of the matrix, so this is
+        cheap for a matrix which was factorized before (or any matrix
+        with the same entries), as long as it wasn't modified since.
+
+        >>> from sympy import *
+        >>> lu = Matrix([[2, 1], [4, 3]]).LUfactorization()
+        >>> lu.solve([1, 1]).T
+        [1, -1]
+        >>> lu.solve_many(eye(2))  #doctest: +NORMALIZE_WHITESPACE
+        [3/2, -1/2]
+        [ -2,    1]
+
+        """
+        if not self.is_square:
+            raise NonSquareMatrixException()
+
+        if type(self.mat) is list:
+            mat = tuple(self.mat)
+        else:
+            mat = tuple(self.toMatrix().mat)
+
+        return _lu_factorization(mat, self.lines, iszerofunc)
 
     def LUdecomposition(self, iszerofunc=_iszero):
         """
         Returns the decompositon LU and the row swaps p.
         """
-        combined, p = self.LUdecomposition_Simple(iszerofunc=_iszero)
+        lu = self.LUfactorization(iszerofunc)
+        combined, p = lu.combined(), list(lu.perm)
         L = self.zeros(self.lines)
         U = self.zeros(self.lines)
         for i in range(self.lines):
@@ -820,6 +874,11 @@ def LUdecomposition_Simple(self, iszerofunc=_iszero):
         """
         assert self.lines == self.cols
         n = self.lines
+        if self._is_exact():
+            result = exact.lu(self.mat, n)
+            if result is not None:
+                combined, p = result
+                return Matrix(n, n, combined), p
         A = self[:,:]
         p = []
         # factorization
@@ -1111,12 +1170,15 @@ def det(self, method="bareis"):
         Possible values for "method":
           bareis ... det_bareis
           berkowitz ... berkowitz_det
+          modular ... det_modular
         """
 
         if method == "bareis":
             return self.det_bareis()
         elif method == "berkowitz":
             return self.berkowitz_det()
+        elif method == "modular":
+            return self.det_modular()
         else:
             raise ValueError("Determinant method unrecognized")
 
@@ -1133,6 +1195,9 @@ def det_bareis(self):
         if not self.is_square:
             raise NonSquareMatrixException()
 
+        if self._is_exact():
+            return exact.det(self.mat, self.lines)
+
         M, n = self[:,:], self.lines
 
         if n == 1:
@@ -1172,6 +1237,20 @@ def det_bareis(self):
 
         return det.expand()
 
+    def det_modular(self):
+        """Compute matrix determinant of a matrix of rational numbers
+           using modular method: determinants modulo many primes are
+           combined by the Chinese remainder theorem. For other matrices
+           det_bareis() is used.
+        """
+        if not self.is_square:
+            raise NonSquareMatrixException()
+
+        if self._is_exact():
+            return exact.det(self.mat, self.lines, method="modular")
+        else:
+            return self.det_bareis()
+
     def adjugate(self, method="berkowitz"):
         """
         Returns the adjugate matrix.
@@ -1197,6 +1276,10 @@ def inverse_GE(self, iszerofunc=_iszero):
         Calculates the inverse using Gaussian elimination.
         """
         assert self.lines == self.cols
+        if self._is_exact():
+            X = exact.solve(self.mat, self.eye(self.lines).mat, self.lines, self.lines)
+            if X is not None:
+                return Matrix(self.lines, self.lines, X)
         assert self.det() != 0
         big = self.row_join(self.eye(self.lines))
         red = big.rref(iszerofunc=iszerofunc)
@@ -1218,6 +1301,9 @@ def rref(self,simplified=False, iszerofunc=_iszero):
         To simplify elements before finding nonzero pivots set simplified=True
         """
         # TODO: rewrite inverse_GE to use this
+        if self._is_exact():
+            mat, pivotlist = exact.rref(self.mat, self.lines, self.cols)
+            return Matrix(self.lines, self.cols, mat), pivotlist
         pivots, r = 0, self[:,:]        # pivot: index of next row to contain a pivot
         pivotlist = []                  # indices of pivot variables (non-free)
         for i in range(r.cols):
@@ -1377,13 +1463,170 @@ def berkowitz_charpoly(self, x):
         coeffs, monoms = self.berkowitz()[-1], range(self.lines+1)
         return Poly(list(zip(coeffs, reversed(monoms))), x)
 
-    charpoly = berkowitz_charpoly
-
     def berkowitz_eigenvals(self, **flags):
         """Computes eigenvalues of a Matrix using Berkowitz method. """
         return roots(self.berkowitz_charpoly(Symbol('x', dummy=True)), **flags)
 
-    eigenvals = berkowitz_eigenvals
+    def _charpoly_dense(self):
+        """Characteristic polynomial of d*self, with integer coefficients.
+
+           Returns (F, d, gens), where F is the characteristic polynomial
+           of d*self in dense representation (see sympy.polys.integerpolys),
+           in Z[t] if all entries are rational numbers, otherwise in
+           Z[t, gens], where gens are symbols of entries, and d is the least
+           common multiple of denominators of all coefficients of entries.
+           Returns None if some entry isn't a polynomial in gens with
+           rational coefficients.
+
+           Numeric characteristic polynomials are computed modulo primes,
+           via Hessenberg form, and polynomial ones by Berkowitz' algorithm
+           over Z[gens], which is much faster than the same algorithm
+           applied to expressions.
+        """
+        if not self.is_square:
+            raise NonSquareMatrixException()
+
+        n = self.lines
+
+        if self._is_exact():
+            F, d = exact.charpoly(self.mat, n)
+            return F, d, ()
+
+        entries = [ sympify(self[i, j]) for i in xrange(n) for j in xrange(n) ]
+
+        gens = set()
+
+        for a in entries:
+            gens |= a.atoms(Symbol)
+
+        if not gens:
+            return None
+
+        gens = sorted(gens)
+        polys, d = [], 1
+
+        for a in entries:
+            try:
+                f = Poly(a, *gens)
+            except PolynomialError:
+                return None
+
+            for c in f.coeffs:
+                if not c.is_Rational:
+                    return None
+
+                if c.q != 1:
+                    d = ilcm(d, c.q)
+
+            polys.append(f)
+
+        l, M = len(gens), []
+
+        for i in xrange(0, n*n, n):
+            row = []
+
+            for f in polys[i:i+n]:
+                terms = {}
+
+                for monom, c in zip(f.monoms, f.coeffs):
+                    if l == 1:
+                        monom = monom[0]
+
+                    terms[monom] = c.p*(d // c.q)
+
+                row.append(zzX_from_dict(terms, l))
+
+            M.append(row)
+
+        F = exact.berkowitz(M, zzX_add, zzX_mul, zzX_neg,
+            zzX_zero(l), zzX_const(l, 1))
+
+        return F, d, tuple(gens)
+
+    def charpoly(self, x):
+        """Computes characteristic polynomial det(x*I - self).
+
+           Matrices with rational numbers or polynomials with rational
+           coefficients as entries are handled with integer arithmetic,
+           otherwise Berkowitz method is applied to expressions.
+
+           >>> from sympy import *
+           >>> x, y = symbols('xy')
+
+           >>> Matrix([[1, 2], [3, 4]]).charpoly(x)
+           Poly(x**2 - 5*x - 2, x)
+
+           >>> Matrix([[y, 1], [1, y]]).charpoly(x)
+           Poly(x**2 - 2*y*x - 1 + y**2, x)
+
+        """
+        result = self._charpoly_dense()
+
+        if result is None:
+            return self.berkowitz_charpoly(x)
+
+        F, d, gens = result
+        coeffs, den = [], S.One
+
+        for c in F:
+            if not gens:
+                c = exact.to_rational(c, den)
+            elif len(gens) == 1:
+                c = zzx_to_poly(c, *gens).as_basic()/den
+            else:
+                c = zzX_to_poly(c, *gens).as_basic()/den
+
+            coeffs.append(c)
+            den *= d
+
+        monoms = range(self.lines+1)
+
+        return Poly(list(zip(coeffs, reversed(monoms))), x)
+
+    def eigenvals(self, **flags):
+        """Computes eigenvalues of a Matrix, with multiplicities.
+
+           The characteristic polynomial is factored over the integers
+           (see charpoly()) and roots of every factor are found separately,
+           so roots are computed only for polynomials of lower degree.
+           Returns a dictionary {eigenvalue: multiplicity}, or a list of
+           eigenvalues if 'multiple' flag is set.
+        """
+        result = self._charpoly_dense()
+
+        if result is None:
+            return self.berkowitz_eigenvals(**flags)
+
+        F, d, gens = result
+        t = Symbol('t', dummy=True)
+
+        if not gens:
+            _, factors = zzx_factor(F)
+        else:
+            _, factors = zzX_factor(F)
+
+        multiple = flags.pop('multiple', False)
+        eigenvals = {}
+
+        for h, k in factors:
+            if not gens:
+                h = zzx_to_poly(h, t)
+            else:
+                h = Poly(zzX_to_poly(h, t, *gens).as_basic(), t)
+
+            for r, m in roots(h, **flags).iteritems():
+                r = r/d
+                eigenvals[r] = eigenvals.get(r, 0) + m*k
+
+        if not multiple:
+            return eigenvals
+
+        result = []
+
+        for r, k in eigenvals.iteritems():
+            result.extend([r]*k)
+
+        return result
 
     def eigenvects(self, **flags):
         """Return list of triples (eigenval, multiplicty, basis)."""
@@ -1511,13 +1754,124 @@ def matrix_multiply(A, B):
     #return product
     if A.shape[1] != B.shape[0]:
         raise ShapeError()
+    if isinstance(A, SMatrix) or isinstance(B, SMatrix):
+        return _sparse_multiply(A, B)
+    if isinstance(A, Matrix) and isinstance(B, Matrix) and \
+            A._is_exact() and B._is_exact():
+        return Matrix(A.shape[0], B.shape[1],
+            exact.multiply(A.mat, B.mat, A.shape[0], A.shape[1], B.shape[1]))
+    # every entry is built by a single n-ary Add, instead of a chain of
+    # binary ones, and products with a zero factor are skipped
+    zero = S.Zero
     blst = B.T.tolist()
     alst = A.tolist()
-    return Matrix(A.shape[0], B.shape[1], lambda i, j:
-                                        reduce(lambda k, l: k+l,
-                                        map(lambda n, m: n*m,
-                                        alst[i],
-                                        blst[j])))
+    mat = []
+    for arow in alst:
+        nonzero = [ (k, a) for k, a in enumerate(arow) if a is not zero ]
+        for bcol in blst:
+            terms = [ a*bcol[k] for k, a in nonzero if bcol[k] is not zero ]
+            mat.append(Add(*terms))
+    return Matrix(A.shape[0], B.shape[1], mat)
+
+def _sparse_multiply(A, B):
+    """Product of matrices A and B, at least one of which is sparse.
+
+    The product of two sparse matrices is sparse, otherwise it is dense.
+    """
+    m, k, n = A.shape[0], A.shape[1], B.shape[1]
+    if isinstance(A, SMatrix) and isinstance(B, SMatrix):
+        return SMatrix(m, n, sparse.multiply(sparse.to_csr(A.mat, m, k),
+                                             sparse.to_csr(B.mat, k, n), m))
+    elif isinstance(A, SMatrix):
+        if not isinstance(B, Matrix):
+            B = Matrix(B)
+        return Matrix(m, n, sparse.multiply_dense(sparse.to_csr(A.mat, m, k),
+                                                  B.mat, m, n))
+    else:
+        if not isinstance(A, Matrix):
+            A = Matrix(A)
+        return Matrix(m, n, sparse.dense_multiply(A.mat,
+                                sparse.to_csc(B.mat, k, n), m, k, n))
+
+class LUFactorization(object):
+    """LU factorization of a square matrix, for solving many systems.
+
+       Rational matrices are factorized fraction-free, by
+       sympy.matrices.exact.FractionFreeLU, other matrices by
+       Matrix.LUdecomposition_Simple(). solve(b) then solves A*x = b
+       and solve_many(B) solves A*X = B, for all columns of B at once,
+       by substitution only, i.e. in O(n**2) operations per column.
+
+       Use Matrix.LUfactorization() to get (cached) instances.
+    """
+
+    def __init__(self, A, iszerofunc=_iszero):
+        self.n = A.lines
+        self._key = (tuple(A.mat), iszerofunc)
+
+        self.exact = None
+
+        if A._is_exact():
+            try:
+                self.exact = exact.FractionFreeLU(A.mat, self.n)
+            except ValueError:
+                pass # singular, let the general algorithm report it
+
+        if self.exact is not None:
+            self.perm = self.exact.perm
+            self._combined = None
+        else:
+            self._combined, self.perm = A.LUdecomposition_Simple(iszerofunc)
+
+    def __eq__(self, other):
+        return isinstance(other, LUFactorization) and self._key == other._key
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def combined(self):
+        """Returns L and U combined in one matrix, L's diagonal entries are 1. """
+        if self._combined is None:
+            self._combined = Matrix(self.n, self.n, self.exact.combined())
+
+        return self._combined[:,:]
+
+    def solve_many(self, B):
+        """Solves A*X = B, B is a matrix with n rows. """
+        assert B.lines == self.n
+
+        if self.exact is not None and B._is_exact():
+            return Matrix(B.lines, B.cols, self.exact.solve_many(B.mat, B.cols))
+
+        if self._combined is None:
+            self.combined()
+
+        A, n = self._combined, self.n
+        b = B.permuteFwd(self.perm)
+        # forward substitution, all diag entries are scaled to 1
+        for i in range(n):
+            for j in range(i):
+                b.row(i, lambda x,k: x - b[j,k]*A[i,j])
+        # backward substitution
+        for i in range(n-1,-1,-1):
+            for j in range(i+1, n):
+                b.row(i, lambda x,k: x - b[j,k]*A[i,j])
+            b.row(i, lambda x,k: x / A[i,i])
+        return b
+
+    def solve(self, b):
+        """Solves A*x = b, b is a column vector or a list. """
+        if not isinstance(b, Matrix):
+            b = Matrix(b)
+
+        return self.solve_many(b)
+
+@cacheit
+def _lu_factorization(mat, n, iszerofunc):
+    return LUFactorization(Matrix(n, n, list(mat)), iszerofunc)
 
 def matrix_add(A,B):
     """Return A+B"""
@@ -1814,6 +2168,167 @@ def toMatrix(self):
                     c.append(0)
         return Matrix(l)
 
+    def transpose(self):
+        """Matrix transposition, the result is sparse, too. """
+        tran = {}
+        for (i, j), value in self.mat.iteritems():
+            tran[j, i] = value
+        return SMatrix(self.cols, self.lines, tran)
+
+    T = property(transpose,None,None,"Matrix transposition.")
+
+    def tolist(self):
+        """Return the Matrix converted in a python list. """
+        ret = [ [S.Zero]*self.cols for i in xrange(self.lines) ]
+        for (i, j), value in self.mat.iteritems():
+            ret[i][j] = value
+        return ret
+
+    def row_list(self):
+        """Returns the list of rows, as dictionaries {column: value}. """
+        return sparse.to_rows(self.mat, self.lines)
+
+    def __mul__(self, a):
+        if isinstance(a, Matrix) or hasattr(a, "__array__"):
+            return matrix_multiply(self, a)
+        mat = {}
+        for key, value in self.mat.iteritems():
+            value = value*a
+            if value != 0:
+                mat[key] = value
+        return SMatrix(self.lines, self.cols, mat)
+
+    def __rmul__(self, a):
+        if hasattr(a, "__array__"):
+            return matrix_multiply(a, self)
+        mat = {}
+        for key, value in self.mat.iteritems():
+            value = a*value
+            if value != 0:
+                mat[key] = value
+        return SMatrix(self.lines, self.cols, mat)
+
+    def __add__(self, a):
+        if not isinstance(a, SMatrix):
+            return matrix_add(self, a)
+        if self.shape != a.shape:
+            raise ShapeError()
+        mat = dict(self.mat)
+        for key, value in a.mat.iteritems():
+            if key in mat:
+                value = mat[key] + value
+                if value == 0:
+                    del mat[key]
+                    continue
+            mat[key] = value
+        return SMatrix(self.lines, self.cols, mat)
+
+    def __radd__(self, a):
+        return matrix_add(a, self)
+
+    def applyfunc(self, f, parallel=False):
+        """
+        Applies f to all elements. Unless f(0) is nonzero, only nonzero
+        elements are visited.
+
+        See Matrix.applyfunc for the meaning of parallel.
+        """
+        assert callable(f)
+        if sympify(f(S.Zero)) != 0:
+            dense = Matrix.applyfunc(self.toMatrix(), f, parallel)
+            return SMatrix(self.lines, self.cols, dense.mat)
+        keys = self.mat.keys()
+        values = [ self.mat[key] for key in keys ]
+        if parallel:
+            from sympy.utilities.parallel import parallel_map
+            if parallel is True:
+                values = parallel_map(f, values)
+            else:
+                values = parallel_map(f, values, parallel)
+        else:
+            values = map(f, values)
+        mat = {}
+        for key, value in zip(keys, values):
+            value = sympify(value)
+            if value != 0:
+                mat[key] = value
+        return SMatrix(self.lines, self.cols, mat)
+
+    def LUdecomposition_sparse(self, iszerofunc=_iszero):
+        """
+        Returns the sparse LU factorization of self, a SparseLU object.
+
+        Pivots are chosen by Markowitz' strategy, to keep L and U sparse
+        (see sympy.matrices.sparse).
+        """
+        if not self.is_square:
+            raise NonSquareMatrixException()
+        return sparse.SparseLU(self.row_list(), iszerofunc=iszerofunc)
+
+    def LUsolve(self, rhs, iszerofunc=_iszero):
+        """
+        Solve the linear system Ax = b, by sparse LU factorization.
+        self is the coefficient matrix A and rhs is the right side b.
+        """
+        assert rhs.lines == self.lines
+        lu = self.LUdecomposition_sparse(iszerofunc=iszerofunc)
+        X = {}
+        for j in xrange(rhs.cols):
+            x = lu.solve([ rhs[i, j] for i in xrange(rhs.lines) ])
+            for i, value in enumerate(x):
+                if value != 0:
+                    X[i, j] = value
+        return SMatrix(rhs.lines, rhs.cols, X)
+
+    def inv(self, method="LU", iszerofunc=_iszero):
+        """
+        Calculates the matrix inverse.
+
+        By default, the inverse is computed by sparse LU factorization.
+        Other methods are the same as for Matrix.
+        """
+        if method == "LU":
+            return self.LUsolve(self.eye(self.lines), iszerofunc=iszerofunc)
+        else:
+            return Matrix.inv(self, method, iszerofunc)
+
+    def det(self, method="markowitz"):
+        """
+        Computes the determinant by sparse LU factorization.
+
+        Other methods are the same as for Matrix. Symbolic entries are
+        cancelled during elimination, as in det_bareis().
+        """
+        if method != "markowitz":
+            return Matrix.det(self, method)
+        if not self.is_square:
+            raise NonSquareMatrixException()
+        if not self.lines:
+            return S.One
+        try:
+            lu = sparse.SparseLU(self.row_list(), simplify=_cancel)
+        except ValueError:
+            return S.Zero
+        return _cancel(lu.det()).expand()
+
+    def rref(self, simplified=False, iszerofunc=_iszero):
+        """
+        Take any matrix and return reduced row-echelon form and indices of pivot vars
+
+        To simplify elements during elimination set simplified=True
+        """
+        if simplified:
+            rows, pivots = sparse.rref(self.row_list(), self.cols,
+                iszerofunc=iszerofunc, simplify=simplify)
+        else:
+            rows, pivots = sparse.rref(self.row_list(), self.cols,
+                iszerofunc=iszerofunc)
+        mat = {}
+        for i, row in enumerate(rows):
+            for j, value in row.iteritems():
+                mat[i, j] = value
+        return SMatrix(self.lines, self.cols, mat), pivots
+
     # from here to end all functions are same as in matrices.py
     # with Matrix replaced with SMatrix
     def copyin_list(self, key, value):
@@ -1822,15 +2337,7 @@ def copyin_list(self, key, value):
 
     def multiply(self,b):
         """Returns self*b """
-
-        def dotprod(a,b,i,j):
-            assert a.cols == b.lines
-            r=0
-            for x in range(a.cols):
-                r+=a[i,x]*b[x,j]
-            return r
-
-        r = SMatrix(self.lines, b.cols, lambda i,j: dotprod(self,b,i,j))
+        r = matrix_multiply(self, b)
         if r.lines == 1 and r.cols ==1:
             return r[0,0]
         return r
@@ -1880,10 +2387,10 @@ def zeros(self, dims):
         return SMatrix(n,m,{})
 
     def eye(self, n):
-        tmp = SMatrix(n,n,lambda i,j:0)
-        for i in range(tmp.lines):
-            tmp[i,i] = 1
-        return tmp
+        tmp = {}
+        for i in range(n):
+            tmp[i,i] = S.One
+        return SMatrix(n,n,tmp)
 
 
 def list2numpy(l):
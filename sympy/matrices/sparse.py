@@ -0,0 +1,444 @@
+"""Sparse linear algebra for SMatrix.
+
+SMatrix stores its nonzero entries in a dictionary {(i, j): value}, which is
+convenient for element access, but useless for algorithms, which have to
+walk rows or columns. Routines in this module convert the dictionary to
+compressed sparse row (CSR) or column (CSC) storage for multiplication, and
+to lists of row dictionaries (with sets of row indices for every column)
+for elimination, where fill-in has to be inserted.
+
+Elimination (SparseLU and rref) chooses pivots to minimize fill-in, so a
+large sparse system can be solved without ever becoming dense. SparseLU
+uses Markowitz' strategy: the pivot a[i,j] minimizes (r_i - 1)*(c_j - 1),
+where r_i and c_j are numbers of nonzero entries in row i and column j,
+i.e. the number of entries the elimination step can fill in. As a search
+over all nonzero entries in every step would be too slow, only entries in
+the shortest row and the shortest column are considered.
+
+Zero products are never formed and every entry of a product is built by a
+single n-ary Add.
+"""
+
+from heapq import heapify, heappush, heappop
+
+from sympy.core.basic import S
+from sympy.core.add import Add
+from sympy.core.mul import Mul
+
+def _iszero(x):
+    return x == 0
+
+def to_csr(mat, lines, cols):
+    """Returns (indptr, indices, data), the CSR form of dictionary mat.
+
+       Column indices and values of entries in row i are indices[k] and
+       data[k], for indptr[i] <= k < indptr[i+1], in increasing column order.
+
+       >>> from sympy.matrices.sparse import to_csr
+       >>> to_csr({(0, 1): 2, (2, 0): 3, (2, 2): 4}, 3, 3)
+       ([0, 1, 1, 3], [1, 0, 2], [2, 3, 4])
+
+    """
+    keys = mat.keys()
+    keys.sort()
+
+    indptr = [0]*(lines + 1)
+    indices, data = [], []
+
+    for i, j in keys:
+        indptr[i+1] += 1
+        indices.append(j)
+        data.append(mat[i, j])
+
+    for i in xrange(lines):
+        indptr[i+1] += indptr[i]
+
+    return indptr, indices, data
+
+def to_csc(mat, lines, cols):
+    """Returns (indptr, indices, data), the CSC form of dictionary mat.
+
+       This is the CSR form of the transpose, i.e. indptr is indexed by
+       columns and indices are row indices.
+    """
+    transposed = {}
+
+    for (i, j), value in mat.iteritems():
+        transposed[j, i] = value
+
+    return to_csr(transposed, cols, lines)
+
+def to_rows(mat, lines):
+    """Returns the list of rows of dictionary mat, as dictionaries. """
+    rows = [ {} for i in xrange(lines) ]
+
+    for (i, j), value in mat.iteritems():
+        rows[i][j] = value
+
+    return rows
+
+def multiply(A, B, lines):
+    """Product of sparse matrices A and B (with `lines` rows), in CSR form.
+
+       Gustavson's algorithm: row i of the product is the combination of
+       rows of B given by nonzero entries of row i of A, so only nonzero
+       products are ever computed. Returns the product as a dictionary.
+    """
+    Aptr, Aind, Adata = A
+    Bptr, Bind, Bdata = B
+
+    product = {}
+
+    for i in xrange(lines):
+        terms = {}
+
+        for t in xrange(Aptr[i], Aptr[i+1]):
+            k, a = Aind[t], Adata[t]
+
+            for s in xrange(Bptr[k], Bptr[k+1]):
+                j = Bind[s]
+
+                try:
+                    terms[j].append(a*Bdata[s])
+                except KeyError:
+                    terms[j] = [a*Bdata[s]]
+
+        for j, t in terms.iteritems():
+            value = Add(*t)
+
+            if value != 0:
+                product[i, j] = value
+
+    return product
+
+def multiply_dense(A, B, lines, cols):
+    """Product of sparse A, in CSR form, and a flat list B with cols columns.
+
+       Returns the product as a flat list.
+    """
+    Aptr, Aind, Adata = A
+    zero = S.Zero
+
+    product = []
+
+    for i in xrange(lines):
+        row = zip(Aind[Aptr[i]:Aptr[i+1]], Adata[Aptr[i]:Aptr[i+1]])
+
+        for j in xrange(cols):
+            product.append(Add(*[ a*B[k*cols + j] for k, a in row
+                if B[k*cols + j] is not zero ]))
+
+    return product
+
+def dense_multiply(A, B, lines, inner, cols):
+    """Product of a flat list A (lines x inner) and sparse B, in CSC form.
+
+       Returns the product as a flat list.
+    """
+    Bptr, Bind, Bdata = B
+    zero = S.Zero
+
+    columns = [ zip(Bind[Bptr[j]:Bptr[j+1]], Bdata[Bptr[j]:Bptr[j+1]])
+        for j in xrange(cols) ]
+
+    product = []
+
+    for i in xrange(lines):
+        offset = i*inner
+
+        for column in columns:
+            product.append(Add(*[ A[offset + k]*b for k, b in column
+                if A[offset + k] is not zero ]))
+
+    return product
+
+def _permutation_sign(perm):
+    """Returns the sign of a permutation, given as a list of images. """
+    sign, seen = 1, [False]*len(perm)
+
+    for i in xrange(len(perm)):
+        if not seen[i]:
+            j = perm[i]
+
+            while j != i:
+                seen[j] = True
+                j = perm[j]
+                sign = -sign
+
+    return sign
+
+def _shortest(heap, sets, active):
+    """Returns index of the shortest active row (column), or None.
+
+       heap holds (length, index) pairs, some of which may be outdated,
+       these are removed lazily.
+    """
+    while heap:
+        length, k = heap[0]
+
+        if active[k] and length == len(sets[k]):
+            return k
+
+        heappop(heap)
+
+    return None
+
+class SparseLU(object):
+    """LU factorization of a square sparse matrix, with Markowitz pivoting.
+
+       rows is the list of rows of the matrix, as dictionaries {j: value},
+       with SymPy numbers or expressions as values.
+       The factorization is P*A*Q = L*U, with row and column permutations
+       given by pivots, a list of (row, column) pairs in elimination order.
+       For every step, L holds the (negated) multipliers of the pivot row,
+       which was added to other rows, and U holds the pivot row. ValueError is
+       raised if the matrix is singular.
+
+       Zero entries are recognized by iszerofunc and new entries can be
+       normalized by simplify (a function), which is applied to every
+       updated entry.
+
+       >>> from sympy import S
+       >>> from sympy.matrices.sparse import SparseLU
+       >>> lu = SparseLU([{0: S(2), 2: S(1)}, {1: S(3)}, {0: S(4), 2: S(3)}])
+       >>> lu.solve([1, 1, 1])
+       [1, 1/3, -1]
+       >>> lu.det()
+       6
+
+    """
+
+    def __init__(self, rows, iszerofunc=_iszero, simplify=None):
+        n = len(rows)
+
+        rows = [ dict(row) for row in rows ]
+        cols = [ set() for j in xrange(n) ]
+
+        for i, row in enumerate(rows):
+            for j in row:
+                cols[j].add(i)
+
+        row_heap = [ (len(row), i) for i, row in enumerate(rows) ]
+        col_heap = [ (len(col), j) for j, col in enumerate(cols) ]
+
+        heapify(row_heap)
+        heapify(col_heap)
+
+        active_rows = [True]*n
+        active_cols = [True]*n
+
+        self.n = n
+        self.pivots, self.L, self.U = [], [], []
+
+        while len(self.pivots) < n:
+            i = _shortest(row_heap, rows, active_rows)
+            j = _shortest(col_heap, cols, active_cols)
+
+            if not rows[i] or not cols[j]:
+                raise ValueError("Matrix is singular")
+
+            # candidates are entries in the shortest row and column
+            candidates = [ (i, k) for k in rows[i] ] + \
+                         [ (k, j) for k in cols[j] ]
+
+            best, cost = None, None
+
+            for p, q in candidates:
+                if q not in rows[p]:
+                    continue    # the same entry was dropped already
+
+                value = rows[p][q]
+
+                if iszerofunc(value):
+                    # not recognized as zero before, drop it
+                    del rows[p][q]
+                    cols[q].discard(p)
+                    heappush(row_heap, (len(rows[p]), p))
+                    heappush(col_heap, (len(cols[q]), q))
+                    continue
+
+                # prefer numeric pivots, to avoid symbolic divisions
+                c = ((len(rows[p]) - 1)*(len(cols[q]) - 1), not value.is_Number)
+
+                if best is None or c < cost:
+                    best, cost = (p, q), c
+
+            if best is None:
+                continue
+
+            p, q = best
+
+            pivot_row = rows[p]
+            pivot = pivot_row[q]
+
+            active_rows[p] = False
+            active_cols[q] = False
+
+            for k in pivot_row:
+                cols[k].discard(p)
+
+            multipliers = []
+
+            for i in cols[q]:
+                row = rows[i]
+                l = -row.pop(q)/pivot
+
+                multipliers.append((i, l))
+
+                for k, value in pivot_row.iteritems():
+                    if k == q:
+                        continue
+
+                    if k in row:
+                        value = row[k] + l*value
+
+                        if simplify is not None:
+                            value = simplify(value)
+
+                        if iszerofunc(value):
+                            del row[k]
+                            cols[k].discard(i)
+                        else:
+                            row[k] = value
+                    else:
+                        row[k] = l*value
+                        cols[k].add(i)
+
+                heappush(row_heap, (len(row), i))
+
+            for k in pivot_row:
+                if k != q:
+                    heappush(col_heap, (len(cols[k]), k))
+
+            cols[q] = set()
+
+            self.pivots.append((p, q))
+            self.L.append(multipliers)
+            self.U.append(pivot_row)
+
+    def nnz(self):
+        """Returns the number of nonzero entries of L and U together. """
+        return sum([ len(l) for l in self.L ]) + sum([ len(u) for u in self.U ])
+
+    def solve(self, b):
+        """Returns the solution x of A*x = b, where b is a list. """
+        b = list(b)
+        zero = S.Zero
+
+        # forward substitution, with L
+        for (p, q), multipliers in zip(self.pivots, self.L):
+            y = b[p]
+
+            if y != 0:
+                for i, l in multipliers:
+                    b[i] = b[i] + l*y
+
+        x = [zero]*self.n
+
+        # back substitution, with U
+        for k in xrange(self.n - 1, -1, -1):
+            p, q = self.pivots[k]
+            row = self.U[k]
+
+            terms = [ -value*x[j] for j, value in row.iteritems()
+                if j != q and x[j] is not zero ]
+
+            x[q] = Add(b[p], *terms)/row[q]
+
+        return x
+
+    def det(self):
+        """Returns the determinant of the factorized matrix. """
+        rows, cols = [0]*self.n, [0]*self.n
+
+        for k, (p, q) in enumerate(self.pivots):
+            rows[k], cols[k] = p, q
+
+        sign = _permutation_sign(rows)*_permutation_sign(cols)
+
+        return sign*Mul(*[ row[q] for (p, q), row in zip(self.pivots, self.U) ])
+
+def rref(rows, cols, iszerofunc=_iszero, simplify=None):
+    """Reduced row-echelon form of a sparse matrix, given by its rows.
+
+       Gauss-Jordan elimination, where in every column the pivot is taken
+       from the shortest row (the column order is fixed by the row-echelon
+       form). Returns (rows, pivots), where rows are the rows of the
+       result, as dictionaries, and pivots are indices of pivot columns.
+
+       >>> from sympy import S
+       >>> from sympy.matrices.sparse import rref
+       >>> rref([{0: S(1), 1: S(2)}, {0: S(2), 1: S(4)}, {2: S(3)}], 3)
+       ([{0: 1, 1: 2}, {2: 1}, {}], [0, 2])
+
+    """
+    rows = [ dict(row) for row in rows ]
+    columns = [ set() for j in xrange(cols) ]
+
+    for i, row in enumerate(rows):
+        for j in row:
+            columns[j].add(i)
+
+    used = [False]*len(rows)
+    order, pivots = [], []
+
+    for j in xrange(cols):
+        best = None
+
+        for i in list(columns[j]):
+            if used[i]:
+                continue
+
+            if iszerofunc(rows[i][j]):
+                del rows[i][j]
+                columns[j].discard(i)
+            elif best is None or len(rows[i]) < len(rows[best]):
+                best = i
+
+        if best is None:
+            continue
+
+        pivot_row = rows[best]
+        pivot = pivot_row[j]
+
+        for k in pivot_row:
+            if k == j:
+                pivot_row[k] = S.One
+            else:
+                pivot_row[k] = pivot_row[k]/pivot
+
+        for i in columns[j]:
+            if i == best:
+                continue
+
+            row = rows[i]
+            l = -row.pop(j)
+
+            for k, value in pivot_row.iteritems():
+                if k == j:
+                    continue
+
+                if k in row:
+                    value = row[k] + l*value
+
+                    if simplify is not None:
+                        value = simplify(value)
+
+                    if iszerofunc(value):
+                        del row[k]
+                        columns[k].discard(i)
+                    else:
+                        row[k] = value
+                else:
+                    row[k] = l*value
+                    columns[k].add(i)
+
+        columns[j] = set([best])
+        used[best] = True
+        order.append(best)
+        pivots.append(j)
+
+    result = [ rows[i] for i in order ]
+    result += [ {} for i in xrange(len(rows) - len(order)) ]
+
+    return result, pivots
@@ -1,7 +1,7 @@
 from sympy import symbols, Matrix, eye, I, Symbol, Rational, wronskian, cos, \
         sin, exp, hessian, sqrt, zeros, ones, randMatrix, Poly, S, pi, \
-        integrate, oo, raises, trigsimp, Integer
-from sympy.matrices.matrices import ShapeError, MatrixError
+        integrate, oo, raises, trigsimp, Integer, simplify
+from sympy.matrices.matrices import ShapeError, MatrixError, SMatrix
 from sympy.printing import srepr
 from sympy.utilities.pytest import XFAIL
 
@@ -455,7 +455,6 @@ def test_eigen():
          ( 0, 1, [Matrix([[-I*eps/abs(eps)],[1]])]) ])
 
 def test_sparse_matrix():
-    return
     def eye(n):
         tmp = SMatrix(n,n,lambda i,j:0)
         for i in range(tmp.lines):
@@ -622,6 +621,7 @@ def zeros(n):
     m0 = eye(3)
     assert m0.applyfunc(lambda x:2*x) == eye(3)*2
     assert m0.applyfunc(lambda x: 0 ) == zeros(3)
+    assert m0.applyfunc(lambda x: x + 1) == SMatrix(3, 3, lambda i, j: 1 + (i == j))
 
     # test_LUdecomp
     testmat = SMatrix([[0,2,5,3],
@@ -682,7 +682,7 @@ def zeros(n):
     v1 = Matrix(1,3,[1,2,3])
     v2 = Matrix(1,3,[3,4,5])
     assert v1.cross(v2) == Matrix(1,3,[-2,4,-2])
-    assert v1.norm(v1) == 14
+    assert v1.norm() == sqrt(14)
 
     # test_cofactor
     assert eye(3) == eye(3).cofactorMatrix()
@@ -731,38 +731,20 @@ def zeros(n):
                                [0,0,0,0,0,0,0]])
     # now check the vectors
     basis = M.nullspace()
-    assert basis[0] == Matrix([[-3,1,0,0,0,0,0]])
-    assert basis[1] == Matrix([[0,0,1,0,0,0,0]])
-    assert basis[2] == Matrix([[-2,0,0,-2,1,0,0]])
-    assert basis[3] == Matrix([[0,0,0,0,0,R(-1)/3, 1]])
+    assert basis[0] == Matrix([-3,1,0,0,0,0,0])
+    assert basis[1] == Matrix([0,0,1,0,0,0,0])
+    assert basis[2] == Matrix([-2,0,0,-2,1,0,0])
+    assert basis[3] == Matrix([0,0,0,0,0,R(-1)/3, 1])
 
 
     # test eigen
     x = Symbol('x')
     y = Symbol('y')
     eye3 = eye(3)
-    assert eye3.charpoly(x) == (1-x)**3
-    assert eye3.charpoly(y) == (1-y)**3
-    # test values
-    M = Matrix([(0,1,-1),
-                (1,1,0),
-                (-1,0,1) ])
-    vals = M.eigenvals()
-    vals.sort()
-    assert vals == [-1, 1, 2]
-
-    R = Rational
-    M = Matrix([ [1,0,0],
-                 [0,1,0],
-                 [0,0,1]])
-    assert M.eigenvects() == [[1, 3, [Matrix(1,3,[1,0,0]), Matrix(1,3,[0,1,0]), Matrix(1,3,[0,0,1])]]]
-    M = Matrix([ [5,0,2],
-                 [3,2,0],
-                 [0,0,1]])
-    assert M.eigenvects() == [[1, 1, [Matrix(1,3,[R(-1)/2,R(3)/2,1])]],
-                              [2, 1, [Matrix(1,3,[0,1,0])]],
-                              [5, 1, [Matrix(1,3,[1,1,0])]]]
+    assert eye3.charpoly(x) == Poly((x-1)**3, x)
+    assert eye3.charpoly(y) == Poly((y-1)**3, y)
 
+    M = eye3
     assert M.zeros((3, 5)) == SMatrix(3, 5, {})
 
 def test_subs():
@@ -1028,3 +1010,216 @@ def test_vech_TypeError():
     m = Matrix([ [1,3], [2,4] ])
     raises(TypeError, 'm.vech()')
 
+
+def test_exact():
+    from sympy.matrices.exact import det_bareiss, det_modular, rref_ff
+    x = Symbol('x')
+
+    A = Matrix([[2, 1, 3], [1, 0, 1], [4, 2, 7]])
+    assert A._is_exact()
+    assert not Matrix([[x, 1], [1, 2]])._is_exact()
+
+    assert A.det() == -1
+    assert A.det(method="modular") == -1
+    assert A.det(method="berkowitz") == -1
+    assert A*A.inv() == eye(3)
+    assert A.inv("LU") == A.inv()
+
+    M = [[3, -7, 5, 2], [0, 11, -4, 8], [6, 1, 9, -3], [-2, 5, 0, 7]]
+    assert det_bareiss(M) == det_modular(M) == Matrix(M).det(method="berkowitz")
+    assert det_bareiss([[0, 1], [1, 0]]) == det_modular([[0, 1], [1, 0]]) == -1
+    assert det_bareiss([[1, 2], [2, 4]]) == det_modular([[1, 2], [2, 4]]) == 0
+
+    R, pivots, d = rref_ff([[1, 2, 3], [2, 4, 6], [1, 1, 1]])
+    assert pivots == [0, 1]
+    assert Matrix(R)/d == Matrix([[1, 0, -1], [0, 1, 2], [0, 0, 0]])
+
+    # rational entries
+    B = Matrix([[Rational(1, 2), Rational(2, 3)], [Rational(-3, 4), 5]])
+    b = Matrix([1, Rational(1, 3)])
+    assert B.det() == B.det(method="berkowitz") == Rational(3)
+    assert B.det(method="modular") == Rational(3)
+    assert B*B.LUsolve(b) == b
+    assert B*B.inv() == eye(2)
+
+    L, U, p = B.LUdecomposition()
+    assert L*U == B
+    assert p == []
+
+    C = Matrix([[0, 1, 2], [Rational(1, 2), 3, 4], [5, 6, Rational(7, 3)]])
+    L, U, p = C.LUdecomposition()
+    assert p == [[1, 0]]
+    assert L*U == C.permuteFwd(p)
+
+    assert Matrix([[1, 2], [3, 4]]).rref() == (eye(2), [0, 1])
+    assert Matrix([[0, 2, 4], [0, 1, 2]]).rref() == \
+        (Matrix([[0, 1, 2], [0, 0, 0]]), [1])
+
+    assert Matrix([[1, 2], [3, 4]])*Matrix([[Rational(1, 2)], [1]]) == \
+        Matrix([[Rational(5, 2)], [Rational(11, 2)]])
+
+    # empty matrices use the general algorithms
+    assert Matrix(2, 0, []).rref() == (Matrix(2, 0, []), [])
+    assert Matrix(2, 0, [])*Matrix(0, 3, []) == zeros((2, 3))
+
+    # array-like operands (e.g. numpy arrays) use the general algorithm
+    class ArrayLike(object):
+        def __init__(self, rows):
+            self.rows = rows
+        def __array__(self):
+            raise NotImplementedError
+        def tolist(self):
+            return self.rows
+        shape = property(lambda self: (len(self.rows), len(self.rows[0])))
+        T = property(lambda self: ArrayLike(map(list, zip(*self.rows))))
+
+    assert A*ArrayLike([[1], [0], [2]]) == Matrix([[8], [3], [18]])
+    assert ArrayLike([[1, 0, 2]])*A == Matrix([[10, 5, 17]])
+
+    # singular matrices fall back to the general algorithms
+    raises(ValueError, "Matrix([[1, 2], [2, 4]]).LUsolve(Matrix([1, 1]))")
+    raises(ValueError, "Matrix([[1, 2], [2, 4]]).LUdecomposition()")
+
+    try:
+        Matrix([[1, 2], [2, 4]]).LUsolve(Matrix([1, 1]))
+    except ValueError, e:
+        assert str(e) == "Error: non-invertible matrix passed to LUdecomposition_Simple()"
+
+def test_multiply_strassen():
+    from sympy.matrices import exact
+    from sympy.matrices.exact import multiply_strassen, _multiply
+
+    A = [ [ (3*i + 7*j) % 11 - 5 for j in xrange(13) ] for i in xrange(9) ]
+    B = [ [ (5*i - 2*j) % 7 - 3 for j in xrange(10) ] for i in xrange(13) ]
+
+    cutoff, threshold = exact.STRASSEN_CUTOFF, exact.STRASSEN_THRESHOLD
+    exact.STRASSEN_CUTOFF, exact.STRASSEN_THRESHOLD = 2, 4
+
+    try:
+        assert multiply_strassen(A, B) == _multiply(A, zip(*B))
+        assert Matrix(A)*Matrix(B) == Matrix(_multiply(A, zip(*B)))
+
+        C = Matrix(6, 6, lambda i, j: Rational(i + 1, j + 2))
+        assert C*C == Matrix(6, 6, lambda i, j: sum([ C[i, k]*C[k, j] for k in xrange(6) ]))
+    finally:
+        exact.STRASSEN_CUTOFF, exact.STRASSEN_THRESHOLD = cutoff, threshold
+
+def test_multiply_symbolic():
+    x, y = symbols('xy')
+
+    A = Matrix([[x, 0, 1], [0, 0, 0], [y, 2, x*y]])
+    B = Matrix([[1, x], [0, y], [y, 0]])
+
+    assert A*B == Matrix([[x + y, x**2], [0, 0], [y + x*y**2, x*y + 2*y]])
+    assert (A*B)[1, 0] is S.Zero
+    assert (Matrix([[0, x]])*Matrix([[y], [0]]))[0] is S.Zero
+
+def test_sparse_elimination():
+    from sympy.matrices.sparse import to_csr, to_csc
+    x = Symbol('x')
+
+    # arrowhead matrix: eliminating the first row and column first would
+    # make the matrix dense, Markowitz pivoting doesn't create any fill-in
+    n = 30
+    A = SMatrix(n, n, {})
+    for i in xrange(n):
+        A[i, i] = 3 + i % 4
+        A[0, i] = A[i, 0] = 1
+    A[0, 0] = n
+
+    lu = A.LUdecomposition_sparse()
+    assert lu.nnz() == len(A.mat)
+    assert lu.det() == A.toMatrix().det()
+
+    b = SMatrix(n, 1, lambda i, j: i % 5)
+    X = A.LUsolve(b)
+    assert isinstance(X, SMatrix)
+    assert A*X == b
+    assert A.toMatrix()*X.toMatrix() == b.toMatrix()
+
+    B = SMatrix([[0, 2, 0], [1, 0, x], [0, 3, 1]])
+    assert B.det() == B.toMatrix().det() == -2
+    assert B*B.inv() == eye(3)
+    assert SMatrix([[1, 2], [2, 4]]).det() == 0
+    raises(ValueError, "SMatrix([[1, 2], [2, 4]]).LUsolve(SMatrix([1, 1]))")
+
+    C = SMatrix([[0, 2, 4, 1], [0, 1, 2, 0], [3, 0, 0, 6]])
+    R, pivots = C.rref()
+    assert isinstance(R, SMatrix)
+    assert (R.toMatrix(), pivots) == C.toMatrix().rref()
+
+    # products, sparse times sparse is sparse
+    D = SMatrix([[1, 0, x], [0, 0, 2]])
+    assert isinstance(D*B, SMatrix)
+    assert (D*B).toMatrix() == D.toMatrix()*B.toMatrix()
+    assert D*B.toMatrix() == D.toMatrix()*B.toMatrix()
+    assert D.toMatrix()*B == D.toMatrix()*B.toMatrix()
+    assert (D*B).mat == {(0, 1): 2 + 3*x, (0, 2): x, (1, 1): 6, (1, 2): 2}
+    assert D.T.toMatrix() == D.toMatrix().T
+    assert (D + D).mat == (2*D).mat
+    assert (D - D).mat == {}
+
+    assert to_csr(D.mat, 2, 3) == ([0, 2, 3], [0, 2, 2], [1, x, 2])
+    assert to_csc(D.mat, 2, 3) == ([0, 1, 1, 3], [0, 0, 1], [1, x, 2])
+
+def test_charpoly_integer():
+    from sympy.matrices.exact import berkowitz, charpoly_modular
+    x, y, t = symbols('xyt')
+    add = lambda a, b: a + b
+    mul = lambda a, b: a*b
+    neg = lambda a: -a
+
+    A = Matrix(6, 6, lambda i, j: (3*i + 5*j + i*j) % 11 - 5)
+    F = charpoly_modular(A.tolist())
+    assert F == berkowitz(A.tolist(), add, mul, neg, 0, 1)
+    assert A.charpoly(t) == A.berkowitz_charpoly(t)
+    assert A.charpoly(t).coeffs[-1] == A.det()
+
+    B = Matrix([[Rational(1, 2), 3, 1], [Rational(2, 3), 0, 1], [1, 1, -2]])
+    assert B.charpoly(t) == B.berkowitz_charpoly(t)
+
+    C = Matrix([[x, 1, y], [x*y/2, 0, 1], [3, y**2, x - 1]])
+    assert (C.charpoly(t).as_basic() - C.berkowitz_charpoly(t).as_basic()).expand() == 0
+
+    M = Matrix([[x, 1, 0, 0], [1, x, 0, 0], [0, 0, y, 2], [0, 0, 2, y]])
+    assert M.eigenvals() == {x + 1: 1, x - 1: 1, y + 2: 1, y - 2: 1}
+    assert sorted(Matrix([[3, 1], [0, 3]]).eigenvals(multiple=True)) == [3, 3]
+    assert Matrix([[Rational(1, 2), 1], [0, Rational(1, 3)]]).eigenvals() == \
+        {Rational(1, 2): 1, Rational(1, 3): 1}
+
+    # not polynomials, fall back to Berkowitz method on expressions
+    D = Matrix([[sin(x), 0], [0, sqrt(2)]])
+    assert D.charpoly(t) == D.berkowitz_charpoly(t)
+    assert D.eigenvals() == D.berkowitz_eigenvals()
+
+def test_LUfactorization():
+    from sympy.matrices.matrices import LUFactorization
+    x = Symbol('x')
+
+    A = Matrix([[2, 1, 0], [Rational(1, 2), 0, 3], [4, 2, 1]])
+    lu = A.LUfactorization()
+    assert isinstance(lu, LUFactorization)
+    assert A.LUfactorization() == lu
+    assert Matrix(A.tolist()).LUfactorization() == lu
+
+    b = Matrix([1, Rational(2, 3), 0])
+    assert A*lu.solve(b) == b
+    assert lu.solve([1, Rational(2, 3), 0]) == lu.solve(b)
+    assert lu.solve_many(eye(3)) == A.inv()
+    assert A.LUsolve(b) == lu.solve(b)
+
+    c = Matrix([x, 1, x**2])
+    assert (A*lu.solve(c) - c).expand() == zeros((3, 1))
+
+    combined, p = A.LUdecomposition_Simple()
+    assert lu.combined() == combined and lu.perm == p
+
+    A[2, 2] = 5
+    assert A.LUfactorization() != lu
+    assert A*A.LUsolve(b) == b
+
+    B = Matrix([[x, 1], [1, x]])
+    assert B.LUfactorization() == B.LUfactorization()
+    assert (B*B.LUsolve(Matrix([1, 0])) - Matrix([1, 0])).applyfunc(simplify) == zeros((2, 1))
+
+    raises(ValueError, "Matrix([[1, 2], [2, 4]]).LUfactorization()")
@@ -4,7 +4,7 @@
 from sympy.core.power import Pow
 from sympy.core.symbol import Symbol
 from sympy.core.basic import Basic, S
-from sympy.core.numbers import Integer
+from sympy.core.numbers import Integer, Rational
 from sympy.core.sympify import sympify
 
 from sympy.core.numbers import igcd, ilcm
@@ -14,6 +14,11 @@
 from monomial import monomial_cmp, monomial_lcm, \
     monomial_gcd, monomial_mul, monomial_div
 
+from distributedpolys import sdp_LC
+from groebnertools import sdp_groebner
+
+from integerpolys import zzX_from_poly, zzX_to_dict, zzX_gcd
+
 from sympy.utilities.iterables import all, any
 
 def poly_div(f, g, *symbols):
@@ -188,6 +193,22 @@ def poly_groebner(f, *symbols, **flags):
        >>> [ g.as_basic() for g in G ]
        [x - y**2, y**3 + y**4]
 
+       The computation is done by sdp_groebner() (see groebnertools),
+       using Buchberger's algorithm with Gebauer-Moeller criteria and
+       sugar selection strategy, or a simplified F4 algorithm, if
+       method='f4' is given. Polynomials with rational coefficients
+       are handled in a fraction free way. A dictionary can be passed
+       with stats flag, to collect statistics of the computation.
+
+       >>> stats = {}
+       >>> G = poly_groebner([x**2 + y**3, y**2-x], x, y, order='lex',
+       ...     method='f4', stats=stats)
+
+       >>> [ g.as_basic() for g in G ]
+       [x - y**2, y**3 + y**4]
+       >>> stats['zero']
+       0
+
        For more information on the implemented algorithm refer to:
 
        [1] N.K. Bose, B. Buchberger, J.P. Guiver, Multidimensional
@@ -203,6 +224,9 @@ def poly_groebner(f, *symbols, **flags):
            Algorithms, Springer, Second Edition, 1997, pp. 62
 
     """
+    method = flags.pop('method', 'buchberger')
+    stats = flags.pop('stats', None)
+
     if isinstance(f, (tuple, list, set)):
         f, g = f[0], list(f[1:])
 
@@ -222,128 +246,38 @@ def poly_groebner(f, *symbols, **flags):
 
         return [f.as_monic()]
 
-    compare = monomial_cmp(flags.get('order'))
-
     f = [ h for h in [f] + g if h ]
 
     if not f:
         return [Poly((), *symbols, **flags)]
 
-    R, P, G, B, F = set(), set(), set(), {}, {}
-
-    for i, h in enumerate(f):
-        F[h] = i; R.add(i)
-
-    def normal(g, H):
-        h = poly_div(g, [ f[i] for i in H ])[1]
-
-        if h.is_zero:
-            return None
-        else:
-            if not h in F:
-                F[h] = len(f)
-                f.append(h)
-
-            return F[h], h.LM
-
-    def generate(R, P, G, B):
-        while R:
-            h = normal(f[R.pop()], G | P)
-
-            if h is not None:
-                k, LM = h
-
-                G0 = set(g for g in G if monomial_div(f[g].LM, LM))
-                P0 = set(p for p in P if monomial_div(f[p].LM, LM))
-
-                G, P, R = G - G0, P - P0 | set([k]), R | G0 | P0
-
-                for i, j in set(B):
-                    if i in G0 or j in G0:
-                        del B[(i, j)]
-
-        G |= P
-
-        for i in G:
-            for j in P:
-                if i == j:
-                    continue
-
-                if i < j:
-                   k = (i, j)
-                else:
-                   k = (j, i)
-
-                if k not in B:
-                    B[k] = monomial_lcm(f[i].LM, f[j].LM)
-
-        G = set([ normal(f[g], G - set([g]))[0] for g in G ])
+    field = not all(h._has_number_coeffs() for h in f)
 
-        return R, P, G, B
-
-    R, P, G, B = generate(R, P, G, B)
-
-    while B:
-        k, M = B.items()[0]
-
-        for l, N in B.iteritems():
-            if compare(M, N) == 1:
-                k, M = l, N
-
-        del B[k]
-
-        i, j = k[0], k[1]
-        p, q = f[i], f[j]
-
-        p_LM, q_LM = p.LM, q.LM
-
-        if M == monomial_mul(p_LM, q_LM):
-            continue
-
-        criterion = False
-
-        for g in G:
-            if g == i or g == j:
-                continue
-
-            if (min(i, g), max(i, g)) not in B:
-                continue
-
-            if (min(j, g), max(j, g)) not in B:
-                continue
-
-            if not monomial_div(M, f[g].LM):
-                continue
-
-            criterion = True
-            break
-
-        if criterion:
-            continue
-
-        p = p.mul_term(1/p.LC, monomial_div(M, p_LM))
-        q = q.mul_term(1/q.LC, monomial_div(M, q_LM))
-
-        h = normal(p - q, G)
-
-        if h is not None:
-            k, LM = h
+    if field:
+        F = [ h.as_dict() for h in f ]
+    else:
+        F = []
 
-            G0 = set(g for g in G if monomial_div(f[g].LM, LM))
+        for h in f:
+            denom = 1
 
-            R, P, G = G0, set([k]), G - G0
+            for coeff in h.iter_coeffs():
+                denom = ilcm(denom, int(coeff.q))
 
-            for i, j in set(B):
-                if i in G0 or j in G0:
-                    del B[(i, j)]
+            F.append(dict([ (monom, int(coeff.p) * (denom // int(coeff.q)))
+                for coeff, monom in h.iter_terms() ]))
 
-            R, P, G, B = generate(R, P, G, B)
+    G = sdp_groebner(F, flags['order'], method=method,
+        field=field, simplify=Poly.cancel, stats=stats)
 
-    G = [ f[g].as_monic() for g in G ]
+    if not field:
+        for i, g in enumerate(G):
+            LC = sdp_LC(g, flags['order'])
 
-    G = sorted(G, compare, lambda p: p.LM)
+            G[i] = dict([ (monom, Rational(coeff, LC))
+                for monom, coeff in g.iteritems() ])
 
-    return list(reversed(G))
+    return [ Poly(g, *symbols, **flags) for g in G ]
 
 def poly_lcm(f, g, *symbols):
     """Computes least common multiple of two polynomials.
@@ -423,7 +357,7 @@ def independent(h):
         else:
             return h.as_monic()
 
-def poly_gcd(f, g, *symbols):
+def poly_gcd(f, g, *symbols, **flags):
     """Compute greatest common divisor of two polynomials.
 
        Given two univariate polynomials, subresultants are used
@@ -431,12 +365,18 @@ def poly_gcd(f, g, *symbols):
        approach is used together with f*g = gcd(f, g)*lcm(f, g)
        well known formula.
 
+       Multivariate polynomials with integer coefficients are
+       handled by zzX_gcd() instead (heuristic GCD with modular
+       fallback). Use method='modular' to select modular GCD.
+
        For more information on the implemented algorithm refer to:
 
        [1] D. Cox, J. Little, D. O'Shea, Ideals, Varieties and
            Algorithms, Springer, Second Edition, 1997, pp. 187
 
     """
+    method = flags.get('method', 'heuristic')
+
     if not isinstance(f, Poly):
         f = Poly(f, *symbols)
     elif symbols:
@@ -481,7 +421,15 @@ def poly_gcd(f, g, *symbols):
     gcd = igcd(int(cf), int(cg))
 
     if f.is_multivariate:
-        h = poly_div(f*g, poly_lcm(f, g))[0]
+        if f._has_int_coeffs() and g._has_int_coeffs():
+            h = zzX_gcd(zzX_from_poly(f), zzX_from_poly(g), method=method)
+
+            terms = dict([ (monom, Integer(coeff))
+                for monom, coeff in zzX_to_dict(h).iteritems() ])
+
+            h = Poly(terms, *symbols, **flags)
+        else:
+            h = poly_div(f*g, poly_lcm(f, g))[0]
     else:
         h = poly_subresultants(f, g, res=False)[-1]
 
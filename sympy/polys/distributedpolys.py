@@ -0,0 +1,286 @@
+"""Sparse distributed polynomials with coefficients in an arbitrary ring.
+
+   A polynomial in Z[X], Q[X] or K[X] is stored as a dictionary mapping
+   monomials (tuples of exponents) to non-zero coefficients. Only terms
+   which are actually present are stored, so the cost of arithmetic is
+   proportional to the number of terms and not to the size of the dense
+   box spanned by the degrees, which makes this representation suitable
+   for sparse polynomials in many variables.
+
+   Coefficients can be any objects supporting +, -, * and truth testing
+   for zero, eg. Python integers or SymPy numbers. Terms are unordered,
+   use sdp_terms() for iteration with respect to a monomial order.
+
+   Monomials can be also packed into integers (see MonomialPacker in
+   sympy.polys.monomial), which makes multiplication of monomials an
+   integer addition. Use sdp_pack() and sdp_unpack() for conversions
+   and sdp_packed_mul() for multiplication in packed form.
+"""
+
+from sympy.polys.monomial import monomial_cmp
+
+from operator import add
+
+def sdp_from_terms(terms):
+    """Returns a polynomial from a sequence of (monom, coeff) pairs. """
+    f = {}
+
+    for monom, coeff in terms:
+        if monom in f:
+            coeff += f[monom]
+
+        if coeff:
+            f[monom] = coeff
+        elif monom in f:
+            del f[monom]
+
+    return f
+
+def sdp_terms(f, order='lex'):
+    """Returns a list of terms of f sorted decreasingly by ``order``.
+
+       >>> from sympy.polys.distributedpolys import sdp_terms
+       >>> sdp_terms({(2, 0): 1, (0, 3): 5, (1, 1): 2}, 'lex')
+       [((2, 0), 1), ((1, 1), 2), ((0, 3), 5)]
+       >>> sdp_terms({(2, 0): 1, (0, 3): 5, (1, 1): 2}, 'grlex')
+       [((0, 3), 5), ((2, 0), 1), ((1, 1), 2)]
+
+    """
+    terms = f.items()
+    cmp_fn = monomial_cmp(order)
+    terms.sort(lambda a, b: cmp_fn(b[0], a[0]))
+    return terms
+
+def sdp_monoms(f, order='lex'):
+    """Returns a list of monomials of f sorted decreasingly by ``order``. """
+    return [ monom for monom, coeff in sdp_terms(f, order) ]
+
+def sdp_LM(f, order='lex'):
+    """Returns the leading monomial of f with respect to ``order``. """
+    if not f:
+        return None
+
+    cmp_fn = monomial_cmp(order)
+    monoms = iter(f)
+    M = monoms.next()
+
+    for N in monoms:
+        if cmp_fn(N, M) > 0:
+            M = N
+
+    return M
+
+def sdp_LT(f, order='lex'):
+    """Returns the leading term of f with respect to ``order``. """
+    M = sdp_LM(f, order)
+
+    if M is None:
+        return None
+    else:
+        return M, f[M]
+
+def sdp_LC(f, order='lex'):
+    """Returns the leading coefficient of f with respect to ``order``. """
+    M = sdp_LM(f, order)
+
+    if M is None:
+        return 0
+    else:
+        return f[M]
+
+def sdp_degree(f):
+    """Returns the total degree of f. """
+    if not f:
+        return -1
+    else:
+        return max([ sum(monom) for monom in f ])
+
+def sdp_neg(f):
+    """Negate a polynomial. """
+    return dict([ (monom, -coeff) for monom, coeff in f.iteritems() ])
+
+def sdp_add(f, g):
+    """Add two polynomials. """
+    if len(f) < len(g):
+        f, g = g, f
+
+    h = dict(f)
+
+    for monom, coeff in g.iteritems():
+        if monom in h:
+            coeff += h[monom]
+
+            if not coeff:
+                del h[monom]
+                continue
+
+        h[monom] = coeff
+
+    return h
+
+def sdp_sub(f, g):
+    """Subtract two polynomials. """
+    h = dict(f)
+
+    for monom, coeff in g.iteritems():
+        if monom in h:
+            coeff = h[monom] - coeff
+
+            if not coeff:
+                del h[monom]
+                continue
+        else:
+            coeff = -coeff
+
+        h[monom] = coeff
+
+    return h
+
+def sdp_mul_term(f, monom, coeff):
+    """Multiply a polynomial by a single term. """
+    if not coeff:
+        return {}
+
+    return dict([ (tuple(map(add, M, monom)), c*coeff)
+        for M, c in f.iteritems() ])
+
+def sdp_mul(f, g):
+    """Multiply two polynomials.
+
+       The product is accumulated in a single dictionary, so the cost is
+       proportional to the product of the numbers of terms of f and g.
+
+       >>> from sympy.polys.distributedpolys import sdp_mul
+       >>> sorted(sdp_mul({(1, 0): 1, (0, 1): 1}, {(1, 0): 1, (0, 1): -1}).items())
+       [((0, 2), -1), ((2, 0), 1)]
+
+    """
+    if not (f and g):
+        return {}
+
+    if len(f) < len(g):
+        f, g = g, f
+
+    h, g = {}, g.items()
+
+    for M, a in f.iteritems():
+        for N, b in g:
+            monom = tuple(map(add, M, N))
+
+            if monom in h:
+                h[monom] += a*b
+            else:
+                h[monom] = a*b
+
+    for monom, coeff in h.items():
+        if not coeff:
+            del h[monom]
+
+    return h
+
+def sdp_sqr(f):
+    """Square a polynomial. """
+    terms, h = f.items(), {}
+    n = len(terms)
+
+    for i, (M, a) in enumerate(terms):
+        monom = tuple([ 2*e for e in M ])
+
+        if monom in h:
+            h[monom] += a*a
+        else:
+            h[monom] = a*a
+
+        a += a
+
+        for j in xrange(i+1, n):
+            N, b = terms[j]
+            monom = tuple(map(add, M, N))
+
+            if monom in h:
+                h[monom] += a*b
+            else:
+                h[monom] = a*b
+
+    for monom, coeff in h.items():
+        if not coeff:
+            del h[monom]
+
+    return h
+
+def sdp_pow(f, n):
+    """Raise a polynomial to the n-th power using repeated squaring. """
+    if n < 0:
+        raise ValueError("can't raise a polynomial to a negative power")
+
+    if not f:
+        if not n:
+            raise ValueError("0**0 is undefined")
+        else:
+            return {}
+
+    N = len(iter(f).next())
+    g = { (0,)*N : 1 }
+
+    while n:
+        if n & 1:
+            g = sdp_mul(g, f)
+            n -= 1
+
+        if n:
+            f = sdp_sqr(f)
+
+        n >>= 1
+
+    return g
+
+def sdp_pack(f, P):
+    """Convert monomials of f to integers using MonomialPacker P. """
+    pack = P.pack
+    return dict([ (pack(monom), coeff) for monom, coeff in f.iteritems() ])
+
+def sdp_unpack(f, P):
+    """Convert packed monomials of f back to tuples of exponents. """
+    unpack = P.unpack
+    return dict([ (unpack(monom), coeff) for monom, coeff in f.iteritems() ])
+
+def sdp_packed_mul(f, g, P):
+    """Multiply two polynomials with monomials packed by P.
+
+       >>> from sympy.polys.monomial import MonomialPacker
+       >>> from sympy.polys.distributedpolys import sdp_pack, sdp_unpack
+       >>> from sympy.polys.distributedpolys import sdp_packed_mul
+
+       >>> P = MonomialPacker(2, 4, 'lex')
+
+       >>> f = sdp_pack({(1, 0): 1, (0, 1): 1}, P)
+       >>> g = sdp_pack({(1, 0): 1, (0, 1): -1}, P)
+
+       >>> sorted(sdp_unpack(sdp_packed_mul(f, g, P), P).items())
+       [((0, 2), -1), ((2, 0), 1)]
+
+    """
+    if not (f and g):
+        return {}
+
+    if len(f) < len(g):
+        f, g = g, f
+
+    h, g, zero = {}, g.items(), P.zero
+
+    for M, a in f.iteritems():
+        M -= zero
+
+        for N, b in g:
+            monom = M + N
+
+            if monom in h:
+                h[monom] += a*b
+            else:
+                h[monom] = a*b
+
+    for monom, coeff in h.items():
+        if not coeff:
+            del h[monom]
+
+    return h
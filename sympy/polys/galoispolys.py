@@ -40,6 +40,14 @@ def zp_int(a, p):
 from random import uniform
 from math import ceil, sqrt, log
 
+# multiply polynomials in packed (Kronecker) form when both factors
+# have more coefficients, otherwise use schoolbook multiplication
+GF_PACKING_CUTOFF = 16
+
+# use division by Newton iteration when both the divisor and the
+# quotient have more coefficients than this
+GF_NEWTON_CUTOFF = 32
+
 def gf_degree(f):
     """Returns leading degree of f. """
     return len(f)-1
@@ -197,8 +205,65 @@ def gf_sub(f, g, p):
 
         return h + [ (a - b) % p for a, b in zip(f, g) ]
 
+def gf_pack(f, k):
+    """Pack coefficients of f into an integer using k hex digits each. """
+    if not f:
+        return 0
+    else:
+        return int(('%%0%dx' % k)*len(f) % tuple(f), 16)
+
+def gf_unpack(a, k, n, p):
+    """Unpack n coefficients of k hex digits each and reduce them mod p. """
+    a = '%x' % a
+    a = '0'*(n*k - len(a)) + a
+
+    return gf_strip([ int(a[i:i+k], 16) % p for i in xrange(0, n*k, k) ])
+
+def _gf_pack_digits(n, p):
+    """Returns number of hex digits needed for a coefficient of a product. """
+    return len('%x' % (n*(p-1)**2))
+
+def gf_packed_mul(f, g, p):
+    """Multiply polynomials over GF(p)[x] using Kronecker substitution.
+
+       Coefficients of f and g are packed into two large integers, with
+       enough space left for coefficients of the product, which is then
+       computed by a single integer multiplication (which uses Karatsuba
+       algorithm for large operands) and unpacked.
+
+       >>> gf_packed_mul([1, 2, 3], [3, 2, 1], 5)
+       [3, 3, 4, 3, 3]
+
+    """
+    if not (f and g):
+        return []
+
+    # packing needs coefficients in [0, p)
+    f = [ a % p for a in f ]
+    g = [ a % p for a in g ]
+
+    n = len(f) + len(g) - 1
+    k = _gf_pack_digits(min(len(f), len(g)), p)
+
+    return gf_unpack(gf_pack(f, k)*gf_pack(g, k), k, n, p)
+
+def gf_packed_sqr(f, p):
+    """Square a polynomial over GF(p)[x] using Kronecker substitution. """
+    if not f:
+        return []
+
+    f = [ a % p for a in f ]
+
+    k = _gf_pack_digits(len(f), p)
+    a = gf_pack(f, k)
+
+    return gf_unpack(a*a, k, 2*len(f) - 1, p)
+
 def gf_mul(f, g, p):
     """Multiply polynomials over GF(p)[x]. """
+    if len(f) > GF_PACKING_CUTOFF and len(g) > GF_PACKING_CUTOFF:
+        return gf_packed_mul(f, g, p)
+
     df = gf_degree(f)
     dg = gf_degree(g)
 
@@ -217,6 +282,9 @@ def gf_mul(f, g, p):
 
 def gf_sqr(f, p):
     """Square polynomials over GF(p)[x]. """
+    if len(f) > GF_PACKING_CUTOFF:
+        return gf_packed_sqr(f, p)
+
     df = gf_degree(f)
 
     dh = 2*df
@@ -302,23 +370,22 @@ def gf_div(f, g, p):
         raise ZeroDivisionError("polynomial division")
     elif df < dg:
         return [], f
+    elif dg >= GF_NEWTON_CUTOFF and df - dg >= GF_NEWTON_CUTOFF:
+        return gf_newton_div(f, g, p)
 
     inv = zp_inv(g[0], p)
 
-    h, dq, dr = f[:], df-dg, dg-1
-
-    for i in xrange(0, df+1):
-        coeff = h[i]
+    h, dq, g = f[:], df-dg, g[1:]
 
-        for j in xrange(max(0, dg-i), min(df-i, dr)+1):
-            coeff -= h[i+j-dg] * g[dg-j]
-
-        if i <= dq:
-            coeff *= inv
+    for i in xrange(0, dq+1):
+        coeff = (h[i] * inv) % p
+        h[i] = coeff
 
-        h[i] = coeff % p
+        if coeff:
+            k = i + dg + 1
+            h[i+1:k] = [ a - coeff*b for a, b in zip(h[i+1:k], g) ]
 
-    return h[:dq+1], gf_strip(h[dq+1:])
+    return h[:dq+1], gf_strip([ coeff % p for coeff in h[dq+1:] ])
 
 def gf_quo(f, g, p):
     """Computes polynomial quotient over GF(p)[x]. """
@@ -329,18 +396,20 @@ def gf_quo(f, g, p):
         raise ZeroDivisionError("polynomial division")
     elif df < dg:
         return []
+    elif dg >= GF_NEWTON_CUTOFF and df - dg >= GF_NEWTON_CUTOFF:
+        return gf_newton_div(f, g, p)[0]
 
     inv = zp_inv(g[0], p)
 
-    h, dq, dr = f[:], df-dg, dg-1
+    h, dq, g = f[:], df-dg, g[1:]
 
     for i in xrange(0, dq+1):
-        coeff = h[i]
-
-        for j in xrange(max(0, dg-i), min(df-i, dr)+1):
-            coeff -= h[i+j-dg] * g[dg-j]
+        coeff = (h[i] * inv) % p
+        h[i] = coeff
 
-        h[i] = (coeff * inv) % p
+        if coeff:
+            k = min(i + dg + 1, dq + 1)
+            h[i+1:k] = [ a - coeff*b for a, b in zip(h[i+1:k], g) ]
 
     return h[:dq+1]
 
@@ -348,6 +417,86 @@ def gf_rem(f, g, p):
     """Returns polynomial remainder over GF(p)[x]. """
     return gf_div(f, g, p)[1]
 
+def gf_trunc(f, n):
+    """Returns f mod x**n, i.e. n lowest coefficients of f. """
+    return gf_strip(f[-n:])
+
+def gf_inv_series(f, n, p):
+    """Compute inverse of f modulo x**n over GF(p)[x].
+
+       Uses Newton iteration h -> h*(2 - f*h) which doubles the number
+       of correct coefficients of h at each step. The constant term of
+       f must be non-zero.
+
+       >>> gf_inv_series([1, 1], 4, 7)
+       [6, 1, 6, 1]
+
+    """
+    if not (f and f[-1]):
+        raise ZeroDivisionError("series inversion")
+
+    h, k = [zp_inv(f[-1], p)], 1
+
+    while k < n:
+        k = min(2*k, n)
+
+        e = gf_trunc(gf_mul(gf_trunc(f, k), h, p), k)
+        h = gf_trunc(gf_mul(h, gf_sub([2], e, p), p), k)
+
+    return h
+
+def gf_newton_inv(g, p):
+    """Precompute inverse of g for gf_newton_div() over GF(p)[x].
+
+       Returns inverse of the reversal of g modulo x**deg(g), which is
+       sufficient to divide any polynomial of degree less than 2*deg(g)
+       by g, e.g. to reduce products of polynomials reduced modulo g.
+    """
+    return gf_inv_series(gf_reverse(g), max(gf_degree(g), 1), p)
+
+def gf_newton_div(f, g, p, inv=None):
+    """Division with remainder over GF(p)[x] using Newton iteration.
+
+       Quotient of f and g is computed as reversal of rev(f)/rev(g) mod
+       x**(deg(f) - deg(g) + 1),  thus division costs two polynomial
+       multiplications. Inverse of rev(g) can be precomputed (see
+       gf_newton_inv) when dividing many polynomials by the same g.
+
+       >>> gf_newton_div([1, 0, 1, 1], [1, 1, 0], 2)
+       ([1, 1], [1])
+
+       For more details on the implemented algorithm refer to:
+
+       [1] J. von zur Gathen, J. Gerhard, Modern Computer Algebra,
+           First Edition, Cambridge University Press, 1999, pp. 243
+
+    """
+    df = gf_degree(f)
+    dg = gf_degree(g)
+
+    if not g:
+        raise ZeroDivisionError("polynomial division")
+    elif df < dg:
+        return [], f
+
+    n = df - dg + 1
+
+    if inv is None:
+        inv = gf_inv_series(gf_reverse(g), n, p)
+
+    q = gf_trunc(gf_mul(gf_trunc(f[::-1], n), gf_trunc(inv, n), p), n)
+    q = q[::-1] + [0]*(n - len(q))
+
+    return q, gf_sub(f, gf_mul(q, g, p), p)
+
+def _gf_rem_by(g, p):
+    """Returns a function reducing polynomials of degree < 2*deg(g) mod g. """
+    if gf_degree(g) < GF_NEWTON_CUTOFF:
+        return lambda f: gf_rem(f, g, p)
+    else:
+        inv = gf_newton_inv(g, p)
+        return lambda f: gf_newton_div(f, g, p, inv)[1]
+
 def gf_lshift(f, n):
     """Efficiently multiply f by x**n. """
     if not f:
@@ -411,12 +560,14 @@ def gf_pow_mod(f, n, g, p):
     elif n == 2:
         return gf_rem(gf_sqr(f, p), g, p)
 
-    h = [1]
+    h, rem = [1], _gf_rem_by(g, p)
+
+    f = gf_rem(f, g, p)
 
     while True:
         if n & 1:
             h = gf_mul(h, f, p)
-            h = gf_rem(h, g, p)
+            h = rem(h)
             n -= 1
 
         n >>= 1
@@ -425,7 +576,7 @@ def gf_pow_mod(f, n, g, p):
             break
 
         f = gf_sqr(f, p)
-        f = gf_rem(f, g, p)
+        f = rem(f)
 
     return h
 
@@ -555,16 +706,55 @@ def gf_compose(g, h, p):
     return comp
 
 def gf_compose_mod(g, h, f, p):
-    """Compute polynomial composition g(h) over GF(p)[x]/(f). """
+    """Compute polynomial composition g(h) over GF(p)[x]/(f).
+
+       For large degrees Brent-Kung baby step / giant step algorithm
+       is used, which requires about 2*sqrt(deg(g)) multiplications
+       modulo f, instead of deg(g) multiplications of Horner scheme.
+
+       For more details on the implemented algorithm refer to:
+
+       [1] R.P. Brent, H.T. Kung, Fast Algorithms for Manipulating
+           Formal Power Series, J. ACM 25 (1978), pp. 581-595
+
+    """
     if not g:
         return []
 
-    comp = [g[0]]
+    rem = _gf_rem_by(f, p)
+    h = gf_rem(h, f, p)
 
-    for a in g[1:]:
-        comp = gf_mul(comp, h, p)
-        comp = gf_add_const(comp, a, p)
-        comp = gf_rem(comp, f, p)
+    n = gf_degree(g)
+
+    if n < GF_NEWTON_CUTOFF:
+        comp = [g[0]]
+
+        for a in g[1:]:
+            comp = gf_mul(comp, h, p)
+            comp = gf_add_const(comp, a, p)
+            comp = rem(comp)
+
+        return comp
+
+    m, d = int(ceil(sqrt(n + 1))), gf_degree(f)
+
+    H = [[1], h]
+
+    for i in xrange(2, m+1):
+        H.append(rem(gf_mul(H[-1], h, p)))
+
+    H, hm = [ [0]*(d - len(q)) + q for q in H[:m] ], H[m]
+
+    g, comp = g[::-1], []
+
+    for k in xrange((n + m) // m - 1, -1, -1):
+        value = [0]*d
+
+        for a, q in zip(g[k*m:(k+1)*m], H):
+            if a:
+                value = [ b + a*c for b, c in zip(value, q) ]
+
+        comp = gf_add(rem(gf_mul(comp, hm, p)), gf_normal(value, p), p)
 
     return comp
 
@@ -885,13 +1075,15 @@ def gf_ddf_shoup(f, p):
 
     factors = []
 
+    rem = _gf_rem_by(f, p)
+
     for i, v in enumerate(V):
         h, j = [1], k-1
 
         for u in U:
             g = gf_sub(v, u, p)
             h = gf_mul(h, g, p)
-            h = gf_rem(h, f, p)
+            h = rem(h)
 
         g = gf_gcd(f, h, p)
         f = gf_quo(f, g, p)
@@ -1067,7 +1259,7 @@ def gf_factor(f, p, **flags):
         if n == 0:
             continue
 
-        for h in gf_factor_sqf(g, p)[1]:
+        for h in gf_factor_sqf(g, p, **flags)[1]:
             factors.append((h, k))
 
     def compare((f_a, e_a), (f_b, e_b)):
@@ -0,0 +1,510 @@
+"""Groebner bases algorithms for sparse distributed polynomials.
+
+   Polynomials are represented as in sympy.polys.distributedpolys, i.e.
+   as dictionaries mapping monomials (tuples of exponents) to non-zero
+   coefficients. Two coefficient domains are supported:
+
+     [1] integers -- Groebner bases of ideals over Q[X] are computed in
+         a fraction free way, keeping all polynomials primitive in Z[X]
+
+     [2] fields   -- coefficients are arbitrary SymPy expressions, which
+         are simplified after each operation with a user supplied
+         function (e.g. Poly.cancel) and polynomials are kept monic
+
+   Critical pairs are kept in a priority queue ordered by the sugar of
+   their S-polynomials [2] and filtered using Gebauer-Moeller version of
+   Buchberger's product and chain criteria [1]. Besides the classical
+   pair-by-pair Buchberger algorithm, a simple version of Faugere's F4
+   algorithm is available, which reduces all pairs of the lowest sugar
+   at once, with a sparse Gaussian elimination of a Macaulay-like matrix.
+
+   For more information on the implemented algorithms refer to:
+
+   [1] T. Becker, V. Weispfenning, Groebner Bases: A Computational
+       Approach to Commutative Algebra, Springer, 1993, pp. 222-232
+
+   [2] A. Giovini, T. Mora, G. Niesi, L. Robbiano, C. Traverso, "One
+       sugar cube, please" or Selection strategies in the Buchberger
+       algorithm, Proc. ISSAC '91, ACM Press, 1991, pp. 49-54
+
+   [3] J.C. Faugere, A new efficient algorithm for computing Groebner
+       bases (F4), Journal of Pure and Applied Algebra, 139 (1999),
+       pp. 61-88
+
+"""
+
+from sympy.polys.monomial import monomial_key
+from sympy.core.numbers import igcd
+
+from heapq import heappush, heappop
+from time import time
+
+def _monomial_mul(a, b):
+    return tuple([ x + y for x, y in zip(a, b) ])
+
+def _monomial_div(a, b):
+    for x, y in zip(a, b):
+        if x < y:
+            return None
+
+    return tuple([ x - y for x, y in zip(a, b) ])
+
+def _monomial_lcm(a, b):
+    return tuple([ max(x, y) for x, y in zip(a, b) ])
+
+def _monomial_divides(a, b):
+    """Returns True if monomial a divides monomial b. """
+    for x, y in zip(a, b):
+        if x > y:
+            return False
+
+    return True
+
+class _Engine(object):
+    """Shared state of a Groebner basis computation. """
+
+    def __init__(self, order, field, simplify, stats):
+        self.key = monomial_key(order)
+        self.field = field
+        self.simplify = simplify
+
+        self.polys = []
+        self.lms = []
+        self.lcs = []
+        self.sugars = []
+
+        self._keys = {}
+
+        if stats is None:
+            stats = {}
+
+        for name in ['pairs', 'product', 'chain', 'reduced', 'zero', 'rows', 'matrices']:
+            stats[name] = 0
+
+        self.stats = stats
+
+    def lead(self, f):
+        """Returns the leading monomial of f. """
+        keys, key = self._keys, self.key
+
+        best_key, best = None, None
+
+        for monom in f:
+            try:
+                k = keys[monom]
+            except KeyError:
+                k = keys[monom] = key(monom)
+
+            if best is None or k > best_key:
+                best_key, best = k, monom
+
+        return best
+
+    def order_key(self, monom):
+        try:
+            return self._keys[monom]
+        except KeyError:
+            k = self._keys[monom] = self.key(monom)
+            return k
+
+    def normal(self, f):
+        """Make f primitive (integers) or monic (fields). """
+        M = self.lead(f)
+        c = f[M]
+
+        if self.field:
+            if c != 1:
+                simplify = self.simplify
+
+                for monom, coeff in f.iteritems():
+                    f[monom] = simplify(coeff / c)
+        else:
+            cont = 0
+
+            for coeff in f.itervalues():
+                cont = igcd(cont, coeff)
+
+                if cont == 1:
+                    break
+
+            if c < 0:
+                cont = -cont
+
+            if cont != 1:
+                for monom, coeff in f.iteritems():
+                    f[monom] = coeff // cont
+
+        return f, M
+
+    def add(self, f, sugar):
+        """Normalize f and store it, returns its index. """
+        f, M = self.normal(f)
+
+        self.polys.append(f)
+        self.lms.append(M)
+        self.lcs.append(f[M])
+        self.sugars.append(sugar)
+
+        return len(self.polys) - 1
+
+    def mul_sub(self, p, u, v, m, g):
+        """Compute u*p - v*m*g in place (p is modified). """
+        simplify = self.simplify
+
+        if u != 1:
+            for monom, coeff in p.iteritems():
+                p[monom] = coeff*u
+
+        for N, coeff in g.iteritems():
+            monom = _monomial_mul(m, N)
+            coeff = p.get(monom, 0) - v*coeff
+
+            if simplify is not None:
+                coeff = simplify(coeff)
+
+            if coeff:
+                p[monom] = coeff
+            elif monom in p:
+                del p[monom]
+
+        return p
+
+    def multipliers(self, c, a):
+        """Returns (u, v) such that u*c - v*a = 0. """
+        if self.field:
+            return 1, self.simplify(c / a)
+        else:
+            d = igcd(c, a)
+            return a // d, c // d
+
+    def spoly(self, i, j):
+        """Compute S-polynomial of i-th and j-th polynomial. """
+        Mi, Mj = self.lms[i], self.lms[j]
+        L = _monomial_lcm(Mi, Mj)
+
+        u, v = self.multipliers(self.lcs[i], self.lcs[j])
+
+        s = self.mul_sub({}, 1, -u, _monomial_div(L, Mi), self.polys[i])
+        s = self.mul_sub(s, 1, v, _monomial_div(L, Mj), self.polys[j])
+
+        if L in s:
+            del s[L]
+
+        return s
+
+    def reduce(self, p, G):
+        """Completely reduce p with respect to polynomials G. """
+        p, r = dict(p), {}
+
+        polys, lms, lcs = self.polys, self.lms, self.lcs
+
+        while p:
+            M = self.lead(p)
+            c = p[M]
+
+            for g in G:
+                m = _monomial_div(M, lms[g])
+
+                if m is not None:
+                    break
+            else:
+                r[M] = c
+                del p[M]
+                continue
+
+            u, v = self.multipliers(c, lcs[g])
+
+            if u != 1:
+                for monom, coeff in r.iteritems():
+                    r[monom] = coeff*u
+
+            p = self.mul_sub(p, u, v, m, polys[g])
+
+            if M in p:
+                del p[M]
+
+        return r
+
+    def sugar(self, i, j):
+        """Returns the sugar of S-polynomial of i-th and j-th polynomial. """
+        L = sum(_monomial_lcm(self.lms[i], self.lms[j]))
+
+        return max(self.sugars[i] - sum(self.lms[i]),
+                   self.sugars[j] - sum(self.lms[j])) + L
+
+    def update(self, G, B, h, queue):
+        """Update basis G and critical pairs B with a new polynomial h.
+
+           Implements Gebauer-Moeller installation of Buchberger's
+           criteria, see [1], p. 230. New pairs are pushed into the
+           priority queue (B contains all pairs which are still alive).
+        """
+        lms, stats = self.lms, self.stats
+        mh = lms[h]
+
+        C, D = list(G), []
+
+        stats['pairs'] += len(C)
+
+        while C:
+            g = C.pop()
+            mg = lms[g]
+            LCM_hg = _monomial_lcm(mh, mg)
+
+            if _monomial_mul(mh, mg) == LCM_hg:
+                D.append((g, LCM_hg))
+                continue
+
+            for k in C:
+                if _monomial_divides(_monomial_lcm(mh, lms[k]), LCM_hg):
+                    break
+            else:
+                for k, LCM_hk in D:
+                    if _monomial_divides(LCM_hk, LCM_hg):
+                        break
+                else:
+                    D.append((g, LCM_hg))
+                    continue
+
+            stats['chain'] += 1
+
+        E = []
+
+        for g, LCM_hg in D:
+            if _monomial_mul(mh, lms[g]) != LCM_hg:
+                E.append((g, LCM_hg))
+            else:
+                stats['product'] += 1
+
+        B_new = set()
+
+        for i, j in B:
+            LCM_ij = _monomial_lcm(lms[i], lms[j])
+
+            if not _monomial_divides(mh, LCM_ij) or \
+                _monomial_lcm(lms[i], mh) == LCM_ij or \
+                _monomial_lcm(lms[j], mh) == LCM_ij:
+                B_new.add((i, j))
+            else:
+                stats['chain'] += 1
+
+        for g, LCM_hg in E:
+            B_new.add((g, h))
+            heappush(queue, (self.sugar(g, h), self.order_key(LCM_hg), g, h))
+
+        G_new = [ g for g in G if not _monomial_divides(mh, lms[g]) ]
+        G_new.append(h)
+
+        return G_new, B_new
+
+    def interreduce(self, G):
+        """Compute reduced Groebner basis from a minimal one. """
+        H = []
+
+        for g in G:
+            others = [ k for k in G if k != g ]
+            H.append(self.normal(self.reduce(self.polys[g], others))[0])
+
+        return H
+
+def _buchberger(engine, G, B, queue):
+    """Pair by pair Buchberger's algorithm with sugar selection. """
+    stats = engine.stats
+
+    while queue:
+        sugar, key, i, j = heappop(queue)
+
+        if (i, j) not in B:
+            continue
+
+        B.remove((i, j))
+
+        stats['reduced'] += 1
+
+        h = engine.reduce(engine.spoly(i, j), G)
+
+        if h:
+            G, B = engine.update(G, B, engine.add(h, sugar), queue)
+        else:
+            stats['zero'] += 1
+
+    return G
+
+def _f4(engine, G, B, queue):
+    """Simplified F4 algorithm: reduce all pairs of the lowest sugar at once. """
+    stats = engine.stats
+    polys, lms = engine.polys, engine.lms
+
+    while queue:
+        sugar, pairs = queue[0][0], []
+
+        while queue and queue[0][0] == sugar:
+            s, key, i, j = heappop(queue)
+
+            if (i, j) in B:
+                B.remove((i, j))
+                pairs.append((i, j))
+
+        if not pairs:
+            continue
+
+        stats['matrices'] += 1
+        stats['reduced'] += len(pairs)
+
+        rows, done, todo = {}, set(), set()
+
+        def add_row(m, g):
+            if (m, g) not in rows:
+                row = {}
+
+                for monom, coeff in polys[g].iteritems():
+                    monom = _monomial_mul(m, monom)
+                    row[monom] = coeff
+
+                    if monom not in done:
+                        todo.add(monom)
+
+                rows[(m, g)] = row
+
+        for i, j in pairs:
+            L = _monomial_lcm(lms[i], lms[j])
+            done.add(L)
+
+            add_row(_monomial_div(L, lms[i]), i)
+            add_row(_monomial_div(L, lms[j]), j)
+
+        # symbolic preprocessing: add reducers of all monomials
+        while todo:
+            M = todo.pop()
+
+            if M in done:
+                continue
+
+            done.add(M)
+
+            for g in G:
+                m = _monomial_div(M, lms[g])
+
+                if m is not None:
+                    add_row(m, g)
+                    break
+
+        rows = rows.values()
+        stats['rows'] += len(rows)
+
+        lms0 = set([ engine.lead(row) for row in rows ])
+
+        # sparse Gaussian elimination to row echelon form
+        rows.sort(key=lambda row: engine.order_key(engine.lead(row)), reverse=True)
+
+        pivots = {}
+
+        for row in rows:
+            row = dict(row)
+
+            while row:
+                M = engine.lead(row)
+
+                if M not in pivots:
+                    row, M = engine.normal(row)
+                    pivots[M] = row
+                    break
+
+                pivot = pivots[M]
+
+                u, v = engine.multipliers(row[M], pivot[M])
+                row = engine.mul_sub(row, u, v, (0,)*len(M), pivot)
+
+                if M in row:
+                    del row[M]
+
+        new = [ M for M in pivots if M not in lms0 ]
+
+        if not new:
+            stats['zero'] += len(pairs)
+
+        new.sort(key=engine.order_key)
+
+        for M in new:
+            h = engine.reduce(pivots[M], G)
+
+            if h:
+                G, B = engine.update(G, B, engine.add(h, sugar), queue)
+
+    return G
+
+def sdp_groebner(F, order, **flags):
+    """Computes reduced Groebner basis of F in sparse distributed form.
+
+       F is a list of dictionaries with integer (ideal over Q[X] is
+       assumed) or, if field=True is given, general field coefficients.
+       In the latter case a function used to simplify coefficients can
+       be given with simplify flag. The algorithm can be selected with
+       method flag, supported are 'buchberger' (default) and 'f4'.
+
+       Returns primitive (integers) or monic (fields) polynomials of the
+       reduced Groebner basis, sorted decreasingly by leading monomials.
+
+       If a dictionary is given with stats flag, it is filled with the
+       following counters:
+
+         pairs     -- number of critical pairs considered
+         product   -- pairs discarded by the product criterion
+         chain     -- pairs discarded by the chain criterion
+         reduced   -- number of S-polynomials reduced
+         zero      -- reductions to zero
+         rows      -- total number of matrix rows (F4 only)
+         matrices  -- number of reduced matrices (F4 only)
+         time      -- time spent in seconds
+
+       >>> from sympy.polys.groebnertools import sdp_groebner
+
+       >>> f = {(2, 0): 1, (0, 3): 1}
+       >>> g = {(1, 0): -1, (0, 2): 1}
+
+       >>> [ sorted(h.items()) for h in sdp_groebner([f, g], 'lex') ]
+       [[((0, 2), -1), ((1, 0), 1)], [((0, 3), 1), ((0, 4), 1)]]
+
+    """
+    method = flags.get('method', 'buchberger')
+
+    if method == 'buchberger':
+        algorithm = _buchberger
+    elif method == 'f4':
+        algorithm = _f4
+    else:
+        raise ValueError("Unknown Groebner bases algorithm: %s" % method)
+
+    field = flags.get('field', False)
+    simplify = flags.get('simplify', None)
+
+    if not field:
+        simplify = None
+    elif simplify is None:
+        simplify = lambda coeff: coeff
+
+    stats = flags.get('stats', None)
+
+    engine = _Engine(order, field, simplify, stats)
+    start = time()
+
+    F = [ f for f in F if f ]
+    F.sort(key=lambda f: engine.order_key(engine.lead(f)))
+
+    G, B, queue = [], set(), []
+
+    for f in F:
+        f = engine.reduce(f, G)
+
+        if f:
+            sugar = max([ sum(monom) for monom in f ])
+            G, B = engine.update(G, B, engine.add(f, sugar), queue)
+
+    G = algorithm(engine, G, B, queue)
+    G = engine.interreduce(G)
+
+    G.sort(key=lambda g: engine.order_key(engine.lead(g)), reverse=True)
+
+    engine.stats['time'] = time() - start
+
+    return G
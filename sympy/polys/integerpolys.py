@@ -1,7 +1,8 @@
 """Univariate and multivariate polynomials with coefficients in the integer ring. """
 
 from sympy.polys.galoispolys import (
-    gf_from_int_poly, gf_to_int_poly, gf_degree, gf_from_dict,
+    zp_inv, gf_from_int_poly, gf_to_int_poly, gf_degree, gf_from_dict,
+    gf_strip, gf_normal, gf_monic, gf_eval, gf_add, gf_mul_const,
     gf_lshift, gf_add_mul, gf_mul, gf_div, gf_quo, gf_rem,
     gf_gcd, gf_gcdex, gf_sqf_p, gf_factor_sqf)
 
@@ -21,6 +22,19 @@
 INT_ZERO = 0
 INT_ONE  = 1
 
+# use Karatsuba multiplication when both factors have more coefficients
+ZZX_KARATSUBA_CUTOFF = 48
+
+# multiply polynomials in Z[X] in packed (Kronecker) form when the flat
+# coefficient array of the product has at most this many entries
+ZZX_PACKING_LIMIT = 2**18
+
+# modular GCD algorithms use primes following this one
+ZZX_MOD_GCD_PRIME = 2**31
+
+# use van Hoeij's recombination when there are more modular factors
+ZZX_VAN_HOEIJ_CUTOFF = 8
+
 from copy import deepcopy
 
 def factorial(m):
@@ -808,6 +822,248 @@ def zzX_sub_mul(f, g, h):
     """Returns f - g*h where f, g, h in Z[X]. """
     return zzX_sub(f, zzX_mul(g, h))
 
+def _zzx_mul_base(f, g):
+    """Schoolbook multiplication of little endian coefficient lists. """
+    h = [INT_ZERO]*(len(f) + len(g) - 1)
+
+    for i, a in enumerate(f):
+        if a:
+            for j, b in enumerate(g):
+                h[i+j] += a*b
+
+    return h
+
+def _zzx_sqr_base(f):
+    """Schoolbook squaring of a little endian coefficient list. """
+    n = len(f)
+    h = [INT_ZERO]*(2*n - 1)
+
+    for i in xrange(0, n):
+        a = f[i]
+
+        if a:
+            b = a + a
+
+            for j in xrange(i+1, n):
+                h[i+j] += b*f[j]
+
+            h[i+i] += a*a
+
+    return h
+
+def _zzx_add_le(f, g):
+    """Add little endian coefficient lists (without stripping). """
+    if len(f) < len(g):
+        f, g = g, f
+
+    h = list(f)
+
+    for i, b in enumerate(g):
+        h[i] += b
+
+    return h
+
+def _zzx_karatsuba(f, g):
+    """Karatsuba multiplication of little endian coefficient lists. """
+    n, m = len(f), len(g)
+
+    if n < m:
+        f, g, n, m = g, f, m, n
+
+    if m <= ZZX_KARATSUBA_CUTOFF:
+        return _zzx_mul_base(f, g)
+
+    h = [INT_ZERO]*(n + m - 1)
+
+    if 2*m <= n:
+        # unbalanced case: multiply g by m-sized slices of f
+        for i in xrange(0, n, m):
+            for j, c in enumerate(_zzx_karatsuba(f[i:i+m], g)):
+                h[i+j] += c
+
+        return h
+
+    k = n // 2
+
+    f0, f1 = f[:k], f[k:]
+    g0, g1 = g[:k], g[k:]
+
+    lo = _zzx_karatsuba(f0, g0)
+    hi = _zzx_karatsuba(f1, g1)
+    mid = _zzx_karatsuba(_zzx_add_le(f0, f1), _zzx_add_le(g0, g1))
+
+    for i, c in enumerate(lo):
+        h[i] += c
+        h[i+k] -= c
+
+    for i, c in enumerate(hi):
+        h[i+2*k] += c
+        h[i+k] -= c
+
+    for i, c in enumerate(mid):
+        h[i+k] += c
+
+    return h
+
+def _zzx_karatsuba_sqr(f):
+    """Karatsuba squaring of a little endian coefficient list. """
+    n = len(f)
+
+    if n <= ZZX_KARATSUBA_CUTOFF:
+        return _zzx_sqr_base(f)
+
+    k = n // 2
+    f0, f1 = f[:k], f[k:]
+
+    lo = _zzx_karatsuba_sqr(f0)
+    hi = _zzx_karatsuba_sqr(f1)
+    mid = _zzx_karatsuba_sqr(_zzx_add_le(f0, f1))
+
+    h = [INT_ZERO]*(2*n - 1)
+
+    for i, c in enumerate(lo):
+        h[i] += c
+        h[i+k] -= c
+
+    for i, c in enumerate(hi):
+        h[i+2*k] += c
+        h[i+k] -= c
+
+    for i, c in enumerate(mid):
+        h[i+k] += c
+
+    return h
+
+def zzx_karatsuba_mul(f, g):
+    """Multiply polynomials in Z[x] using Karatsuba's algorithm. """
+    if not (f and g):
+        return []
+
+    f, g = list(f), list(g)
+
+    f.reverse()
+    g.reverse()
+
+    h = _zzx_karatsuba(f, g)
+    h.reverse()
+
+    return zzx_strip(h)
+
+def zzx_karatsuba_sqr(f):
+    """Square polynomials in Z[x] using Karatsuba's algorithm. """
+    if not f:
+        return []
+
+    f = list(f)
+    f.reverse()
+
+    h = _zzx_karatsuba_sqr(f)
+    h.reverse()
+
+    return h
+
+def zzX_pack(f, N):
+    """Pack f in Z[X] into a flat coefficient array.
+
+       The result is a little endian list of coefficients of the
+       univariate polynomial obtained by Kronecker substitution of
+       x_k with y**S_k, where strides S are computed from N, the
+       numbers of slots per variable (N_k must exceed the degree
+       of f in x_k). Returns the flat list and the strides.
+
+       >>> from sympy.polys.integerpolys import zzX_pack
+       >>> zzX_pack([[1, 2], [3]], (3, 3))
+       ([3, 0, 0, 2, 1, 0, 0, 0, 0], (3, 1))
+
+    """
+    S, stride = [], 1
+
+    for n in reversed(N):
+        S.append(stride)
+        stride *= n
+
+    S.reverse()
+
+    flat = [INT_ZERO]*stride
+    last = len(N) - 1
+
+    def rec_pack(g, l, offset):
+        s, d = S[l], len(g) - 1
+
+        if l == last:
+            for i, coeff in enumerate(g):
+                flat[offset + (d-i)*s] = coeff
+        else:
+            for i, coeff in enumerate(g):
+                rec_pack(coeff, l+1, offset + (d-i)*s)
+
+    rec_pack(f, 0, 0)
+
+    return flat, tuple(S)
+
+def zzX_unpack(flat, N, S):
+    """Unpack a flat coefficient array into a polynomial in Z[X].
+
+       This is the inverse of zzX_pack(). Entries of ``flat`` past
+       its end are assumed to be zero.
+
+       >>> from sympy.polys.integerpolys import zzX_unpack
+       >>> zzX_unpack([3, 0, 0, 2, 1], (3, 3), (3, 1))
+       [[1, 2], [3]]
+
+    """
+    last, size = len(N) - 1, len(flat)
+
+    def rec_unpack(l, offset):
+        s, n = S[l], N[l]
+
+        if l == last:
+            g = flat[offset:offset+n]
+            g.reverse()
+            return zzx_strip(g)
+        else:
+            g = [ rec_unpack(l+1, offset + i*s) for i in xrange(0, n) if offset + i*s < size ]
+
+            if not g:
+                return zzX_zero(last - l + 1)
+
+            g.reverse()
+            return zzX_strip(g)
+
+    return rec_unpack(0, 0)
+
+def _zzX_terms(f):
+    """Returns the number of non-zero terms of f in Z[X]. """
+    if poly_univariate_p(f):
+        return len([ coeff for coeff in f if coeff ])
+    else:
+        return sum([ _zzX_terms(coeff) for coeff in f ])
+
+def _zzX_packed_mul(f, g):
+    """Multiply f and g in Z[X] in packed form, if it pays off.
+
+       Packing is used when the flat array of the product is not larger
+       than the number of term products (i.e. inputs are dense enough)
+       and does not exceed ZZX_PACKING_LIMIT. Otherwise returns None.
+    """
+    F = zzX_degree_all(f)
+    G = zzX_degree_all(g)
+
+    N, size = [], 1
+
+    for df, dg in zip(F, G):
+        N.append(df + dg + 1)
+        size *= df + dg + 1
+
+    if size > ZZX_PACKING_LIMIT or size > _zzX_terms(f)*_zzX_terms(g):
+        return None
+
+    f, S = zzX_pack(f, N)
+    g, S = zzX_pack(g, N)
+
+    return zzX_unpack(_zzx_karatsuba(zzx_strip(f[::-1])[::-1],
+                                     zzx_strip(g[::-1])[::-1]), N, S)
+
 def zzx_mul(f, g):
     """Multiply polynomials in Z[x]. """
     if f == g:
@@ -819,6 +1075,9 @@ def zzx_mul(f, g):
     df = zzx_degree(f)
     dg = zzx_degree(g)
 
+    if df >= ZZX_KARATSUBA_CUTOFF and dg >= ZZX_KARATSUBA_CUTOFF:
+        return zzx_karatsuba_mul(f, g)
+
     h = []
 
     for i in xrange(0, df+dg+1):
@@ -844,6 +1103,11 @@ def zzX_mul(f, g):
     if zzX_zero_p(g):
         return g
 
+    h = _zzX_packed_mul(f, g)
+
+    if h is not None:
+        return h
+
     df = zzX_degree(f)
     dg = zzX_degree(g)
 
@@ -861,6 +1125,9 @@ def zzX_mul(f, g):
 
 def zzx_sqr(f):
     """Square polynomials in Z[x]. """
+    if zzx_degree(f) >= ZZX_KARATSUBA_CUTOFF:
+        return zzx_karatsuba_sqr(f)
+
     df, h = zzx_degree(f), []
 
     for i in xrange(0, 2*df+1):
@@ -894,6 +1161,17 @@ def zzX_sqr(f):
     if zzX_zero_p(f):
         return f
 
+    F = zzX_degree_all(f)
+    N, size = [], 1
+
+    for df in F:
+        N.append(2*df + 1)
+        size *= 2*df + 1
+
+    if size <= ZZX_PACKING_LIMIT and size <= _zzX_terms(f)**2:
+        f, S = zzX_pack(f, N)
+        return zzX_unpack(_zzx_karatsuba_sqr(zzx_strip(f[::-1])[::-1]), N, S)
+
     df = zzX_degree(f)
     l = poly_level(f)-1
 
@@ -1381,25 +1659,58 @@ def zzx_gcd(f, g, **flags):
     return zzx_cofactors(f, g, **flags)[0]
 
 def zzx_cofactors(f, g, **flags):
-    """Returns polynomial GCD and its co-factors in Z[x]. """
-    return zzx_heu_gcd(f, g, **flags)
+    """Returns polynomial GCD and its co-factors in Z[x].
+
+       The algorithm can be selected with method flag. By default
+       heuristic GCD is used, with fallback to the modular algorithm
+       if it fails. Use method='modular' to use modular GCD only.
+    """
+    method = flags.get('method', 'heuristic')
+
+    if method == 'heuristic':
+        try:
+            return zzx_heu_gcd(f, g, **flags)
+        except HeuristicGCDFailed:
+            pass
+    elif method != 'modular':
+        raise ValueError("Unknown GCD method: %s" % method)
+
+    return zzx_mod_gcd(f, g, **flags)
 
 def zzX_gcd(f, g, **flags):
     """Returns polynomial GCD in Z[X]. """
     return zzX_cofactors(f, g, **flags)[0]
 
 def zzX_cofactors(f, g, **flags):
-    """Returns polynomial GCD and its co-factors in Z[X]. """
+    """Returns polynomial GCD and its co-factors in Z[X].
+
+       The algorithm can be selected with method flag, the same
+       way as in zzx_cofactors(). In the multivariate case, unless
+       reduced=False is given, polynomials are first deflated.
+    """
     if poly_univariate_p(f):
-        return zzx_heu_gcd(f, g, **flags)
+        return zzx_cofactors(f, g, **flags)
+
+    def cofactors(f, g):
+        method = flags.get('method', 'heuristic')
+
+        if method == 'heuristic':
+            try:
+                return zzX_heu_gcd(f, g, **flags)
+            except HeuristicGCDFailed:
+                pass
+        elif method != 'modular':
+            raise ValueError("Unknown GCD method: %s" % method)
+
+        return zzX_mod_gcd(f, g, **flags)
 
     if not flags.get('reduced', True):
-        return zzX_heu_gcd(f, g, **flags)
+        return cofactors(f, g)
     else:
         K, (f, g) = zzX_multi_reduce(f, g)
 
         return [ zzX_compose_term(h, K)
-            for h in zzX_heu_gcd(f, g, **flags) ]
+            for h in cofactors(f, g) ]
 
 def zzx_heu_gcd(f, g, **flags):
     """Heuristic polynomial GCD over Z[x].
@@ -1645,7 +1956,246 @@ def finalize(h, cff, cfg, gcd):
 
     raise HeuristicGCDFailed('no luck')
 
-# XXX: this is completely broken
+def _gfX_normal(f, u, p):
+    """Reduce all coefficients of f in Z[X] modulo p. """
+    if u == 1:
+        return gf_normal(f, p)
+    else:
+        return zzX_strip([ _gfX_normal(c, u-1, p) for c in f ])
+
+def _gfX_to_dict(f, u):
+    """Convert GF(p)[X] polynomial to a dict with tuple monomials. """
+    if u == 1:
+        n = gf_degree(f)
+        return dict([ ((n-i,), c) for i, c in enumerate(f) if c ])
+    else:
+        return zzX_to_dict(f)
+
+def _gfX_from_dict(f, u):
+    """Create GF(p)[X] polynomial from a dict with tuple monomials. """
+    if u == 1:
+        return zzx_from_dict(dict([ (m, c) for (m,), c in f.iteritems() ]))
+    else:
+        return zzX_from_dict(f, u)
+
+def _gfX_LM(f, u):
+    """Returns leading monomial of f in lexicographic order. """
+    if u == 1:
+        return (gf_degree(f),)
+    else:
+        return (len(f)-1,) + _gfX_LM(f[0], u-1)
+
+def _gfX_LC_last(f, u):
+    """Returns leading coefficient of f as a polynomial in x_u. """
+    if u == 1:
+        return f
+    else:
+        return _gfX_LC_last(f[0], u-1)
+
+def _gfX_degree_last(f, u):
+    """Returns degree of f in the last variable x_u. """
+    if u == 1:
+        return gf_degree(f)
+    else:
+        return max([ _gfX_degree_last(c, u-1) for c in f ])
+
+def _gfX_content_last(f, u, p):
+    """Returns GCD of coefficients of f as a polynomial in x_u. """
+    if u == 1:
+        return gf_monic(f, p)[1]
+
+    cont = []
+
+    for c in f:
+        cont = gf_gcd(cont, _gfX_content_last(c, u-1, p), p)
+
+        if cont == [1]:
+            break
+
+    return cont
+
+def _gfX_map_last(f, u, func):
+    """Apply func to all coefficients of f as a polynomial in x_u. """
+    if u == 1:
+        return func(f)
+    else:
+        return zzX_strip([ _gfX_map_last(c, u-1, func) for c in f ])
+
+def _gfX_eval_last(f, a, u, p):
+    """Evaluate f in GF(p)[X] at x_u = a. """
+    if u == 2:
+        return gf_strip([ gf_eval(c, a, p) for c in f ])
+    else:
+        return zzX_strip([ _gfX_eval_last(c, a, u-1, p) for c in f ])
+
+def _gfX_eval_init(f, A, u, p):
+    """Evaluate f in GF(p)[X] at x_1, ..., x_{u-1} = A. """
+    if u == 1:
+        return f
+
+    result = []
+
+    for c in f:
+        result = gf_add(gf_mul_const(result, A[0], p),
+            _gfX_eval_init(c, A[1:], u-1, p), p)
+
+    return result
+
+def _gfX_degree_bound_last(f, g, u, p):
+    """Returns an upper bound for the degree of gcd(f, g) in x_u. """
+    df = _gfX_degree_last(f, u)
+    dg = _gfX_degree_last(g, u)
+
+    for i in xrange(0, 3):
+        A = [ randint(1, p-1) for j in xrange(1, u) ]
+
+        F = _gfX_eval_init(f, A, u, p)
+        G = _gfX_eval_init(g, A, u, p)
+
+        if gf_degree(F) == df and gf_degree(G) == dg:
+            return gf_degree(gf_gcd(F, G, p))
+
+    return min(df, dg)
+
+def _gfX_div(f, g, u, p):
+    """Returns quotient and remainder in GF(p)[X]. """
+    if u == 1:
+        return gf_div(f, g, p)
+
+    df = zzX_degree(f)
+    dg = zzX_degree(g)
+
+    if dg < 0:
+        raise ZeroDivisionError("polynomial division")
+
+    q, r = zzX_zero_of(f), f
+
+    if df < dg:
+        return q, r
+
+    while True:
+        dr = zzX_degree(r)
+
+        if dr < dg:
+            break
+
+        c, R = _gfX_div(poly_LC(r), poly_LC(g), u-1, p)
+
+        if not zzX_zero_p(R):
+            break
+
+        k = dr - dg
+
+        q = zzX_add_term(q, c, k)
+        h = zzX_mul_term(g, c, k)
+        r = _gfX_normal(zzX_sub(r, h), u, p)
+
+    return q, r
+
+def _gfX_divides_p(h, f, u, p):
+    """Returns True if h divides f in GF(p)[X]. """
+    return zzX_zero_p(_gfX_div(f, h, u, p)[1])
+
+def _gfX_gcd(f, g, u, p):
+    """Dense modular GCD in GF(p)[X] by evaluation and interpolation.
+
+       Variables are eliminated one by one from the last one, using
+       Brown's algorithm. Returns the GCD of f and g normalized to be
+       monic with respect to lexicographic order. Evaluation points,
+       which don't preserve degrees of the images, are skipped.
+
+       Evaluation points are taken in order starting from a random one.
+       An unlucky point can't be recognized by degrees of the images if
+       it comes first, so the interpolated GCD is verified by division
+       in GF(p)[X] and rejected, in favour of new points, if it fails.
+    """
+    if u == 1:
+        return gf_gcd(f, g, p)
+
+    cf = _gfX_content_last(f, u, p)
+    cg = _gfX_content_last(g, u, p)
+
+    cont = gf_gcd(cf, cg, p)
+
+    f = _gfX_map_last(f, u, lambda c: gf_quo(c, cf, p))
+    g = _gfX_map_last(g, u, lambda c: gf_quo(c, cg, p))
+
+    lcf = _gfX_LC_last(f, u)
+    lcg = _gfX_LC_last(g, u)
+
+    gamma = gf_gcd(lcf, lcg, p)
+
+    bound = _gfX_degree_bound_last(f, g, u, p) + gf_degree(gamma)
+
+    H, m, D = None, [1], None
+
+    start = randint(0, p-1)
+
+    for i in xrange(0, p):
+        a = (start + i) % p
+
+        if not (gf_eval(lcf, a, p) and gf_eval(lcg, a, p)):
+            continue
+
+        h = _gfX_gcd(_gfX_eval_last(f, a, u, p),
+                     _gfX_eval_last(g, a, u, p), u-1, p)
+
+        d = _gfX_LM(h, u-1)
+
+        if not any(d):
+            H = zzX_const(u, 1)
+            break
+
+        if D is not None:
+            if d > D:
+                continue
+            elif d < D:
+                H, m = None, [1]
+
+        D, b = d, gf_eval(gamma, a, p)
+
+        if H is None:
+            H = dict([ (M, [(b*c) % p])
+                for M, c in _gfX_to_dict(h, u-1).iteritems() ])
+        else:
+            h = _gfX_to_dict(h, u-1)
+            s = zp_inv(gf_eval(m, a, p), p)
+
+            for M in set(H) | set(h):
+                c = H.get(M, [])
+                e = ((b*h.get(M, 0) - gf_eval(c, a, p))*s) % p
+
+                if e:
+                    H[M] = gf_add(c, gf_mul_const(m, e, p), p)
+
+        m = gf_mul(m, [1, -a % p], p)
+
+        if gf_degree(m) > bound:
+            h = {}
+
+            for M, c in H.iteritems():
+                n = gf_degree(c)
+
+                for i, coeff in enumerate(c):
+                    if coeff:
+                        h[M + (n-i,)] = coeff
+
+            H = _gfX_from_dict(h, u)
+            cH = _gfX_content_last(H, u, p)
+            H = _gfX_map_last(H, u, lambda c: gf_quo(c, cH, p))
+
+            if _gfX_divides_p(H, f, u, p) and _gfX_divides_p(H, g, u, p):
+                break
+
+            H, m, D = None, [1], None
+    else:
+        raise ValueError("not enough evaluation points in GF(%s)" % p)
+
+    H = _gfX_map_last(H, u, lambda c: gf_mul(c, cont, p))
+    inv = zp_inv(zzX_zz_LC(H), p)
+
+    return _gfX_map_last(H, u, lambda c: gf_mul_const(c, inv, p))
+
 def zzx_mod_gcd(f, g, **flags):
     """Modular small primes polynomial GCD over Z[x].
 
@@ -1654,150 +2204,148 @@ def zzx_mod_gcd(f, g, **flags):
 
               h = gcd(f, g), cff = quo(f, h) and cfg = quo(g, h)
 
-       The algorithm uses modular small primes approach. It works by
-       computing several GF(p)[x] GCDs for a set of randomly chosen
-       primes and uses Chinese Remainder Theorem to recover the GCD
-       over Z[x] from its images.
+       This is a special case of zzX_mod_gcd(), see its docstring
+       for more information on the implemented algorithm.
 
-       The algorithm is probabilistic which means it never fails,
-       however its running time depends on the number of unlucky
-       primes chosen for computing GF(p)[x] images.
+    """
+    return zzX_mod_gcd(f, g, **flags)
 
-       For more details on the implemented algorithm refer to:
+def zzX_mod_gcd(f, g, **flags):
+    """Modular multi-prime polynomial GCD in Z[X].
 
-       [1] J. von zur Gathen, J. Gerhard, Modern Computer Algebra,
-           First Edition, Cambridge University Press, 1999, pp. 158
+       Given polynomials f and g in Z[X], returns their GCD and cofactors,
+       i.e. polynomials h, cff and cfg such that:
 
-    """
-    if not (f or g):
-        return [], [], []
-    elif not f:
-        return g, [], [1]
-    elif not g:
-        return f, [1], []
+              h = gcd(f, g), cff = quo(f, h) and cfg = quo(g, h)
 
-    n = zzx_degree(f)
-    m = zzx_degree(g)
+       The algorithm computes GCDs of images of f and g in GF(p)[X] for
+       a sequence of primes (in the multivariate case using Brown's dense
+       evaluation and interpolation algorithm) and combines them using
+       Chinese Remainder Theorem. Primes dividing leading coefficients
+       are skipped and images of too high degree are discarded. As soon
+       as the combined polynomial doesn't change after adding another
+       prime, its primitive part is tested by trial division.
 
-    cf = zzx_content(f)
-    cg = zzx_content(g)
-
-    gcd = igcd(cf, cg)
+       If an image of the GCD is constant, the polynomials are coprime
+       and the algorithm terminates early, without any trial division.
 
-    f = [ c // gcd for c in f ]
-    g = [ c // gcd for c in g ]
+       If the same candidate fails trial division twice, all images
+       collected so far are discarded and the algorithm starts over.
 
-    if n == 0 or m == 0:
-        return [gcd], f, g
+       For more details on the implemented algorithm refer to:
 
-    A = max(zzx_abs(f) + zzx_abs(g))
-    b = igcd(poly_LC(f), poly_LC(g))
+       [1] W.S. Brown, On Euclid's Algorithm and the Computation of
+           Polynomial Greatest Common Divisors, J. ACM 18 (1971),
+           pp. 478-504
 
-    B = int(ceil(2**n*A*b*int(sqrt(n + 1))))
-    k = int(ceil(2*b*log((n + 1)**n*A**(2*n), 2)))
-    l = int(ceil(log(2*B + 1, 2)))
+       [2] K.O. Geddes, S.R. Czapor, G. Labahn, Algorithms for Computer
+           Algebra, Kluwer Academic Publishers, 1992, pp. 300-316
 
-    prime_max = max(int(ceil(2*k*log(k))), 51)
+    """
+    u = poly_level(f)
 
-    while True:
-        while True:
-            primes  = set([])
-            unlucky = set([])
+    zero_f = zzX_zero_p(f)
+    zero_g = zzX_zero_p(g)
 
-            ff, gg, hh = {}, {}, {}
+    z = zzX_zero(u)
 
-            while len(primes) < l:
-                p = randprime(3, prime_max+1)
+    if zero_f and zero_g:
+        return z, z, z
+    elif zero_f:
+        return g, z, zzX_const(u, 1)
+    elif zero_g:
+        return f, zzX_const(u, 1), z
 
-                if (p in primes) or (b % p == 0):
-                    continue
+    cf = zzX_zz_content(f)
+    cg = zzX_zz_content(g)
 
-                F = gf_from_int_poly(f, p)
-                G = gf_from_int_poly(g, p)
+    gcd = igcd(cf, cg)
 
-                H = gf_gcd(F, G, p)
+    f = zzX_quo_const(f, gcd)
+    g = zzX_quo_const(g, gcd)
 
-                primes.add(p)
+    lcf = zzX_zz_LC(f)
+    lcg = zzX_zz_LC(g)
 
-                ff[p] = F
-                gg[p] = G
-                hh[p] = H
+    gamma = igcd(lcf, lcg)
 
-            e = min([ gf_degree(h) for h in hh.itervalues() ])
+    H, M, D, failed = None, 1, None, None
 
-            for p in set(primes):
-                if gf_degree(hh[p]) != e:
-                    primes.remove(p)
-                    unlucky.add(p)
+    p = ZZX_MOD_GCD_PRIME
 
-                    del ff[p]
-                    del gg[p]
-                    del hh[p]
+    while True:
+        p = nextprime(p)
 
-            if len(primes) < l // 2:
-                continue
+        if not (lcf % p and lcg % p):
+            continue
 
-            while len(primes) < l:
-                p = randprime(3, prime_max+1)
+        h = _gfX_gcd(_gfX_normal(f, u, p),
+                     _gfX_normal(g, u, p), u, p)
 
-                if (p in primes) or (p in unlucky) or (b % p == 0):
-                    continue
+        d = _gfX_LM(h, u)
 
-                F = gf_from_int_poly(f, p)
-                G = gf_from_int_poly(g, p)
+        if not any(d):
+            return zzX_const(u, gcd), f, g
 
-                H = gf_gcd(F, G, p)
+        if D is not None:
+            if d > D:
+                continue
+            elif d < D:
+                H = None
 
-                if gf_degree(H) != e:
-                    unlucky.add(p)
-                else:
-                    primes.add(p)
+        h = _gfX_to_dict(h, u)
 
-                    ff[p] = F
-                    gg[p] = G
-                    hh[p] = H
+        if H is None:
+            H, M, D = {}, p, d
 
-            break
+            for monom, coeff in h.iteritems():
+                coeff = (gamma*coeff) % p
 
-        fff, ggg = {}, {}
+                if coeff > p // 2:
+                    coeff -= p
 
-        for p in primes:
-            fff[p] = gf_quo(ff[p], hh[p], p)
-            ggg[p] = gf_quo(gg[p], hh[p], p)
+                H[monom] = coeff
 
-        F, G, H = [], [], []
+            continue
 
+        primes = [M, p]
         crt_mm, crt_e, crt_s = crt1(primes)
 
-        for i in xrange(0, e + 1):
-            C = [ b * poly_nth(hh[p], i) for p in primes ]
-            c = crt2(primes, C, crt_mm, crt_e, crt_s, True)
+        H_new = {}
 
-            H.insert(0, c)
+        for monom in set(H) | set(h):
+            coeff = crt2(primes, [H.get(monom, 0), gamma*h.get(monom, 0)],
+                crt_mm, crt_e, crt_s, True)
 
-        H = zzx_strip(H)
+            if coeff:
+                H_new[monom] = coeff
 
-        for i in xrange(0, zzx_degree(f) - e + 1):
-            C = [ poly_nth(fff[p], i) for p in primes ]
-            c = crt2(primes, C, crt_mm, crt_e, crt_s, True)
+        M *= p
 
-            F.insert(0, c)
+        if H_new == H:
+            h = _gfX_from_dict(H, u)
+            h = zzX_zz_primitive(h)[1]
 
-        for i in xrange(0, zzx_degree(g) - e + 1):
-            C = [ poly_nth(ggg[p], i) for p in primes ]
-            c = crt2(primes, C, crt_mm, crt_e, crt_s, True)
+            if zzX_zz_LC(h) < 0:
+                h = zzX_neg(h)
 
-            G.insert(0, c)
+            cff, r = zzX_div(f, h)
 
-        H_norm = zzx_l1_norm(H)
+            if zzX_zero_p(r):
+                cfg, r = zzX_div(g, h)
 
-        F_norm = zzx_l1_norm(F)
-        G_norm = zzx_l1_norm(G)
+                if zzX_zero_p(r):
+                    return zzX_mul_const(h, gcd), cff, cfg
 
-        if H_norm*F_norm <= B and H_norm*G_norm <= B:
-            break
+            if H == failed:
+                # the same candidate failed twice, so the images
+                # seem to be unlucky, start over with new primes
+                H, D = None, None
+                continue
+
+            failed = H
 
-    return zzx_mul_const(H, gcd), F, G
+        H = H_new
 
 def zzx_hensel_step(m, f, g, h, s, t):
     """One step in Hensel lifting.
@@ -1909,7 +2457,271 @@ def zzx_hensel_lift(p, f, f_list, l):
     return zzx_hensel_lift(p, g, f_list[:k], l) \
          + zzx_hensel_lift(p, h, f_list[k:], l)
 
-def zzx_zassenhaus(f):
+def zz_lll(B):
+    """LLL reduction of a lattice basis over integers.
+
+       Given a list B of linearly independent integer vectors (rows)
+       returns an LLL-reduced basis (with delta = 3/4) of the lattice
+       spanned by B. All computations are done over integers, using
+       integral (fraction-free) version of the algorithm.
+
+       >>> zz_lll([[1, 1, 1], [-1, 0, 2], [3, 5, 6]])
+       [[0, 1, 0], [1, 0, 1], [-1, 0, 2]]
+
+       For more details on the implemented algorithm refer to:
+
+       [1] H. Cohen, A Course in Computational Algebraic Number Theory,
+           Springer, 1993, pp. 94
+
+    """
+    return _zz_lll(B)[0]
+
+def _zz_dot(u, v):
+    """Returns inner product of two integer vectors. """
+    return sum([ a*b for a, b in zip(u, v) ])
+
+def _zz_lll(B):
+    """Integral LLL, returns the basis and Gram determinants. """
+    n = len(B)
+
+    b = [None] + [ list(row) for row in B ]
+    d = [1] + [0]*n
+
+    lam = [ [0]*(n+1) for i in xrange(n+1) ]
+
+    def reduce(k, l):
+        if 2*abs(lam[k][l]) > d[l]:
+            q = (2*lam[k][l] + d[l]) // (2*d[l])
+
+            b[k] = [ u - q*v for u, v in zip(b[k], b[l]) ]
+            lam[k][l] -= q*d[l]
+
+            for i in xrange(1, l):
+                lam[k][i] -= q*lam[l][i]
+
+    def swap(k):
+        b[k], b[k-1] = b[k-1], b[k]
+
+        for j in xrange(1, k-1):
+            lam[k][j], lam[k-1][j] = lam[k-1][j], lam[k][j]
+
+        mu = lam[k][k-1]
+        D = (d[k-2]*d[k] + mu**2) // d[k-1]
+
+        for i in xrange(k+1, kmax+1):
+            t = lam[i][k]
+            lam[i][k] = (d[k]*lam[i][k-1] - mu*t) // d[k-1]
+            lam[i][k-1] = (D*t + mu*lam[i][k]) // d[k]
+
+        d[k-1] = D
+
+    if n:
+        d[1] = _zz_dot(b[1], b[1])
+
+    k, kmax = 2, 1
+
+    while k <= n:
+        if k > kmax:
+            kmax = k
+
+            for j in xrange(1, k+1):
+                u = _zz_dot(b[k], b[j])
+
+                for i in xrange(1, j):
+                    u = (d[i]*u - lam[k][i]*lam[j][i]) // d[i-1]
+
+                if j < k:
+                    lam[k][j] = u
+                elif not u:
+                    raise ValueError("vectors are linearly dependent")
+                else:
+                    d[k] = u
+
+        reduce(k, k-1)
+
+        if 4*d[k]*d[k-2] < 3*d[k-1]**2 - 4*lam[k][k-1]**2:
+            swap(k)
+            k = max(2, k-1)
+        else:
+            for l in xrange(k-2, 0, -1):
+                reduce(k, l)
+
+            k += 1
+
+    return b[1:], d
+
+def _zz_row_basis(M):
+    """Returns a basis of the lattice generated by rows of M. """
+    rows, basis, i = [ u for u in M if any(u) ], [], 0
+
+    while rows:
+        pivots, rest = [], []
+
+        for u in rows:
+            if u[i]:
+                pivots.append(u)
+            else:
+                rest.append(u)
+
+        while len(pivots) > 1:
+            pivots.sort(key=lambda u: abs(u[i]))
+            v, tail, pivots = pivots[0], pivots[1:], pivots[:1]
+
+            for u in tail:
+                q = u[i] // v[i]
+                u = [ a - q*c for a, c in zip(u, v) ]
+
+                if u[i]:
+                    pivots.append(u)
+                elif any(u):
+                    rest.append(u)
+
+        if pivots:
+            basis.append(pivots[0])
+
+        rows, i = rest, i + 1
+
+    return basis
+
+def _zzx_power_sums(g, s, m):
+    """Power sums 1..s of roots of a monic g in Z[x], modulo m. """
+    c, P = g[1:], []
+
+    for k in xrange(1, s+1):
+        if k <= len(c):
+            t = k*c[k-1]
+        else:
+            t = 0
+
+        for i in xrange(1, min(k, len(c)+1)):
+            t += c[i-1]*P[k-i-1]
+
+        P.append(-t % m)
+
+    return P
+
+def zzx_van_hoeij(f, p, modular, l):
+    """Van Hoeij's knapsack recombination of modular factors.
+
+       Given a primitive square-free polynomial f in Z[x], a prime p
+       and monic factors of f modulo p, such that p**l bounds twice
+       the coefficients of factors of f, returns a list of irreducible
+       factors of f or None if recombination failed.
+
+       Instead of checking all subsets of modular factors, factors are
+       lifted with sufficient precision and power sums of their roots
+       are used to construct a knapsack lattice. Indicator vectors of
+       true factors are short vectors in this lattice, so they can be
+       found using LLL, in time polynomial in the number of factors.
+
+       >>> zzx_van_hoeij([1, 0, -10, 0, 1], 5, [[1, 0, 2], [1, 0, 3]], 5)
+       [[1, 0, -10, 0, 1]]
+
+       For more details on the implemented algorithm refer to:
+
+       [1] M. van Hoeij, Factoring Polynomials and the Knapsack Problem,
+           Journal of Number Theory 95, 2002, pp. 167-189
+
+       [2] K. Belabas, A Relative van Hoeij Algorithm over Number Fields,
+           Journal of Symbolic Computation 37, 2004, pp. 641-668
+
+    """
+    n, r = zzx_degree(f), len(modular)
+
+    b = poly_LC(f)
+    R = abs(b) + zzx_max_norm(f)
+
+    M = [ [0]*i + [1] + [0]*(r - i - 1) for i in xrange(0, r) ]
+    J = 0
+
+    while J < n:
+        s = min(n - J, len(M))
+
+        # power sums of roots of factors of f, multiplied by b**j,
+        # are bounded by n*R**j, so only leading digits are needed
+        bound, a = n*R**(J + s), 0
+
+        while p**a < bound:
+            a += 1
+
+        D, N = len(M) + s, r + (r + 1)**2*s
+        e = 0
+
+        while p**(2*e*s) < (2**D*N)**D:
+            e += 1
+
+        L = max(l, a + e)
+
+        m, q, h = p**L, p**(L - e), p**e
+
+        g = zzx_hensel_lift(p, f, modular, L)
+
+        T = []
+
+        for g_i in g:
+            P = _zzx_power_sums(g_i, J + s, m)[J:]
+
+            T.append([ (b**(J + j + 1)*P[j] % m) // q
+                for j in xrange(0, s) ])
+
+        basis = []
+
+        for u in M:
+            row = list(u)
+
+            for j in xrange(0, s):
+                row.append(sum([ u_i*T[i][j]
+                    for i, u_i in enumerate(u) if u_i ]) % h)
+
+            basis.append(row)
+
+        for j in xrange(0, s):
+            row = [0]*(r + s)
+            row[r + j] = h
+            basis.append(row)
+
+        basis, d = _zz_lll(basis)
+
+        # drop vectors which can't contribute to short vectors
+        k = len(basis)
+
+        while k > 0 and d[k] > N*d[k-1]:
+            k -= 1
+
+        M, J = _zz_row_basis([ u[:r] for u in basis[:k] ]), J + s
+
+        # factors are given by groups of equal columns
+        blocks = {}
+
+        for i in xrange(0, r):
+            column = tuple([ u[i] for u in M ])
+            blocks.setdefault(column, []).append(i)
+
+        k = len(M)
+
+        if len(blocks) == k and tuple([0]*k) not in blocks:
+            factors, degree = [], 0
+
+            for S in blocks.itervalues():
+                G = [b]
+
+                for i in S:
+                    G = zzx_mul(G, g[i])
+
+                G = zzx_primitive(zzx_trunc(G, m))[1]
+
+                if zzx_div(f, G)[1]:
+                    break
+
+                factors.append(G)
+                degree += zzx_degree(G)
+            else:
+                if degree == n:
+                    return factors
+
+    return None
+
+def zzx_zassenhaus(f, **flags):
     """Factor primitive square-free polynomials in Z[x]. """
     n = zzx_degree(f)
 
@@ -1939,6 +2751,22 @@ def zzx_zassenhaus(f):
     for ff in gf_factor_sqf(F, p)[1]:
         modular.append(gf_to_int_poly(ff, p))
 
+    method = flags.get('recombine')
+
+    if method is None:
+        if len(modular) > ZZX_VAN_HOEIJ_CUTOFF:
+            method = 'van_hoeij'
+        else:
+            method = 'subsets'
+
+    if method == 'van_hoeij':
+        factors = zzx_van_hoeij(f, p, modular, l)
+
+        if factors is not None:
+            return factors
+    elif method != 'subsets':
+        raise ValueError("invalid recombination method: %s" % method)
+
     g = zzx_hensel_lift(p, f, modular, l)
 
     T = set(range(len(g)))
@@ -2025,6 +2853,11 @@ def zzx_factor(f, **flags):
        using cyclotomic decomposition to speedup computations. To
        disable this behaviour set cyclotomic=False.
 
+       Modular factors are recombined by checking their subsets, or
+       using van Hoeij's algorithm when there are more factors than
+       ZZX_VAN_HOEIJ_CUTOFF. Set recombine='subsets' or 'van_hoeij'
+       to choose the recombination method explicitly.
+
        For more details on the implemented algorithm refer to:
 
        [1] J. von zur Gathen, J. Gerhard, Modern Computer Algebra,
@@ -2050,7 +2883,7 @@ def zzx_factor(f, **flags):
         H = zzx_cyclotomic_factor(g)
 
     if H is None:
-        H = zzx_zassenhaus(g)
+        H = zzx_zassenhaus(g, **flags)
 
     for h in H:
         k = 0
@@ -2101,7 +2934,7 @@ def zzx_factor_sqf(f, **flags):
         factors = zzx_cyclotomic_factor(g)
 
     if factors is None:
-        factors = zzx_zassenhaus(g)
+        factors = zzx_zassenhaus(g, **flags)
 
     def compare(f_a, f_b):
         i = len(f_a) - len(f_b)
@@ -103,6 +103,42 @@ def monomial_cmp(order):
     except KeyError:
         raise ValueError("Unknown monomial order: %s" % order)
 
+def monomial_lex_key(monom):
+    return monom
+
+def monomial_grlex_key(monom):
+    return (sum(monom), monom)
+
+def monomial_grevlex_key(monom):
+    return (sum(monom), tuple([ -exp for exp in reversed(monom) ]))
+
+def monomial_1_el_key(monom):
+    return (monom[0], sum(monom[2:]), tuple([ -exp for exp in reversed(monom[2:]) ]))
+
+_monomial_key = {
+    'lex'     : monomial_lex_key,
+    'grlex'   : monomial_grlex_key,
+    'grevlex' : monomial_grevlex_key,
+    '1-el'    : monomial_1_el_key,
+}
+
+def monomial_key(order):
+    """Returns a sort key function defining admissible order on monomials.
+
+       Keys of two monomials compare in the same way as the monomials
+       do with respect to monomial_cmp(order), so the result can be
+       used for efficient sorting (avoiding cmp function calls).
+
+       >>> from sympy.polys.monomial import monomial_key
+       >>> sorted([(1, 2), (2, 0), (0, 3)], key=monomial_key('grlex'))
+       [(2, 0), (1, 2), (0, 3)]
+
+    """
+    try:
+        return _monomial_key[order]
+    except KeyError:
+        raise ValueError("Unknown monomial order: %s" % order)
+
 @cacheit
 def monomial_mul(a, b):
     """Multiplication of tuples representing monomials.
@@ -213,3 +249,153 @@ def monomial_as_basic(monom, *syms):
 
     """
     return Mul(*[ b**e for b, e in zip(syms, monom) ])
+
+def monomial_bits(degree):
+    """Returns the width of a bit field able to store the given exponent.
+
+       One additional (guard) bit is reserved, which is needed for
+       divisibility tests on packed monomials (see MonomialPacker).
+
+       >>> from sympy.polys.monomial import monomial_bits
+       >>> monomial_bits(7)
+       4
+       >>> monomial_bits(8)
+       5
+
+    """
+    bits = 1
+
+    while degree:
+        degree >>= 1
+        bits += 1
+
+    return bits
+
+class MonomialPacker(object):
+    """Encodes monomials in N variables as single integers.
+
+       Each exponent is stored in its own bit field of the given width,
+       so that multiplication of monomials is an integer addition and
+       comparison of monomials with respect to the given order is an
+       integer comparison. For graded orders the total degree is kept
+       in the highest bits (which are not limited in size).
+
+       Supported orders are lex, grlex and grevlex. In the last case
+       exponents are stored complemented and in reversed order, so
+       multiplication also needs subtraction of a constant (see mul).
+
+       The highest bit of every field is reserved as a guard bit, so
+       exponents must be less than 2**(bits-1). It is the caller's
+       duty to select wide enough fields, e.g. with monomial_bits().
+
+       >>> from sympy.polys.monomial import MonomialPacker
+       >>> P = MonomialPacker(3, 8, 'grevlex')
+
+       >>> a = P.pack((1, 2, 0))
+       >>> b = P.pack((0, 1, 1))
+
+       >>> P.unpack(P.mul(a, b))
+       (1, 3, 1)
+       >>> P.unpack(P.div(P.mul(a, b), b))
+       (1, 2, 0)
+       >>> P.div(a, b) is None
+       True
+
+       >>> a > b
+       True
+
+    """
+
+    def __init__(self, N, bits=16, order='grevlex'):
+        if order not in ('lex', 'grlex', 'grevlex'):
+            raise ValueError("Unknown monomial order: %s" % order)
+
+        self.N = N
+        self.bits = bits
+        self.order = order
+
+        self.max_exp = (1 << (bits-1)) - 1
+
+        self._mask = (1 << bits) - 1
+        self._shift = N*bits
+
+        self._fields = (1 << self._shift) - 1
+        self._guards = 0
+
+        for i in xrange(N):
+            self._guards |= 1 << (i*bits + bits - 1)
+
+        self._graded = order != 'lex'
+        self._reversed = order == 'grevlex'
+
+        self.zero = self.pack((0,)*N)
+
+    def pack(self, monom):
+        """Convert a tuple of exponents to an integer. """
+        if self._reversed:
+            max_exp, fields = self.max_exp, 0
+
+            for exp in monom:
+                fields = (fields >> self.bits) | ((max_exp - exp) << (self._shift - self.bits))
+        else:
+            fields = 0
+
+            for exp in monom:
+                fields = (fields << self.bits) | exp
+
+        if self._graded:
+            return (sum(monom) << self._shift) | fields
+        else:
+            return fields
+
+    def unpack(self, packed):
+        """Convert an integer back to a tuple of exponents. """
+        bits, mask, monom = self.bits, self._mask, []
+
+        if self._reversed:
+            max_exp = self.max_exp
+
+            for i in xrange(self.N):
+                monom.append(max_exp - (packed & mask))
+                packed >>= bits
+        else:
+            for i in xrange(self.N):
+                monom.append(packed & mask)
+                packed >>= bits
+
+            monom.reverse()
+
+        return tuple(monom)
+
+    def degree(self, packed):
+        """Returns the total degree of a packed monomial. """
+        if self._graded:
+            return packed >> self._shift
+        else:
+            return sum(self.unpack(packed))
+
+    def mul(self, a, b):
+        """Multiply two packed monomials. """
+        return a + b - self.zero
+
+    def div(self, a, b):
+        """Divide two packed monomials, returns None if b does not divide a. """
+        fields = self._fields
+
+        if self._reversed:
+            test = ((b & fields) | self._guards) - (a & fields)
+        else:
+            test = ((a & fields) | self._guards) - (b & fields)
+
+        if test & self._guards == self._guards:
+            return a - b + self.zero
+        else:
+            return None
+
+    def lcm(self, a, b):
+        """Least common multiple of two packed monomials. """
+        return self.pack(monomial_lcm(self.unpack(a), self.unpack(b)))
+
+    def gcd(self, a, b):
+        """Greatest common divisor of two packed monomials. """
+        return self.pack(monomial_gcd(self.unpack(a), self.unpack(b)))
@@ -10,7 +10,11 @@
 from sympy.utilities import all, any
 
 from sympy.polys.monomial import monomial_cmp, monomial_mul, \
-    monomial_div, monomial_max, monomial_min, monomial_as_basic
+    monomial_div, monomial_max, monomial_min, monomial_as_basic, \
+    monomial_bits, MonomialPacker
+
+from sympy.polys.distributedpolys import sdp_pack, sdp_unpack, \
+    sdp_packed_mul
 
 import sympy.polys
 
@@ -408,10 +412,16 @@ def __new__(cls, poly, *symbols, **flags):
                 coeffs = [ terms[i] for i in keys ]
                 monoms = [ (i,) for i in keys ]
             else:
-                f = monomial_cmp(order)
-
                 monoms = terms.keys()
-                monoms.sort(f, reverse=True)
+
+                if order in ('lex', 'grlex', 'grevlex'):
+                    bits = monomial_bits(max([ max(M) for M in monoms ]))
+                    P = MonomialPacker(N, bits, order)
+
+                    monoms.sort(key=P.pack, reverse=True)
+                else:
+                    f = monomial_cmp(order)
+                    monoms.sort(f, reverse=True)
 
                 coeffs = [ terms[monom] for monom in monoms ]
 
@@ -941,6 +951,13 @@ def __mul__(self, other):
            If any of the polynomials is sparse then in both univariate
            and multivariate cases use naive multiplication algorithm.
 
+           When all coefficients are rational numbers, the product is
+           always computed in sparse distributed form (see module
+           distributedpolys), with monomials packed into integers and
+           using native integer arithmetic in the case of integer
+           coefficients, so the cost depends only on the number of
+           terms and not on the number of variables.
+
            For more information on implemented algorithms refer to:
 
            [1] R. T. Moenck, Practical Fast Polynomial Multiplication,
@@ -975,7 +992,28 @@ def __mul__(self, other):
         if poly.is_monomial:
             return self.mul_term(*poly.LT)
 
-        if self.is_dense and poly.is_dense:
+        if self._has_number_coeffs() and poly._has_number_coeffs():
+            deg = max([ max(M) for M in self.monoms + poly.monoms ])
+            P = MonomialPacker(len(self.symbols), monomial_bits(2*deg), 'lex')
+
+            p, q = sdp_pack(self.as_dict(), P), sdp_pack(poly.as_dict(), P)
+
+            if self._has_int_coeffs() and poly._has_int_coeffs():
+                for monom, coeff in p.iteritems():
+                    p[monom] = int(coeff)
+
+                for monom, coeff in q.iteritems():
+                    q[monom] = int(coeff)
+
+                terms = sdp_packed_mul(p, q, P)
+
+                for monom, coeff in terms.iteritems():
+                    terms[monom] = Integer(coeff)
+            else:
+                terms = sdp_packed_mul(p, q, P)
+
+            terms = sdp_unpack(terms, P)
+        elif self.is_dense and poly.is_dense:
             if self.is_multivariate:
                 a = monomial_max(*self.monoms)
                 b = monomial_max(*poly.monoms)
@@ -1044,6 +1082,14 @@ def __mul__(self, other):
 
         return self.__class__(terms, *self.symbols, **self.flags)
 
+    def _has_number_coeffs(self):
+        """Returns True if all coefficients are rational numbers. """
+        return all(coeff.is_Rational for coeff in self.coeffs)
+
+    def _has_int_coeffs(self):
+        """Returns True if all coefficients are integers. """
+        return all(coeff.is_Integer for coeff in self.coeffs)
+
     def __pow__(self, other):
         """Polynomial exponentiation using binary method.
 
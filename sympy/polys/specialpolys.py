@@ -4,7 +4,11 @@
 
 from sympy.polys.integerpolys import (
     zzX_zero, zzX_const, zzX_lift, zzx_from_dict,
-    zzX_add_term, zzX_mul, zzX_sqr, zzX_neg)
+    zzX_add_term, zzX_mul, zzX_sqr, zzX_neg,
+    zzx_add, zzx_sub, zzx_mul_term, zzx_mul_const,
+    zzx_add_term, zzx_sqr)
+
+from sympy.ntheory import prime
 
 def fateman_poly_F_1(n):
     """Fateman's GCD benchmark: trivial GCD """
@@ -113,3 +117,25 @@ def zzX_fateman_poly_F_3(n):
 
     return zzX_mul(f,h), zzX_mul(g,h), h
 
+def zzx_swinnerton_dyer_poly(n):
+    """Swinnerton-Dyer polynomial: the worst case for Zassenhaus.
+
+       Returns the minimal polynomial of sqrt(2) + ... + sqrt(p_n),
+       of degree 2**n, which is irreducible over integers, but splits
+       into linear and quadratic factors modulo every prime.
+    """
+    f = [1, 0, -2]
+
+    for i in xrange(2, n+1):
+        p = prime(i)
+
+        # f(x + t) = E(x) + t*O(x) where t**2 = p
+        E, O = [], []
+
+        for c in f:
+            E, O = zzx_add_term(zzx_add(zzx_mul_term(E, 1, 1),
+                zzx_mul_const(O, p)), c), zzx_add(zzx_mul_term(O, 1, 1), E)
+
+        f = zzx_sub(zzx_sqr(E), zzx_mul_const(zzx_sqr(O), p))
+
+    return f
@@ -0,0 +1,89 @@
+from sympy.polys.distributedpolys import (
+    sdp_from_terms, sdp_terms, sdp_monoms,
+    sdp_LM, sdp_LT, sdp_LC, sdp_degree,
+    sdp_neg, sdp_add, sdp_sub,
+    sdp_mul_term, sdp_mul, sdp_sqr, sdp_pow,
+    sdp_pack, sdp_unpack, sdp_packed_mul)
+
+from sympy.polys.monomial import MonomialPacker
+
+from sympy import Rational, raises
+
+def test_sdp_from_terms():
+    assert sdp_from_terms([]) == {}
+    assert sdp_from_terms([((1,0), 2), ((0,1), 3), ((1,0), -2)]) == {(0,1): 3}
+    assert sdp_from_terms([((1,0), 2), ((1,0), 5)]) == {(1,0): 7}
+
+def test_sdp_terms():
+    f = {(2,0,0): 1, (0,1,1): 2, (1,0,2): 3, (0,0,0): 4}
+
+    assert sdp_monoms(f, 'lex') == [(2,0,0), (1,0,2), (0,1,1), (0,0,0)]
+    assert sdp_monoms(f, 'grlex') == [(1,0,2), (2,0,0), (0,1,1), (0,0,0)]
+    assert sdp_monoms(f, 'grevlex') == [(1,0,2), (2,0,0), (0,1,1), (0,0,0)]
+
+    assert sdp_terms(f, 'lex')[0] == ((2,0,0), 1)
+
+    assert sdp_LM(f, 'lex') == (2,0,0)
+    assert sdp_LM(f, 'grlex') == (1,0,2)
+    assert sdp_LT(f, 'lex') == ((2,0,0), 1)
+    assert sdp_LC(f, 'grlex') == 3
+
+    assert sdp_LM({}) is None
+    assert sdp_LT({}) is None
+    assert sdp_LC({}) == 0
+
+    assert sdp_degree(f) == 3
+    assert sdp_degree({}) == -1
+
+def test_sdp_add_sub():
+    f = {(1,0): 1, (0,1): 2}
+    g = {(1,0): -1, (0,0): 3}
+
+    assert sdp_neg(f) == {(1,0): -1, (0,1): -2}
+
+    assert sdp_add(f, g) == {(0,1): 2, (0,0): 3}
+    assert sdp_add(f, {}) == f
+    assert sdp_sub(f, g) == {(1,0): 2, (0,1): 2, (0,0): -3}
+    assert sdp_sub(f, f) == {}
+
+def test_sdp_mul():
+    f = {(1,0): 1, (0,1): 1}
+    g = {(1,0): 1, (0,1): -1}
+
+    assert sdp_mul(f, g) == {(2,0): 1, (0,2): -1}
+    assert sdp_mul(f, {}) == {}
+
+    assert sdp_mul_term(f, (1,2), 3) == {(2,2): 3, (1,3): 3}
+    assert sdp_mul_term(f, (1,2), 0) == {}
+
+    assert sdp_sqr(f) == {(2,0): 1, (1,1): 2, (0,2): 1}
+    assert sdp_sqr(f) == sdp_mul(f, dict(f))
+    assert sdp_sqr({}) == {}
+
+    h = {(1,0,0): Rational(1,2), (0,0,1): -1, (0,3,0): 2}
+
+    assert sdp_mul(h, h) == sdp_sqr(h)
+
+def test_sdp_pow():
+    f = {(1,0): 1, (0,1): 1}
+
+    assert sdp_pow(f, 0) == {(0,0): 1}
+    assert sdp_pow(f, 1) == f
+    assert sdp_pow(f, 3) == {(3,0): 1, (2,1): 3, (1,2): 3, (0,3): 1}
+    assert sdp_pow({}, 2) == {}
+
+    raises(ValueError, "sdp_pow(f, -1)")
+    raises(ValueError, "sdp_pow({}, 0)")
+
+def test_sdp_packed_mul():
+    f = {(1,0,2): 3, (0,1,0): -1, (0,0,0): 2}
+    g = {(2,1,0): 1, (0,1,0): 1}
+
+    for order in ['lex', 'grlex', 'grevlex']:
+        P = MonomialPacker(3, 5, order)
+
+        F, G = sdp_pack(f, P), sdp_pack(g, P)
+
+        assert sdp_unpack(F, P) == f
+        assert sdp_unpack(sdp_packed_mul(F, G, P), P) == sdp_mul(f, g)
+        assert sdp_packed_mul(F, {}, P) == {}
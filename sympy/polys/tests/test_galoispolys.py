@@ -6,6 +6,8 @@
     gf_neg, gf_add_const, gf_sub_const, gf_mul_const, gf_div_const,
     gf_add, gf_sub, gf_add_mul, gf_sub_mul, gf_mul, gf_sqr,
     gf_div, gf_quo, gf_rem, gf_lshift, gf_rshift,
+    gf_pack, gf_unpack, gf_packed_mul, gf_packed_sqr,
+    gf_trunc, gf_inv_series, gf_newton_inv, gf_newton_div,
     gf_pow, gf_pow_mod,
     gf_gcd, gf_gcdex,
     gf_LC, gf_TC, gf_monic,
@@ -157,6 +159,68 @@ def test_gf_arith():
 
     assert gf_sqr([2,0,0,1,7], 11) == [4,0,0,4,6,0,1,3,5]
 
+def test_gf_packed_mul():
+    assert gf_pack([], 2) == 0
+    assert gf_pack([1,2,255], 2) == 0x0102ff
+    assert gf_unpack(0x0102ff, 2, 3, 11) == [1,2,2]
+
+    assert gf_packed_mul([], [1,2], 11) == []
+    assert gf_packed_mul([3,0,0,6,1,2], [4,0,1,0], 11) == [1,0,3,2,4,3,1,2,0]
+    assert gf_packed_sqr([2,0,0,1,7], 11) == [4,0,0,4,6,0,1,3,5]
+
+    p = 1000003
+
+    f = [ (i**3 + 7) % p for i in xrange(1, 100) ]
+    g = [ (i**5 - 3) % p for i in xrange(1, 120) ]
+
+    h = gf_mul(f, g, p)
+
+    assert gf_degree(h) == 216
+    assert gf_eval(h, 5, p) == gf_eval(f, 5, p)*gf_eval(g, 5, p) % p
+
+    assert gf_packed_mul(f, g, p) == h
+    assert gf_sqr(f, p) == gf_mul(f, f, p)
+
+    # unreduced coefficients, as accepted by the classical algorithm
+    f = [1] + [-1]*17
+    g = [1] + [100]*17
+
+    F = gf_normal(f, 7)
+    G = gf_normal(g, 7)
+
+    assert gf_mul(f, f, 7) == gf_mul(F, F, 7) == gf_sqr(f, 7) == gf_sqr(F, 7)
+    assert gf_mul(f, g, 7) == gf_mul(F, G, 7)
+    assert gf_eval(gf_mul(f, g, 7), 3, 7) == gf_eval(F, 3, 7)*gf_eval(G, 3, 7) % 7
+
+def test_gf_newton_div():
+    assert gf_trunc([1,2,3,4], 2) == [3,4]
+    assert gf_trunc([1,2,0,4], 2) == [4]
+
+    assert gf_inv_series([1,1], 4, 7) == [6,1,6,1]
+    assert gf_inv_series([3], 5, 7) == [5]
+
+    raises(ZeroDivisionError, "gf_inv_series([1,0], 3, 7)")
+
+    f, g, q, r = [5,4,3,2,1,0], [1,2,3], [5,1,0,6], [3,3]
+
+    assert gf_newton_div(f, g, 7) == (q, r)
+    assert gf_newton_div(g, f, 7) == ([], g)
+
+    p = 1000003
+
+    f = [ (i**3 + 7) % p for i in xrange(1, 200) ]
+    g = [ (i**5 - 3) % p for i in xrange(1, 90) ]
+
+    q, r = gf_div(f, g, p)
+
+    assert gf_add_mul(r, q, g, p) == f and gf_degree(r) < gf_degree(g)
+    assert gf_newton_div(f, g, p) == (q, r)
+
+    h = gf_mul(f, [1,2,3], p)
+
+    assert gf_quo(h, f, p) == [1,2,3]
+    assert gf_newton_div(h, f, p, gf_newton_inv(f, p)) == ([1,2,3], [])
+
 def test_gf_division():
     raises(ZeroDivisionError, "gf_div([1,2,3], [], 11)")
     raises(ZeroDivisionError, "gf_quo([1,2,3], [], 11)")
@@ -280,6 +344,14 @@ def test_gf_compose():
     assert gf_compose(g, h, 11) == [1,0,0,5,0,0,7]
     assert gf_compose_mod(g, h, f, 11) == [3,9,6,10]
 
+    p = 1000003
+
+    f = [1] + [ (i**3 + 7) % p for i in xrange(1, 80) ]
+    g = [ (i**5 - 3) % p for i in xrange(1, 60) ]
+    h = [ (i**2 + i) % p for i in xrange(1, 100) ]
+
+    assert gf_compose_mod(g, h, f, p) == gf_rem(gf_compose(g, h, p), f, p)
+
 def test_gf_trace_map():
     f, a, c = [1, 1, 4, 9, 1], [1,1,1], [1,0]
     b = gf_pow_mod(c, 11, f, 11)
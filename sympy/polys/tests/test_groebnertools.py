@@ -0,0 +1,58 @@
+from sympy.polys.groebnertools import sdp_groebner
+
+from sympy import Rational, Integer, Symbol, raises
+
+def test_sdp_groebner():
+    f = {(2,0): 1, (0,3): 1}
+    g = {(1,0): -1, (0,2): 1}
+
+    G = [{(1,0): 1, (0,2): -1}, {(0,4): 1, (0,3): 1}]
+
+    assert sdp_groebner([f, g], 'lex') == G
+    assert sdp_groebner([f, g], 'lex', method='f4') == G
+
+    assert sdp_groebner([], 'lex') == []
+    assert sdp_groebner([{}, {(0,0): 3}], 'grlex') == [{(0,0): 1}]
+
+    f = {(3,0): 1, (1,1): -2}
+    g = {(2,1): 1, (0,2): -2, (1,0): 1}
+
+    G = [{(2,0): 1}, {(1,1): 1}, {(0,2): 2, (1,0): -1}]
+
+    assert sdp_groebner([f, g], 'grlex') == G
+    assert sdp_groebner([f, g], 'grlex', method='f4') == G
+
+    raises(ValueError, "sdp_groebner([f, g], 'grlex', method='foo')")
+
+def test_sdp_groebner_cyclic():
+    # cyclic 4 roots problem
+    F = [{(1,0,0,0): 1, (0,1,0,0): 1, (0,0,1,0): 1, (0,0,0,1): 1},
+         {(1,1,0,0): 1, (0,1,1,0): 1, (0,0,1,1): 1, (1,0,0,1): 1},
+         {(1,1,1,0): 1, (0,1,1,1): 1, (1,0,1,1): 1, (1,1,0,1): 1},
+         {(1,1,1,1): 1, (0,0,0,0): -1}]
+
+    for order in ['lex', 'grevlex']:
+        stats = {}
+
+        G = sdp_groebner(F, order, stats=stats)
+        H = sdp_groebner(F, order, method='f4')
+
+        assert G == H
+        assert stats['product'] + stats['chain'] > 0
+
+    assert len(sdp_groebner(F, 'grevlex')) == 7
+
+def test_sdp_groebner_field():
+    f = {(1,0): Integer(2), (0,0): Integer(-1)}
+    g = {(0,1): Integer(3), (1,0): Integer(1)}
+
+    assert sdp_groebner([f, g], 'lex', field=True) == \
+        [{(1,0): 1, (0,0): -Rational(1,2)}, {(0,1): 1, (0,0): Rational(1,6)}]
+
+    a = Symbol('a')
+
+    f = {(1,0): a, (0,0): Integer(-1)}
+    g = {(0,1): Integer(1), (1,0): -a}
+
+    assert sdp_groebner([f, g], 'lex', field=True) == \
+        [{(1,0): 1, (0,0): -1/a}, {(0,1): 1, (0,0): Integer(-1)}]
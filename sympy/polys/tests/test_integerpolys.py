@@ -38,6 +38,8 @@
     zzx_sub_mul, zzX_sub_mul,
     zzx_mul, zzX_mul,
     zzx_sqr, zzX_sqr,
+    zzx_karatsuba_mul, zzx_karatsuba_sqr,
+    zzX_pack, zzX_unpack,
     zzx_pow, zzX_pow,
     zzx_expand, zzX_expand,
     zzx_div, zzX_div,
@@ -57,8 +59,8 @@
     zzx_gcd, zzX_gcd,
     zzx_cofactors, zzX_cofactors,
     zzx_heu_gcd, zzX_heu_gcd,
-    zzx_mod_gcd,
-    zzx_hensel_step, zzx_hensel_lift, zzx_zassenhaus,
+    zzx_mod_gcd, zzX_mod_gcd,
+    zzx_hensel_step, zzx_hensel_lift, zz_lll, zzx_van_hoeij, zzx_zassenhaus,
     zzx_eisenstein, zzx_factor, zzx_factor_sqf, zzx_cyclotomic_factor,
     zzX_wang_non_divisors, zzX_wang_test_points,
     zzX_wang_lead_coeffs, zzX_wang_more_coeffs,
@@ -69,7 +71,8 @@
     HeuristicGCDFailed, ExactQuotientFailed)
 
 from sympy.polys.specialpolys import (
-    zzX_fateman_poly_F_1, zzX_fateman_poly_F_2, zzX_fateman_poly_F_3)
+    zzX_fateman_poly_F_1, zzX_fateman_poly_F_2, zzX_fateman_poly_F_3,
+    zzx_swinnerton_dyer_poly)
 
 from sympy import raises, symbols, nextprime
 
@@ -662,6 +665,61 @@ def test_zzX_sqr():
     assert zzX_sqr([[[]]]) == [[[]]]
     assert zzX_sqr([[[2]]]) == [[[4]]]
 
+def test_zzx_karatsuba():
+    f = [ (-1)**i * i**3 for i in xrange(1, 120) ]
+    g = [ i**2 + 1 for i in xrange(1, 101) ]
+
+    h = zzx_karatsuba_mul(f, g)
+
+    assert zzx_degree(h) == 217
+    assert zzx_eval(h, 3) == zzx_eval(f, 3)*zzx_eval(g, 3)
+
+    assert zzx_karatsuba_mul(f, [3]) == zzx_mul_const(f, 3)
+    assert zzx_karatsuba_mul([1,0,0,1], [1,2]) == [1,2,0,1,2]
+    assert zzx_karatsuba_mul(f, []) == []
+
+    assert zzx_karatsuba_sqr(f) == zzx_karatsuba_mul(f, f)
+    assert zzx_karatsuba_sqr([1,1]) == [1,2,1]
+    assert zzx_karatsuba_sqr([]) == []
+
+    assert zzx_mul(f, g) == h
+    assert zzx_sqr(g) == zzx_karatsuba_mul(g, g)
+
+def test_zzX_pack():
+    f = [[1,2],[3]]
+
+    assert zzX_pack(f, (3,3)) == ([3,0,0,2,1,0,0,0,0], (3,1))
+    assert zzX_unpack([3,0,0,2,1,0,0,0,0], (3,3), (3,1)) == f
+    assert zzX_unpack([3,0,0,2,1], (3,3), (3,1)) == f
+
+    f = [[[1],[2,0]],[[]],[[3,4,5]]]
+    N = (3, 4, 5)
+
+    flat, S = zzX_pack(f, N)
+
+    assert S == (20, 5, 1)
+    assert len(flat) == 60
+    assert zzX_unpack(flat, N, S) == f
+
+    assert zzX_unpack([0]*60, N, S) == [[[]]]
+
+def test_zzX_packed_mul():
+    f = [[ i*j - 3 for j in xrange(1, 7) ] for i in xrange(1, 9) ]
+    g = [[ (-1)**j * (i + j + 1) for j in xrange(0, 5) ] for i in xrange(0, 6) ]
+
+    h = zzX_mul(f, g)
+
+    assert zzX_valid_p(h)
+    assert zzX_degree_all(h) == (12, 9)
+    assert zzX_eval(zzX_eval(h, 2), 5) == \
+        zzX_eval(zzX_eval(f, 2), 5) * zzX_eval(zzX_eval(g, 2), 5)
+
+    h = zzX_sqr(f)
+
+    assert zzX_valid_p(h)
+    assert zzX_degree_all(h) == (14, 10)
+    assert zzX_eval(zzX_eval(h, 2), 5) == zzX_eval(zzX_eval(f, 2), 5)**2
+
 def test_zzx_pow():
     assert zzx_pow([], 0) == [1]
     assert zzx_pow([], 1) == []
@@ -872,6 +930,43 @@ def test_zzX_heu_gcd():
     assert H == h and zzX_mul(H, cff) == f \
                   and zzX_mul(H, cfg) == g
 
+def test_zzX_mod_gcd():
+    assert zzX_mod_gcd([[]], [[]]) == ([[]], [[]], [[]])
+    assert zzX_mod_gcd([[2]], [[]]) == ([[2]], [[1]], [[]])
+    assert zzX_mod_gcd([[2]], [[4]]) == ([[2]], [[1]], [[2]])
+
+    # x = 0 is an unlucky evaluation point for gcd(x + y, x + 2*y)
+    assert zzX_mod_gcd([[1], [1, 0]], [[1], [2, 0]]) == \
+        ([[1]], [[1], [1, 0]], [[1], [2, 0]])
+
+    f,g,h = zzX_fateman_poly_F_1(2)
+    H, cff, cfg = zzX_mod_gcd(f, g)
+
+    assert H == h and zzX_mul(H, cff) == f \
+                  and zzX_mul(H, cfg) == g
+
+    f,g,h = zzX_fateman_poly_F_2(2)
+    H, cff, cfg = zzX_mod_gcd(f, g)
+
+    assert H == h and zzX_mul(H, cff) == f \
+                  and zzX_mul(H, cfg) == g
+
+    f,g,h = zzX_fateman_poly_F_3(2)
+    H, cff, cfg = zzX_mod_gcd(f, g)
+
+    assert H == h and zzX_mul(H, cff) == f \
+                  and zzX_mul(H, cfg) == g
+
+    f = zzX_mul_const(zzX_mul(f, [[[1]], [[1], [], [-3]]]), 6)
+    g = zzX_mul_const(zzX_mul(g, [[[-1]], [[2, 1]]]), 4)
+
+    H, cff, cfg = zzX_cofactors(f, g, method='modular')
+
+    assert H == zzX_mul_const(h, 2) and zzX_mul(H, cff) == f \
+                                    and zzX_mul(H, cfg) == g
+
+    raises(ValueError, "zzX_gcd(f, g, method='foo')")
+
 def test_zzx_norm():
     assert zzx_max_norm([]) == 0
     assert zzx_max_norm([1]) == 1
@@ -1161,6 +1256,29 @@ def test_zzx_hensel_lift():
     assert zzx_to_dict(ff_list[2]) == {0:  182, 1: 1}
     assert zzx_to_dict(ff_list[3]) == {0:  1,   1: 1}
 
+def test_zz_lll():
+    assert zz_lll([]) == []
+    assert zz_lll([[3, 4]]) == [[3, 4]]
+
+    assert zz_lll([[1, 1, 1], [-1, 0, 2], [3, 5, 6]]) == \
+        [[0, 1, 0], [1, 0, 1], [-1, 0, 2]]
+
+    assert zz_lll([[1, 0, 0, 0, 1234], [0, 1, 0, 0, 5678], [0, 0, 1, 0, 91011],
+        [0, 0, 0, 1, 121314]]) == [[11, 3, -11, 8, -1], [12, -8, 11, -8, -7],
+        [6, 4, 9, -7, 17], [3, -22, -4, 4, -2]]
+
+    raises(ValueError, "zz_lll([[1, 2], [2, 4]])")
+
+def test_zzx_van_hoeij():
+    f = [1, 0, -10, 0, 1]
+
+    assert zzx_van_hoeij(f, 5, [[1, 0, 2], [1, 0, 3]], 5) == [f]
+
+    f = [1, 0, 0, 0, 4]
+    F = zzx_van_hoeij(f, 5, [[1, 1], [1, 2], [1, 3], [1, 4]], 5)
+
+    assert sorted(F) == [[1, -2, 2], [1, 2, 2]]
+
 def test_zzx_eisenstein():
     assert zzx_eisenstein([3, 2, 6, 8, 7]) is None
     assert zzx_eisenstein([3, 2, 6, 8, 4]) is None
@@ -1255,6 +1373,27 @@ def test_zzx_factor():
         (1, [([1, 0, 1], 1),
              ([1, 0, -1, 0, 1, 0, -1, 0, 1], 1)])
 
+    f = zzx_swinnerton_dyer_poly(4)
+
+    F_0 = zzx_factor(f, recombine='subsets')
+    F_1 = zzx_factor(f, recombine='van_hoeij')
+
+    assert F_0 == F_1 == (1, [(f, 1)])
+
+    f = zzx_swinnerton_dyer_poly(5)
+
+    assert zzx_factor(f) == (1, [(f, 1)])
+
+    g = zzx_mul(zzx_swinnerton_dyer_poly(3), [3, 0, 0, 0, 2, 2])
+    f = zzx_mul(zzx_swinnerton_dyer_poly(4), g)
+
+    assert zzx_factor_sqf(f, recombine='van_hoeij') == \
+        (1, [[3, 0, 0, 0, 2, 2],
+             zzx_swinnerton_dyer_poly(3),
+             zzx_swinnerton_dyer_poly(4)])
+
+    raises(ValueError, "zzx_factor(f, recombine='foo')")
+
 def test_zzx_cyclotomic_factor():
     assert zzx_cyclotomic_factor([]) is None
     assert zzx_cyclotomic_factor([1]) is None
@@ -2,7 +2,8 @@
         powsimp, raises, Integer, Symbol, Poly, RootsOf, RootSum, RootOf, S
 
 from sympy.polys.monomial import monomial_lex_cmp, monomial_grlex_cmp, \
-        monomial_grevlex_cmp, monomial_1_el_cmp
+        monomial_grevlex_cmp, monomial_1_el_cmp, monomial_cmp, \
+        monomial_key, monomial_bits, MonomialPacker
 
 from sympy.polys.algorithms import poly_groebner, poly_subresultants,    \
         poly_resultant, poly_half_gcdex, poly_gcdex, poly_gcd, poly_lcm, \
@@ -19,6 +20,7 @@
         CoefficientError, SymbolsError
 
 from sympy.utilities.pytest import skip
+from sympy.utilities import all
 
 a,b,c,d,x,y,z,u,v,t = symbols('abcdxyzuvt')
 
@@ -28,6 +30,53 @@ def test_monomial_cmp():
     assert monomial_grevlex_cmp((1,3,1), (1,2,2)) == 1
     assert monomial_1_el_cmp((2,0,1), (1,2,0)) == 1
 
+def test_monomial_key():
+    monoms = [(3,2,1), (1,2,4), (2,4,1), (1,6,0), (1,3,1), (1,2,2), (2,0,1), (1,2,0)]
+
+    for order in ['lex', 'grlex', 'grevlex', '1-el']:
+        key, cmp_fn = monomial_key(order), monomial_cmp(order)
+
+        for a in monoms:
+            for b in monoms:
+                assert cmp(key(a), key(b)) == cmp_fn(a, b)
+
+    raises(ValueError, "monomial_key('foo')")
+
+def test_monomial_packer():
+    assert monomial_bits(0) == 1
+    assert monomial_bits(1) == 2
+    assert monomial_bits(255) == 9
+
+    monoms = [ (a, b, c) for a in range(4) for b in range(4) for c in range(4) ]
+
+    for order in ['lex', 'grlex', 'grevlex']:
+        P = MonomialPacker(3, 4, order)
+        cmp_fn = monomial_cmp(order)
+
+        assert P.unpack(P.zero) == (0, 0, 0)
+
+        for a in monoms:
+            A = P.pack(a)
+
+            assert P.unpack(A) == a
+            assert P.degree(A) == sum(a)
+
+            for b in monoms:
+                B = P.pack(b)
+
+                assert cmp(A, B) == cmp_fn(a, b)
+                assert P.unpack(P.mul(A, B)) == tuple([ x + y for x, y in zip(a, b) ])
+
+                if all(x >= y for x, y in zip(a, b)):
+                    assert P.unpack(P.div(A, B)) == tuple([ x - y for x, y in zip(a, b) ])
+                else:
+                    assert P.div(A, B) is None
+
+        assert P.unpack(P.lcm(P.pack((3,0,1)), P.pack((1,2,0)))) == (3,2,1)
+        assert P.unpack(P.gcd(P.pack((3,0,1)), P.pack((1,2,0)))) == (1,0,0)
+
+    raises(ValueError, "MonomialPacker(3, 4, '1-el')")
+
 def test_poly_has():
     f = x*y**2*z + I*x*y + x + 1
     assert Poly(f, x).has(x) == True
@@ -440,6 +489,14 @@ def test_poly_mul():
 
     assert p.symbols == (x, y, z)
 
+    X = [ Symbol('x%d' % i) for i in xrange(12) ]
+
+    f = sum(X) + 1
+    g = X[0]*X[11] - 3*X[5]**7 + Rational(1,3)
+
+    assert Poly(f, *X)*Poly(g, *X) == Poly((f*g).expand(), *X)
+    assert Poly(f, *X)*Poly(f, *X) == Poly((f**2).expand(), *X)
+
 def test_poly_pow():
     assert Poly(x**3-12*x**2-42, x)**2 == \
         Poly(x**6 - 24*x**5 + 144*x**4 - 84*x**3 + 1008*x**2 + 1764, x)
@@ -580,6 +637,16 @@ def test_poly_gcd():
     assert poly_gcd(sin(z)*(x+y), x**2+2*x*y+y**2,
         x, y) == Poly(x+y, x, y)
 
+    f = expand((x + y + z + 1)**4*(x*y - z + 3)**2)
+    g = expand((x + y + z + 1)**3*(x - y*z + 2)**3)
+
+    h = Poly(expand((x + y + z + 1)**3), x, y, z)
+
+    assert poly_gcd(f, g, x, y, z) == h
+    assert poly_gcd(f, g, x, y, z, method='modular') == h
+
+    assert poly_gcd(x+y, x+2*y, x, y, method='modular') == Poly(1, x, y)
+
     f = x**8+x**6-3*x**4-3*x**3+8*x**2+2*x-5
     g = 3*x**6+5*x**4-4*x**2-9*x+21
 
@@ -667,6 +734,25 @@ def test_poly_groebner():
          Poly(x*y, x, y, order='grlex'),
          Poly(y**2-x/2, x, y, order='grlex')]
 
+    F = [x**2 + y**3, y**2 - x, x*y*z - 1]
+
+    for order in ['lex', 'grlex', 'grevlex']:
+        G = poly_groebner(F, x, y, z, order=order)
+        assert poly_groebner(F, x, y, z, order=order, method='f4') == G
+
+    stats = {}
+
+    G = poly_groebner((x**3-2*x*y, x**2*y-2*y**2+x), x, y,
+        order='grlex', stats=stats)
+
+    assert stats['reduced'] > 0 and stats['pairs'] >= stats['reduced']
+
+    assert poly_groebner((a*x - 1, x*y - a), x, y, order='lex') == \
+        [Poly(x - 1/a, x, y, order='lex'),
+         Poly(y - a**2, x, y, order='lex')]
+
+    raises(ValueError, "poly_groebner((x, y), x, y, method='foo')")
+
 def test_map_coeffs():
     p = Poly(x**2 + 2*x*y, x, y)
     q = p.map_coeffs(lambda c: 2*c)
@@ -78,7 +78,8 @@ class Order(Basic):
 
     is_Order = True
 
-    __slots__ = []
+    __slots__ = ['_fprint']
+    _stores_fprint = True
 
     @cacheit
     def __new__(cls, expr, *symbols, **assumptions):
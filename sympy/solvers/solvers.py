@@ -25,7 +25,8 @@
 
 from sympy.functions import sqrt, log, exp, LambertW
 from sympy.simplify import simplify, collect
-from sympy.matrices import Matrix, zeros
+from sympy.matrices import Matrix, SMatrix, zeros
+from sympy.matrices import sparse
 from sympy.polys import roots
 
 from sympy.utilities import any, all
@@ -368,7 +369,13 @@ def solve_linear_system(system, *symbols, **flags):
        >>> solve_linear_system(system, x, y)
        {x: -6, y: 2}
 
+       If the system is given as a SMatrix, sparse elimination is used,
+       which keeps large sparse systems sparse (see _solve_sparse_system).
+
     """
+    if isinstance(system, SMatrix):
+        return _solve_sparse_system(system, list(symbols), flags)
+
     matrix = system[:,:]
     syms = list(symbols)
 
@@ -472,6 +479,65 @@ def solve_linear_system(system, *symbols, **flags):
     else:
         return None   # no solutions
 
+def _solve_sparse_system(system, syms, flags):
+    """Solves a sparse augmented system, for solve_linear_system().
+
+       A square system is solved by sparse LU factorization, with pivots
+       chosen to minimize fill-in (Markowitz' strategy). If it is singular,
+       or not square, the system is reduced to sparse row-echelon form, from
+       which solutions are read off, as in the dense case.
+    """
+    n, m = system.lines, system.cols - 1
+    rows = system.row_list()
+
+    simplified = flags.get('simplified', True)
+
+    def finish(content):
+        if simplified:
+            return simplify(content)
+        else:
+            return content
+
+    if n == m:
+        A, b = [], []
+
+        for row in rows:
+            b.append(row.pop(m, S.Zero))
+            A.append(row)
+
+        try:
+            lu = sparse.SparseLU(A, simplify=simplify)
+        except ValueError:
+            pass
+        else:
+            solutions = {}
+
+            for j, value in enumerate(lu.solve(b)):
+                solutions[syms[j]] = finish(value)
+
+            return solutions
+
+        rows = system.row_list()
+
+    rows, pivots = sparse.rref(rows, m + 1, simplify=simplify)
+
+    if pivots and pivots[-1] == m:
+        return None   # no solutions
+
+    solutions = {}
+
+    for row, j in zip(rows, pivots):
+        content = row.get(m, S.Zero)
+
+        # run back-substitution for parameters
+        for k, value in row.iteritems():
+            if k != j and k != m:
+                content -= value*syms[k]
+
+        solutions[syms[j]] = finish(content)
+
+    return solutions
+
 def solve_undetermined_coeffs(equ, coeffs, sym, **flags):
     """Solve equation of a type p(x; a_1, ..., a_k) == q(x) where both
        p, q are univariate polynomials and f depends on k parameters.
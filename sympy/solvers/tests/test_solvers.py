@@ -1,4 +1,4 @@
-from sympy import Matrix, Symbol, solve, exp, log, cos, acos, Rational, Eq, \
+from sympy import Matrix, SMatrix, Symbol, solve, exp, log, cos, acos, Rational, Eq, \
         sqrt, oo, LambertW, pi, I, sin, asin, Function, diff, Derivative, \
         symbols, S, raises, sympify, var, simplify
 from sympy.solvers import solve_linear_system, solve_linear_system_LU,dsolve,\
@@ -152,6 +152,37 @@ def test_linear_system():
     assert solve_linear_system(M, x, y, z, t) == \
            {y: 0, z: -((t+t*n)/n), x: -((t+t*n)/n)}
 
+def test_linear_system_sparse():
+    x, y, z, t, n = symbols('xyztn')
+
+    M = SMatrix([[0,0,n*(n+1),(n+1)**2,0],
+                 [n+1,n+1,-2*n-1,-(n+1),0],
+                 [-1, 0, 1, 0, 0]])
+
+    assert solve_linear_system(M, x, y, z, t) == \
+           {y: 0, z: -((t+t*n)/n), x: -((t+t*n)/n)}
+
+    M = SMatrix([[1, 4, 2], [-2, 1, 14]])
+    assert solve_linear_system(M, x, y) == {x: -6, y: 2}
+
+    M = SMatrix([[1, 1, 2], [1, 1, 3]])
+    assert solve_linear_system(M, x, y) is None
+
+    # singular, but consistent
+    M = SMatrix([[1, 1, 2], [2, 2, 4]])
+    assert solve_linear_system(M, x, y) == {x: 2 - y}
+
+    # bidiagonal system, x_i - x_(i+1) = 1, x_(n-1) = 1
+    syms = [ Symbol('x%i' % i) for i in xrange(60) ]
+    M = SMatrix(60, 61, {})
+    for i in xrange(60):
+        M[i, i] = 1
+        M[i, 60] = 1
+        if i < 59:
+            M[i, i+1] = -1
+    solutions = solve_linear_system(M, *syms)
+    assert [ solutions[s] for s in syms ] == range(60, 0, -1)
+
 def test_linear_systemLU():
     x, y, z, n = symbols('xyzn')
 
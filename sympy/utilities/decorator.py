@@ -29,19 +29,43 @@ def function(expr, *args, **kwargs):
           @threaded(use_add=False)
           def function(expr, *args, **kwargs):
 
+       Elements can be processed in parallel, by a pool of processes (see
+       sympy.utilities.parallel), if 'parallel' flag is set to True, or to
+       the number of processes to use, e.g:
+
+          @threaded(parallel=True)
+          def function(expr, *args, **kwargs):
+
     """
     from sympy.matrices import Matrix
 
     use_add = flags.get('use_add', True)
+    parallel = flags.get('parallel', False)
+
+    if parallel:
+        from sympy.utilities.parallel import parallel_map
+
+        if parallel is True:
+            processes = None
+        else:
+            processes = parallel
+
+        def apply(func, seq):
+            return parallel_map(func, seq, processes)
+    else:
+        apply = map
 
     def threaded_proxy(func):
         def threaded_decorator(expr, *args, **kwargs):
+            def function(f):
+                return func(f, *args, **kwargs)
+
             if isinstance(expr, Matrix):
-                return expr.applyfunc(lambda f: func(f, *args, **kwargs))
+                return expr.applyfunc(function, parallel)
             elif isinstance(expr, bool):
                     return expr
             elif hasattr(expr, '__iter__'):
-                return expr.__class__([ func(f, *args, **kwargs) for f in expr ])
+                return expr.__class__(apply(function, expr))
             else:
                 expr = sympify(expr)
 
@@ -51,7 +75,7 @@ def threaded_decorator(expr, *args, **kwargs):
                     return Relational(lhs, rhs, expr.rel_op)
                 elif expr.is_Add and use_add:
                     from sympy.core.add import Add
-                    return Add(*[ func(f, *args, **kwargs) for f in expr.args ])
+                    return Add(*apply(function, expr.args))
                 else:
                     return func(expr, *args, **kwargs)
 
@@ -105,17 +105,24 @@ def flatten(iterable, cls=None):
             result.append(el)
     return result
 
-def postorder_traversal(node):
+def postorder_traversal(node, unique=False):
     """ Do a postorder traversal of a tree.
 
-    This generator recursively yields nodes that it has visited in a postorder
-    fashion. That is, it descends through the tree depth-first to yield all of
-    a node's children's postorder traversal before yielding the node itself.
+    This generator yields nodes that it has visited in a postorder fashion.
+    That is, it descends through the tree depth-first to yield all of a node's
+    children's postorder traversal before yielding the node itself.
+
+    An explicit stack is used instead of recursion, so trees of any depth
+    can be traversed.
 
     Parameters
     ----------
     node : sympy expression
         The expression to traverse.
+    unique : bool
+        If True, subtrees shared between several places in the tree (the
+        same object) are traversed only once, so that traversal of a DAG is
+        linear in the number of its unique nodes.
 
     Yields
     ------
@@ -130,22 +137,44 @@ def postorder_traversal(node):
     >>> set(postorder_traversal((x+y)*z)) == set([z, y, x, x + y, z*(x + y)])
     True
     """
-    for arg in node.args:
-        for subtree in postorder_traversal(arg):
-            yield subtree
-    yield node
+    seen = set()
+    stack = [(node, False)]
+
+    while stack:
+        node, expanded = stack.pop()
+
+        if expanded:
+            yield node
+            continue
+
+        if unique:
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+
+        stack.append((node, True))
+
+        for arg in reversed(node.args):
+            stack.append((arg, False))
 
-def preorder_traversal(node):
+def preorder_traversal(node, unique=False):
     """ Do a preorder traversal of a tree.
 
-    This generator recursively yields nodes that it has visited in a preorder
-    fashion. That is, it yields the current node then descends through the tree
-    breadth-first to yield all of a node's children's preorder traversal.
+    This generator yields nodes that it has visited in a preorder fashion.
+    That is, it yields the current node then descends through the tree
+    depth-first to yield all of a node's children's preorder traversal.
+
+    An explicit stack is used instead of recursion, so trees of any depth
+    can be traversed.
 
     Parameters
     ----------
     node : sympy expression
         The expression to traverse.
+    unique : bool
+        If True, subtrees shared between several places in the tree (the
+        same object) are traversed only once, so that traversal of a DAG is
+        linear in the number of its unique nodes.
 
     Yields
     ------
@@ -160,10 +189,20 @@ def preorder_traversal(node):
     >>> set(preorder_traversal((x+y)*z)) == set([z, x + y, z*(x + y), x, y])
     True
     """
-    yield node
-    for arg in node.args:
-        for subtree in preorder_traversal(arg):
-            yield subtree
+    seen = set()
+    stack = [node]
+
+    while stack:
+        node = stack.pop()
+
+        if unique:
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+
+        yield node
+
+        stack.extend(reversed(node.args))
 
 def subsets(M, k):
     """Generates all k-subsets of n-element set.
@@ -96,7 +96,7 @@ def _import(module, reload="False"):
     for sympyname, translation in translations.iteritems():
         namespace[sympyname] = namespace[translation]
 
-def lambdify(args, expr, modules=None):
+def lambdify(args, expr, modules=None, cse=False):
     """
     Returns a lambda function for fast calculation of numerical values.
 
@@ -152,6 +152,14 @@ def lambdify(args, expr, modules=None):
 
         Now f would look like:
         >> lambda x: my_cool_function(x)
+
+    If cse=True, common subexpressions are eliminated first and a function
+    which computes each of them only once is returned (see funcstr). This
+    is useful for evaluating large expressions over whole arrays, so by
+    default numpy functions have priority over python-math functions in
+    this mode:
+        >> f = lambdify((x,y), [sin(x*y)**2, cos(x*y)**2], cse=True)
+        >> f(numpy.linspace(0, 1, 10**6), 2.0)
     """
     # If the user hasn't specified any modules, use what is available.
     if modules is None:
@@ -160,7 +168,11 @@ def lambdify(args, expr, modules=None):
         #      might be the reason for irreproducible errors.
         try:
             _import("numpy")
-            modules = ("math", "numpy", "mpmath", "sympy")
+            if cse:
+                # math functions don't work with arrays
+                modules = ("numpy", "math", "mpmath", "sympy")
+            else:
+                modules = ("math", "numpy", "mpmath", "sympy")
         except ImportError:
             modules = ("math", "mpmath", "sympy")
 
@@ -176,6 +188,12 @@ def lambdify(args, expr, modules=None):
     else:
         namespace = _get_namespace(modules)
 
+    if cse:
+        # Create a function evaluating common subexpressions once.
+        fstr, scope = funcstr(args, expr), {}
+        exec fstr in namespace, scope
+        return scope["f"]
+
     # Create lambda function.
     lstr = lambdastr(args, expr)
     return eval(lstr, namespace)
@@ -211,11 +229,84 @@ def lambdastr(args, expr):
 
     # Transform everything to strings.
     expr = lambdarepr(expr)
+    args = _argstr(args)
+
+    return "lambda %s: (%s)" % (args, expr)
+
+def funcstr(args, expr, name="f"):
+    """
+    Returns a string that can be executed to define a function computing
+    expr, with common subexpressions assigned to temporaries first.
+
+    >>> from sympy import symbols, sin, cos
+    >>> x,y = symbols('xy')
+    >>> print funcstr((x,y), [sin(x*y)**2, cos(x*y)**2])
+    def f(x,y):
+        x0 = x*y
+        return ([sin(x0)**2, cos(x0)**2])
+    """
+
+    #XXX: This has to be done here because of circular imports
+    from sympy.printing.lambdarepr import lambdarepr
+    from sympy.simplify.cse_main import cse
+    from sympy import Basic, Symbol
+
+    args = _argstr(args)
+
+    if isinstance(expr, str):
+        expr = sympify(expr)
+
+    if isinstance(expr, (list, tuple)):
+        exprs = list(expr)
+    else:
+        exprs = [expr]
+
+    for i, e in enumerate(exprs):
+        if isinstance(e, (int, long, float)):
+            exprs[i] = sympify(e)
+
+    # Names of temporaries must not clash with symbols and arguments.
+    names = set([ a.strip() for a in args.split(",") ])
+
+    for e in exprs:
+        if not isinstance(e, Basic):
+            # e.g. matrices, leave them as they are
+            return "def %s(%s):\n    return (%s)" % (name, args, lambdarepr(expr))
+
+        names |= set([ str(s) for s in e.atoms(Symbol) ])
+
+    def temporaries():
+        i = 0
+        while True:
+            if "x%d" % i not in names:
+                yield Symbol("x%d" % i)
+            i += 1
+
+    replacements, reduced = cse(exprs, temporaries())
+
+    if isinstance(expr, list):
+        expr = reduced
+    elif isinstance(expr, tuple):
+        expr = tuple(reduced)
+    else:
+        expr = reduced[0]
+
+    lines = ["def %s(%s):" % (name, args)]
+
+    for sym, subexpr in replacements:
+        lines.append("    %s = %s" % (sym, lambdarepr(subexpr)))
+
+    lines.append("    return (%s)" % lambdarepr(expr))
+
+    return "\n".join(lines)
+
+def _argstr(args):
+    """
+    Converts arguments of lambdify to a comma separated string.
+    """
     if isinstance(args, str):
-        pass
+        return args
     elif hasattr(args, "__iter__"):
-        args = ",".join(str(a) for a in args)
+        return ",".join(str(a) for a in args)
     else:
-        args = str(args)
-
-    return "lambda %s: (%s)" % (args, expr)
+        return str(args)
@@ -0,0 +1,128 @@
+"""Parallel map over SymPy expressions, using a pool of processes.
+
+Applying simplify(), expand(), diff() etc. to thousands of independent
+expressions can use all available cores:
+
+>>> from sympy import Symbol, expand
+>>> from sympy.utilities.parallel import parallel_map
+>>> x = Symbol('x')
+>>> parallel_map(expand, [(x + 1)**2, (x - 1)**2], processes=2)
+[1 + 2*x + x**2, 1 - 2*x + x**2]
+
+Workers are forked from the calling process, so they start with its caches
+already warm, and the mapped function doesn't need to be picklable (it can
+be a lambda or a closure). Expressions are split into chunks, which are
+sent to workers, and results are sent back, in the serialization format of
+sympy.utilities.serialize, which stores subexpressions shared within a
+chunk only once.
+
+This requires the multiprocessing module (Python 2.6 or newer) and fork()
+(i.e. not Windows). Where they aren't available, and whenever parallel
+execution wouldn't pay off (one process or one element), parallel_map()
+is just map(). Calls from within a worker are never parallelized again.
+"""
+
+import os
+import pickle
+from cStringIO import StringIO
+
+from sympy.core.basic import Basic
+from sympy.utilities.serialize import DAGWriter, DAGReader, SerializationError
+
+try:
+    import multiprocessing
+except ImportError:
+    multiprocessing = None
+
+_func = None            # function to map, set in workers
+_in_worker = False
+
+def cpu_count():
+    """Returns the number of processors, or 1 if it can't be determined. """
+    if multiprocessing is None:
+        return 1
+
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+def _encode(items):
+    """Serializes a list of items, which don't have to be SymPy objects. """
+    for item in items:
+        if not isinstance(item, Basic):
+            break
+    else:
+        stream = StringIO()
+        stream.write('D')
+
+        try:
+            writer = DAGWriter(stream)
+
+            for item in items:
+                writer.write(item)
+
+            return stream.getvalue()
+        except SerializationError:
+            pass
+
+    return 'P' + pickle.dumps(items, pickle.HIGHEST_PROTOCOL)
+
+def _decode(data):
+    """Inverse of _encode(). """
+    if data[:1] == 'D':
+        stream = StringIO(data)
+        stream.read(1)
+        return list(DAGReader(stream))
+    else:
+        return pickle.loads(data[1:])
+
+def _init_worker(func):
+    global _func, _in_worker
+    _func = func
+    _in_worker = True
+
+def _map_chunk(data):
+    return _encode([ _func(item) for item in _decode(data) ])
+
+def parallel_map(func, seq, processes=None, chunksize=None):
+    """Returns [func(item) for item in seq], computed by several processes.
+
+       processes is the number of worker processes, by default the number
+       of processors. seq is split into chunks of chunksize items, by
+       default so that there are four chunks per process, to balance load.
+    """
+    seq = list(seq)
+
+    if processes is None:
+        processes = cpu_count()
+
+    processes = min(processes, len(seq))
+
+    if processes <= 1 or _in_worker or multiprocessing is None or \
+            not hasattr(os, 'fork'):
+        return map(func, seq)
+
+    if chunksize is None:
+        chunksize = max(1, len(seq) // (4*processes))
+
+    chunks = [ _encode(seq[i:i+chunksize]) for i in xrange(0, len(seq), chunksize) ]
+
+    pool = multiprocessing.Pool(processes, _init_worker, (func,))
+
+    try:
+        try:
+            results = pool.map(_map_chunk, chunks, 1)
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+    finally:
+        pool.join()
+
+    result = []
+
+    for data in results:
+        result.extend(_decode(data))
+
+    return result
@@ -0,0 +1,471 @@
+"""Compact binary serialization of SymPy expressions.
+
+Pickle and srepr() expand expressions into trees, so an expression in which
+subexpressions are shared (a DAG) can take exponentially more space when
+serialized than it takes in memory. This module stores every distinct node
+only once, in a table, and refers to nodes by their integer index:
+
+>>> from sympy import Symbol, sin
+>>> from sympy.utilities.serialize import dumps, loads
+>>> x = Symbol('x')
+>>> e = sin(x)**2 + sin(x) + x
+>>> loads(dumps(e)) == e
+True
+
+Symbols and numbers are interned, i.e. equal symbols (and numbers) are
+stored once, even if they are different objects. Several expressions can be
+written to one stream (see DAGWriter and DAGReader), in which case nodes
+shared between them are stored only once, too.
+
+Format
+======
+
+A stream starts with MAGIC, followed by records. Every record starts with a
+one character tag. Integers are encoded as variable length quantities
+(7 bits per byte, little-endian, high bit set on all bytes but the last),
+signed integers are zigzag encoded first, strings are prefixed by their
+length. Most records define a new node, which gets the next free index:
+
+    'K' module name         defines a new class (which gets the next free
+                            class index, classes are numbered separately)
+    'F' name                defines a new class, Function(name)
+    'I' p                   Integer(p)
+    'Q' p q                 Rational(p, q)
+    'S' name n (key value)* Symbol(name, **assumptions), value is 0 or 1
+    'C' class               singleton, e.g. S.Pi
+    'N' class n arg*        class(*args), where args are node indices
+    'T' n item*             tuple of nodes, e.g. limits of an Integral
+    'P' data                anything else, stored as a pickle
+    'R' node                (doesn't define a node) marks node as the next
+                            expression of the stream
+
+Loading a stream imports modules it refers to and may unpickle data, so as
+with pickle, only load data from trusted sources.
+"""
+
+import mmap
+import pickle
+import sys
+
+from sympy.core.basic import Basic, SingletonMeta
+from sympy.core.numbers import Integer, Rational
+from sympy.core.symbol import Symbol
+from sympy.core.function import Function, FunctionClass
+
+MAGIC = 'SYMPYDAG\x01'
+
+class SerializationError(ValueError):
+    pass
+
+def _zigzag(n):
+    if n >= 0:
+        return 2*n
+    else:
+        return -2*n - 1
+
+def _unzigzag(z):
+    if z & 1:
+        return -(z >> 1) - 1
+    else:
+        return z >> 1
+
+class DAGWriter(object):
+    """Writes expressions to a binary stream.
+
+       The node table is shared by all expressions written by one writer:
+
+       >>> from StringIO import StringIO
+       >>> from sympy import Symbol
+       >>> from sympy.utilities.serialize import DAGWriter, DAGReader
+       >>> x = Symbol('x')
+       >>> stream = StringIO()
+       >>> writer = DAGWriter(stream)
+       >>> writer.write(x + 1)
+       >>> writer.write((x + 1)**2)
+       >>> stream.seek(0)
+       >>> list(DAGReader(stream))
+       [1 + x, (1 + x)**2]
+
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.nodes = {}         # id(node) -> index
+        self.count = 0          # number of nodes written
+        self.alive = []         # keeps nodes alive, so their ids stay valid
+        self.atoms = {}         # (tag, value) -> index, for interning
+        self.classes = {}       # class -> class index
+
+        file.write(MAGIC)
+
+    def _uint(self, n):
+        b = []
+
+        while n > 0x7f:
+            b.append(chr(0x80 | (n & 0x7f)))
+            n >>= 7
+
+        b.append(chr(n))
+        self.file.write(''.join(b))
+
+    def _int(self, n):
+        self._uint(_zigzag(n))
+
+    def _str(self, s):
+        if isinstance(s, unicode):
+            s = s.encode('utf-8')
+
+        self._uint(len(s))
+        self.file.write(s)
+
+    def _class(self, cls):
+        try:
+            return self.classes[cls]
+        except KeyError:
+            index = self.classes[cls] = len(self.classes)
+
+            module = sys.modules.get(cls.__module__)
+
+            if getattr(module, cls.__name__, None) is cls:
+                self.file.write('K')
+                self._str(cls.__module__)
+                self._str(cls.__name__)
+            elif isinstance(cls, FunctionClass) and Function(cls.__name__) is cls:
+                # undefined function, e.g. f = Function('f')
+                self.file.write('F')
+                self._str(cls.__name__)
+            else:
+                raise SerializationError("can't serialize instances of %s" % cls)
+
+            return index
+
+    def _atom_key(self, expr):
+        """Returns a key for interning of expr, or None. """
+        cls = type(expr)
+
+        if isinstance(cls, SingletonMeta):
+            return ('C', cls)
+        elif cls is Integer:
+            return ('I', expr.p)
+        elif cls is Rational:
+            return ('Q', expr.p, expr.q)
+        elif cls is Symbol:
+            assumptions = expr.assumptions0
+            # commutativity is kept outside of assumptions
+            assumptions['commutative'] = expr.is_commutative
+            assumptions = assumptions.items()
+            assumptions.sort()
+            return ('S', expr.name, tuple(assumptions))
+        else:
+            return None
+
+    def _newargs(self, expr):
+        """Returns args to rebuild expr as type(expr)(*args), or None.
+
+           These are the arguments used by pickle. Atoms (which may keep
+           state outside of their arguments) and nodes with arguments that
+           aren't expressions, or tuples of expressions, return None.
+        """
+        if expr.is_Atom:
+            return None
+
+        newargs = expr.__getnewargs__()
+        items = list(newargs)
+
+        while items:
+            item = items.pop()
+
+            if isinstance(item, tuple):
+                items.extend(item)
+            elif not isinstance(item, Basic):
+                return None
+
+        return newargs
+
+    def _tuple(self, items):
+        """Writes a record defining tuple items (items are written already). """
+        args = tuple([ self.nodes[id(item)] for item in items ])
+        key = ('T',) + args
+
+        if key in self.atoms:
+            self.nodes[id(items)] = self.atoms[key]
+        else:
+            write = self.file.write
+
+            write('T')
+            self._uint(len(args))
+
+            for arg in args:
+                self._uint(arg)
+
+            self.nodes[id(items)] = self.atoms[key] = self.count
+            self.count += 1
+
+        self.alive.append(items)
+
+    def _node(self, expr, key, newargs=None):
+        """Writes a record defining node expr (args are written already). """
+        write = self.file.write
+
+        if key is not None:
+            tag = key[0]
+
+            if tag == 'C':
+                index = self._class(key[1])
+                write('C')
+                self._uint(index)
+            elif tag == 'I':
+                write('I')
+                self._int(key[1])
+            elif tag == 'Q':
+                write('Q')
+                self._int(key[1])
+                self._int(key[2])
+            else:
+                write('S')
+                self._str(key[1])
+                self._uint(len(key[2]))
+
+                for name, value in key[2]:
+                    self._str(name)
+                    self._uint(int(bool(value)))
+
+            self.atoms[key] = self.count
+
+        elif newargs is not None:
+            index = self._class(type(expr))
+            args = [ self.nodes[id(arg)] for arg in newargs ]
+
+            write('N')
+            self._uint(index)
+            self._uint(len(args))
+
+            for arg in args:
+                self._uint(arg)
+
+        else:
+            write('P')
+            self._str(pickle.dumps(expr, pickle.HIGHEST_PROTOCOL))
+
+        self.nodes[id(expr)] = self.count
+        self.count += 1
+        self.alive.append(expr)
+
+    def write(self, expr):
+        """Writes expr, together with all its nodes not written before. """
+        nodes = self.nodes
+        atoms = self.atoms
+
+        # items are (node, args), where args is None if the node wasn't
+        # visited yet, otherwise its tuple items or arguments to rebuild it
+        stack = [(expr, None)]
+
+        # postorder, so that arguments are always defined before use
+        while stack:
+            node, args = stack.pop()
+
+            if id(node) in nodes:
+                continue
+
+            if isinstance(node, tuple):
+                if args is not None:
+                    self._tuple(node)
+                    continue
+                else:
+                    args = node
+            else:
+                key = self._atom_key(node)
+
+                if key is not None:
+                    if key in atoms:
+                        nodes[id(node)] = atoms[key]
+                        self.alive.append(node)
+                    else:
+                        self._node(node, key)
+
+                    continue
+                elif args is not None:
+                    self._node(node, None, args)
+                    continue
+
+                args = self._newargs(node)
+
+                if args is None:
+                    self._node(node, None)
+                    continue
+
+            stack.append((node, args))
+
+            for arg in reversed(args):
+                if id(arg) not in nodes:
+                    stack.append((arg, None))
+
+        self.file.write('R')
+        self._uint(nodes[id(expr)])
+
+class DAGReader(object):
+    """Reads expressions written by DAGWriter from a binary stream.
+
+       The stream can be any object with read() method, e.g. a file, a
+       StringIO or an mmap object. Expressions are read one by one, either
+       by calling read(), or by iterating over the reader.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.nodes = []
+        self.classes = []
+
+        if file.read(len(MAGIC)) != MAGIC:
+            raise SerializationError("not a serialized SymPy expression")
+
+    def _read(self, n):
+        s = self.file.read(n)
+
+        if len(s) != n:
+            raise SerializationError("unexpected end of data")
+
+        return s
+
+    def _uint(self):
+        read = self.file.read
+        n, shift = 0, 0
+
+        while True:
+            b = read(1)
+
+            if not b:
+                raise SerializationError("unexpected end of data")
+
+            b = ord(b)
+            n |= (b & 0x7f) << shift
+
+            if b < 0x80:
+                return n
+
+            shift += 7
+
+    def _int(self):
+        return _unzigzag(self._uint())
+
+    def _str(self):
+        return self._read(self._uint())
+
+    def _class(self):
+        try:
+            return self.classes[self._uint()]
+        except IndexError:
+            raise SerializationError("reference to undefined class")
+
+    def _node(self):
+        try:
+            return self.nodes[self._uint()]
+        except IndexError:
+            raise SerializationError("reference to undefined node")
+
+    def read(self):
+        """Returns the next expression, or raises EOFError at the end. """
+        nodes = self.nodes
+
+        while True:
+            tag = self.file.read(1)
+
+            if not tag:
+                raise EOFError
+
+            if tag == 'R':
+                return self._node()
+            elif tag == 'N':
+                cls = self._class()
+                args = [ self._node() for i in xrange(self._uint()) ]
+                nodes.append(cls(*args))
+            elif tag == 'T':
+                nodes.append(tuple([ self._node() for i in xrange(self._uint()) ]))
+            elif tag == 'I':
+                nodes.append(Integer(self._int()))
+            elif tag == 'S':
+                name = self._str()
+                assumptions = {}
+
+                for i in xrange(self._uint()):
+                    key = self._str()
+                    assumptions[key] = bool(self._uint())
+
+                nodes.append(Symbol(name, **assumptions))
+            elif tag == 'Q':
+                p = self._int()
+                nodes.append(Rational(p, self._int()))
+            elif tag == 'C':
+                nodes.append(self._class()())
+            elif tag == 'K':
+                module = self._str()
+                name = self._str()
+                cls = getattr(__import__(module, {}, {}, [name]), name, None)
+
+                if not (isinstance(cls, type) and issubclass(cls, Basic)):
+                    raise SerializationError("%s.%s is not a SymPy class" % (module, name))
+
+                self.classes.append(cls)
+            elif tag == 'F':
+                self.classes.append(Function(self._str()))
+            elif tag == 'P':
+                nodes.append(pickle.loads(self._str()))
+            else:
+                raise SerializationError("invalid record: %r" % tag)
+
+    def __iter__(self):
+        while True:
+            try:
+                yield self.read()
+            except EOFError:
+                return
+
+def dumps(expr):
+    """Returns serialized expr as a string. """
+    from cStringIO import StringIO
+    stream = StringIO()
+    DAGWriter(stream).write(expr)
+    return stream.getvalue()
+
+def loads(data):
+    """Returns the expression serialized in string data. """
+    from cStringIO import StringIO
+    return DAGReader(StringIO(data)).read()
+
+def dump(expr, file):
+    """Writes serialized expr to an open (binary) file. """
+    DAGWriter(file).write(expr)
+
+def load(file):
+    """Reads an expression from an open (binary) file. """
+    return DAGReader(file).read()
+
+def save(filename, *exprs):
+    """Writes expressions to a file, sharing nodes between them. """
+    f = open(filename, 'wb')
+
+    try:
+        writer = DAGWriter(f)
+
+        for expr in exprs:
+            writer.write(expr)
+    finally:
+        f.close()
+
+def restore(filename):
+    """Returns the list of all expressions saved in a file.
+
+       The file is memory-mapped, so it is read directly by the reader,
+       without being copied into memory first.
+    """
+    f = open(filename, 'rb')
+
+    try:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            return list(DAGReader(data))
+        finally:
+            data.close()
+    finally:
+        f.close()
@@ -1,7 +1,7 @@
 
 from sympy.utilities.decorator import threaded
 
-from sympy import symbols, Eq, Matrix
+from sympy import symbols, Eq, Matrix, SMatrix
 
 def test_threaded():
     x, y = symbols('xy')
@@ -32,3 +32,21 @@ def function(expr, n):
         return expr**n
 
     assert function(x + y, 2) == (x + y)**2
+
+def test_threaded_parallel():
+    x, y = symbols('xy')
+
+    @threaded(parallel=2)
+    def function(expr, n):
+        return expr**n
+
+    assert function([x, y, x + y], 2) == [x**2, y**2, (x + y)**2]
+    assert function(x + y, 2) == x**2 + y**2
+    assert function(Matrix([[x, y], [1, x]]), 2) == Matrix([[x**2, y**2], [1, x**2]])
+    assert function(SMatrix([[x, 0], [0, y]]), 2) == SMatrix([[x**2, 0], [0, y**2]])
+
+    @threaded(parallel=2)
+    def function(expr, n):
+        return expr + n
+
+    assert function(SMatrix([[x, 0], [0, y]]), 1) == SMatrix([[x + 1, 1], [1, y + 1]])
@@ -1,4 +1,4 @@
-from sympy import symbols
+from sympy import symbols, Basic, Pow
 from sympy.utilities.iterables import postorder_traversal, \
     preorder_traversal, flatten, subsets, variations
 
@@ -21,6 +21,35 @@ def test_preorder_traversal():
     assert list(preorder_traversal(expr)) in [expected1, expected2, expected3]
 
 
+def test_traversal_unique():
+    expr = z+w*(x+y)
+    assert list(preorder_traversal(expr, unique=True)) == \
+        list(preorder_traversal(expr))
+    assert list(postorder_traversal(expr, unique=True)) == \
+        list(postorder_traversal(expr))
+
+    # 2**100 paths, but only 101 unique nodes
+    e = x
+    for i in xrange(100):
+        e = Basic.__new__(Pow, e, e)
+
+    nodes = list(preorder_traversal(e, unique=True))
+    assert len(nodes) == 101
+    assert nodes[0] is e and nodes[-1] is x
+
+    nodes = list(postorder_traversal(e, unique=True))
+    assert len(nodes) == 101
+    assert nodes[0] is x and nodes[-1] is e
+
+def test_traversal_deep():
+    e = x
+    for i in xrange(3000):
+        e = e**y
+
+    assert len(list(preorder_traversal(e))) == 6001
+    assert list(postorder_traversal(e))[-1] is e
+
+
 def test_flatten():
     assert flatten( (1,(1,)) ) == [1,1]
     assert flatten( (x,(x,)) ) == [x,x]
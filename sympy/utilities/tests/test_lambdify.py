@@ -222,3 +222,31 @@ def test_integral():
     f = Lambda(x, exp(-x**2))
     l = lambdify(x, Integral(f(x), (x, -oo, oo)), modules="sympy")
     assert l(x) == Integral(exp(-x**2), (x, -oo, oo))
+
+#================== Test common subexpressions ============
+def test_funcstr():
+    from sympy.utilities.lambdify import funcstr
+    assert funcstr((x,y), [sin(x*y)**2, cos(x*y)**2]) == \
+        "def f(x,y):\n    x0 = x*y\n    return ([sin(x0)**2, cos(x0)**2])"
+    assert funcstr('x,y,z', 'z,y,x') == \
+        "def f(x,y,z):\n    return ((z, y, x))"
+    # temporaries can't clash with symbols
+    x0 = sympy.Symbol('x0')
+    assert funcstr((x,x0), sin(x+x0) + exp(x+x0), "g") == \
+        "def g(x,x0):\n    x1 = x + x0\n    return (sin(x1) + exp(x1))"
+
+def test_cse():
+    e = sqrt(x**2 + y**2)*sin(x**2 + y**2) + cos(x**2 + y**2)/x
+    f = lambdify((x,y), e, cse=True)
+    g = lambdify((x,y), e)
+    assert abs(f(1.5, 2.0) - g(1.5, 2.0)) < 1e-15
+    f = lambdify((x,y), [x*y, (x*y)**2, 1], "math", cse=True)
+    assert f(2, 3) == [6, 36, 1]
+    f = lambdify('x,y,z', 'z,y,x', cse=True)
+    assert f(3,2,1) == (1,2,3)
+    f = lambdify(x, x/2, cse=True)
+    assert f(1) == 0.5
+    A = Matrix([[x, x*y], [sin(z)+4, x**z]])
+    sol = Matrix([[1, 2], [sin(3)+4, 1]])
+    f = lambdify((x,y,z), (A, [A]), modules="sympy", cse=True)
+    assert f(1,2,3) == (sol,[sol])
@@ -0,0 +1,38 @@
+from sympy import symbols, Function, Matrix, expand, diff, sin
+from sympy.utilities.parallel import parallel_map
+from sympy.utilities.pytest import raises
+
+x, y = symbols('xy')
+
+def test_parallel_map():
+    exprs = [ (x + i)**3 for i in xrange(20) ]
+
+    assert parallel_map(expand, exprs, processes=2) == map(expand, exprs)
+    assert parallel_map(expand, exprs, processes=3, chunksize=1) == map(expand, exprs)
+    assert parallel_map(expand, exprs, processes=1) == map(expand, exprs)
+
+    assert parallel_map(expand, [], processes=2) == []
+    assert parallel_map(expand, iter(exprs), processes=2) == map(expand, exprs)
+
+def test_parallel_map_closures():
+    f = Function('f')
+    n = 3
+
+    assert parallel_map(lambda e: f(e)*n, [x, y], processes=2) == [3*f(x), 3*f(y)]
+    assert parallel_map(lambda e: e.is_Add, [x, x + 1], processes=2) == [False, True]
+    assert parallel_map(lambda k: k**2, [1, 2, 3], processes=2) == [1, 4, 9]
+
+def test_parallel_map_nested():
+    def g(e):
+        return parallel_map(lambda t: diff(t, x), [e, e**2], processes=2)
+
+    assert parallel_map(g, [sin(x), x], processes=2) == \
+        [[diff(sin(x), x), diff(sin(x)**2, x)], [1, 2*x]]
+
+def test_parallel_map_errors():
+    raises(ZeroDivisionError, "parallel_map(lambda k: 1/k, [1, 0, 2], processes=2)")
+
+def test_applyfunc_parallel():
+    m = Matrix(3, 3, lambda i, j: (x + i - j)**2)
+    assert m.applyfunc(expand, parallel=2) == m.applyfunc(expand)
+    assert m.applyfunc(expand, parallel=True) == m.applyfunc(expand)
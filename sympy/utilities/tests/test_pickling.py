@@ -44,7 +44,8 @@ def check(a):
 
         def c(a,b,d):
             for i in d:
-                if not hasattr(a,i):
+                if not hasattr(a,i) or i == '__weakref__':
+                    # weak references are not part of the object's state
                     continue
                 attr = getattr(a,i)
                 if not hasattr(attr, "__call__"):
@@ -0,0 +1,122 @@
+import os
+import tempfile
+from StringIO import StringIO
+
+from sympy import Symbol, symbols, Rational, Real, Integer, Function, Wild, \
+        Eq, O, S, I, oo, pi, sin, exp, Integral, Sum
+from sympy.utilities.serialize import dumps, loads, dump, load, save, \
+        restore, DAGWriter, DAGReader, SerializationError, MAGIC
+from sympy.utilities.pytest import raises
+
+x, y = symbols('xy')
+
+def check(expr):
+    e = loads(dumps(expr))
+    assert e == expr
+    assert type(e) is type(expr)
+
+def test_atoms():
+    for e in [x, S.Zero, S.Half, S.NaN, oo, -oo, pi, I, Integer(-7),
+            Integer(3)**100, Rational(-2, 3), Real('1.5')]:
+        check(e)
+
+def test_symbols():
+    A = Symbol('A', commutative=False)
+    p = Symbol('p', positive=True)
+
+    check(A)
+    check(p)
+    check(A*x*A)
+
+    assert loads(dumps(p)).is_positive == True
+    assert loads(dumps(A)).is_commutative == False
+
+def test_expressions():
+    f = Function('f')
+
+    for e in [x + 1, sin(x)**2 + Rational(1, 3)*x - 7*y + pi, exp(I*pi*x),
+            O(x**2), f(x) + f(x, y), Wild('a') + x, Eq(x, y), x < y,
+            Integral(x**2, (x, 0, 1)), Integral(sin(x)*y, x, (y, 1, x + 1)),
+            Sum(1/x**2, (x, 1, oo)), Sum(y**x, (x, 0, y))]:
+        check(e)
+
+def test_dag():
+    e = x
+    for i in xrange(40):
+        e = (e + 1)**(e + 2)
+
+    # as a tree, e has more than 2**40 nodes
+    data = dumps(e)
+    assert len(data) < 2000
+    assert loads(data) == e
+
+def test_tuples():
+    stream = StringIO()
+    writer = DAGWriter(stream)
+
+    writer.write(Integral(sin(x + 1), (x, 0, 1)))
+    size = len(stream.getvalue())
+
+    # limits are stored as tuples of nodes, sin(x + 1) is shared
+    e = Integral(sin(x + 1), (x, 0, sin(x + 1)))
+    writer.write(e)
+    assert len(stream.getvalue()) - size < 16
+
+    stream.seek(0)
+    assert list(DAGReader(stream))[1] == e
+
+def test_interning():
+    a = Symbol('a', positive=True)
+    b = Symbol.__xnew__(Symbol, 'a', positive=True)
+    assert a is not b
+
+    stream = StringIO()
+    writer = DAGWriter(stream)
+
+    writer.write(a)
+    size = len(stream.getvalue())
+
+    # equal symbol is stored only once
+    writer.write(b)
+    assert len(stream.getvalue()) - size == 2
+
+def test_stream():
+    stream = StringIO()
+    writer = DAGWriter(stream)
+
+    writer.write(sin(x + 1)**2)
+    size = len(stream.getvalue())
+
+    # only a reference is written
+    writer.write(sin(x + 1))
+    assert len(stream.getvalue()) - size == 2
+
+    stream.seek(0)
+    reader = DAGReader(stream)
+
+    assert reader.read() == sin(x + 1)**2
+    assert reader.read() == sin(x + 1)
+    raises(EOFError, "reader.read()")
+
+    stream = StringIO()
+    dump(x*y, stream)
+    stream.seek(0)
+    assert load(stream) == x*y
+
+def test_file():
+    fd, filename = tempfile.mkstemp()
+    os.close(fd)
+
+    try:
+        save(filename, x, sin(x + 1), sin(x + 1)**2)
+        assert restore(filename) == [x, sin(x + 1), sin(x + 1)**2]
+    finally:
+        os.remove(filename)
+
+def test_errors():
+    raises(SerializationError, "loads('')")
+    raises(SerializationError, "loads('garbage')")
+    raises(SerializationError, "loads(MAGIC + 'X')")
+    raises(SerializationError, "loads(MAGIC + 'R\\x05')")
+    raises(SerializationError, "loads(MAGIC + 'K\\x02os\\x04path')")
+    raises(SerializationError, "loads(dumps(x + 1)[:-3])")